@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+File Name: backfillSkills.py
+Description: One-off command that stores the precomputed 'skills_extracted'
+ text on job and seeker documents written before it was computed at write time.
+Author: MathTeixeira
+Date: October 17, 2026
+Version: 3.0.0
+License: MIT License
+Contact Information: mathteixeira55
+
+Usage:
+  python backfillSkills.py            # only documents missing the field
+  python backfillSkills.py --force    # recompute every document
+"""
+
+### Imports ###
+import argparse
+import logging
+
+from pymongo import UpdateOne
+
+from core.config import noSql
+from core.database import getNoSqlConn
+# schemas has to be imported before models, as main.py does
+import schemas  # noqa: F401
+from services import getAIService
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger("uvicorn")
+
+BATCH_SIZE = 500
+
+
+def backfillCollection(collectionName: str, force: bool = False) -> int:
+  """
+  Compute and store 'skills_extracted' for the documents of a collection.
+
+  Args:
+    collectionName (str): The name of the collection to backfill.
+    force (bool): Recompute documents that already have the field.
+
+  Returns:
+    int: The number of documents updated.
+  """
+  collection = getNoSqlConn().database[collectionName]
+  aiService = getAIService()
+  query = {} if force else {"skills_extracted": {"$exists": False}}
+  projection = {"primarySkills": 1, "secondarySkills": 1}
+
+  updated = 0
+  operations = []
+  for document in collection.find(query, projection):
+    skillsExtracted = aiService.build_skills_extracted(document)
+    if skillsExtracted is None:
+      continue
+    operations.append(UpdateOne({"_id": document["_id"]},
+                                {"$set": {"skills_extracted": skillsExtracted}}))
+    if len(operations) == BATCH_SIZE:
+      updated += collection.bulk_write(operations, ordered=False).modified_count
+      operations = []
+  if operations:
+    updated += collection.bulk_write(operations, ordered=False).modified_count
+
+  logger.info(f"Backfilled skills_extracted on {updated} documents of '{collectionName}'")
+  return updated
+
+
+### Main ###
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(description=__doc__.split("Usage:")[0])
+  parser.add_argument("--force",
+                      action="store_true",
+                      help="recompute documents that already have skills_extracted")
+  args = parser.parse_args()
+
+  for collectionName in (noSql.JOBS_COLLECTION, noSql.SEEKERS_COLLECTION):
+    backfillCollection(collectionName, args.force)
+  getNoSqlConn().shutdownDbClient()
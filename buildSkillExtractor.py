@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+File Name: buildSkillExtractor.py
+Description: Build step that writes the spaCy pipeline, the skillNer databases
+ and the compiled phrase matchers to a local artifact directory, so workers
+ restore the skill extractor offline instead of rebuilding it.
+Author: MathTeixeira
+Date: October 17, 2026
+Version: 3.0.0
+License: MIT License
+Contact Information: mathteixeira55
+
+Usage:
+  python buildSkillExtractor.py                 # writes AI_SKILL_EXTRACTOR_ARTIFACT
+  python buildSkillExtractor.py --path <dir>    # writes another directory
+"""
+
+### Imports ###
+import argparse
+import logging
+
+from core.config import ai
+# schemas has to be imported before models, as main.py does
+import schemas  # noqa: F401
+from services import AIService
+
+logging.basicConfig(level=logging.INFO)
+
+
+### Main ###
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(description=__doc__.split("Usage:")[0])
+  parser.add_argument("--path",
+                      default=ai.SKILL_EXTRACTOR_ARTIFACT,
+                      help="artifact directory, AI_SKILL_EXTRACTOR_ARTIFACT by default")
+  args = parser.parse_args()
+
+  AIService.save_skill_extractor(args.path)
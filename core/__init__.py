@@ -15,5 +15,6 @@ This package includes configuration modules and database interfaces. It provides
 
 from .config import noSql
 from .database.noSqlDatabase import NoSqlConnection
+from .database.asyncNoSqlDatabase import AsyncNoSqlConnection
 
-__all__ = ['noSql', 'NoSqlConnection']
+__all__ = ['noSql', 'NoSqlConnection', 'AsyncNoSqlConnection']
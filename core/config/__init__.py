@@ -8,10 +8,11 @@ Version: 3.0.0
 License: MIT License
 Contact Information: mathteixeira55
 
-This file imports and exports configuration instances for AWS and NoSQL components.
+This file imports and exports configuration instances for the NoSQL and AI components.
 These instances are created using the singleton pattern implemented in their respective modules.
 """
 
 from .noSqlConfig import noSql
+from .aiConfig import ai
 
-__all__ = ['noSql']
+__all__ = ['noSql', 'ai']
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+File Name: aiConfig.py
+Description: This module handles the configuration of the AI ranking service.
+Author: MathTeixeira
+Date: October 17, 2026
+Version: 3.0.0
+License: MIT License
+Contact Information: mathteixeira55
+"""
+
+### Imports ###
+from dotenv import load_dotenv
+import os
+
+
+class AiConfig:
+  """
+  Config class to load environment variables and provide configuration values for the AI service.
+
+  This class implements a singleton pattern with lazy loading to ensure
+  only one instance is created and only when it's first needed. Every value
+  is optional and falls back to a default.
+
+  Attributes:
+    INDEX_COMPACTION_THRESHOLD (float): Ratio of tombstoned rows that triggers a
+      background compaction of a ranking index.
+    INDEX_MIN_FIT_SIZE (int): Number of live documents below which every write
+      refits the vocabulary of a ranking index.
+    RECORD_CACHE_SIZE (int): Number of job and of seeker documents kept in memory
+      to answer ranking requests without a second query.
+    RECORD_CACHE_TTL (float): Lifetime of a cached job or seeker document in
+      seconds, which bounds how long writes made by other workers go unseen.
+    RANKING_CACHE_SIZE (int): Number of seekers, and of jobs, whose ranked feeds
+      are kept, with every cached page of a feed held in one entry.
+    RANKING_CACHE_TTL (float): Lifetime of a cached ranked feed in seconds.
+    SKILL_NAME_CACHE_SIZE (int): Number of normalised skill names memoised.
+    RANKING_ONLY (bool): Never load the spaCy pipeline; skill extraction from
+      free text is refused.
+    SPACY_MODEL (str): The spaCy model loaded by the skill extractor on first use.
+    SKILL_EXTRACTOR_ARTIFACT (str): Directory written by buildSkillExtractor.py;
+      when present the skill extractor is restored from it instead of rebuilt.
+    EXECUTOR (str): "thread" or "process". "process" only moves rankings over
+      a provided document list to worker processes; rankings over the
+      resident indexes always run on threads, so they share the GIL.
+    EXECUTOR_WORKERS (int | None): Workers of the ranking pool, CPU count if unset.
+    EXECUTOR_QUEUE (int): Pending rankings accepted before requests are refused.
+  """
+
+  instance: 'AiConfig | None' = None
+
+  def __init__(self) -> None:
+    """
+    Initialize the AiConfig instance.
+
+    Loads environment variables and sets the AI service tuning values.
+    """
+    load_dotenv()
+    self.INDEX_COMPACTION_THRESHOLD: float = float(
+        self.getEnv("AI_INDEX_COMPACTION_THRESHOLD", "0.25"))
+    self.INDEX_MIN_FIT_SIZE: int = int(
+        self.getEnv("AI_INDEX_MIN_FIT_SIZE", "50"))
+    self.RECORD_CACHE_SIZE: int = int(
+        self.getEnv("AI_RECORD_CACHE_SIZE", "5000"))
+    self.RECORD_CACHE_TTL: float = float(
+        self.getEnv("AI_RECORD_CACHE_TTL", "60"))
+    self.RANKING_CACHE_SIZE: int = int(
+        self.getEnv("AI_RANKING_CACHE_SIZE", "10000"))
+    self.RANKING_CACHE_TTL: float = float(
+        self.getEnv("AI_RANKING_CACHE_TTL", "300"))
+    self.SKILL_NAME_CACHE_SIZE: int = int(
+        self.getEnv("AI_SKILL_NAME_CACHE_SIZE", "8192"))
+    self.RANKING_ONLY: bool = self.getEnv("AI_RANKING_ONLY",
+                                          "false").lower() in ("1", "true", "yes")
+    self.SPACY_MODEL: str = self.getEnv("AI_SPACY_MODEL", "en_core_web_lg")
+    self.SKILL_EXTRACTOR_ARTIFACT: str = self.getEnv(
+        "AI_SKILL_EXTRACTOR_ARTIFACT", "artifacts/skillExtractor")
+    self.EXECUTOR: str = self.getEnv("AI_EXECUTOR", "thread")
+    workers = self.getEnv("AI_EXECUTOR_WORKERS", "")
+    self.EXECUTOR_WORKERS: int | None = int(workers) if workers else None
+    self.EXECUTOR_QUEUE: int = int(self.getEnv("AI_EXECUTOR_QUEUE", "64"))
+
+  @classmethod
+  def getInstance(cls) -> 'AiConfig':
+    """
+    Get the singleton instance of AiConfig.
+
+    Returns:
+      AiConfig: The singleton instance of AiConfig.
+
+    This method ensures that only one instance of AiConfig is created.
+    """
+    if cls.instance is None:
+      cls.instance = cls()
+    return cls.instance
+
+  def getEnv(self, key: str, default: str) -> str:
+    """
+    Get an environment variable or its default value if it's not set.
+
+    Args:
+      key (str): The name of the environment variable.
+      default (str): The value to use when the variable is not set.
+
+    Returns:
+      str: The value of the environment variable.
+    """
+    return os.getenv(key, default)
+
+
+# Global instance of AiConfig
+# This will create the instance when the module is imported
+ai = AiConfig.getInstance()
@@ -10,9 +10,11 @@ License: MIT License
 Contact Information: mathteixeira55
 
 This file imports and exports database instances for NoSQL databases.
-The NoSQL database class is exported for on-demand instantiation.
+The NoSQL database class is exported for on-demand instantiation. The services
+use the asyncio variant, the blocking one serves command line scripts.
 """
 
 from .noSqlDatabase import NoSqlConnection, getNoSqlConn
+from .asyncNoSqlDatabase import AsyncNoSqlConnection, getAsyncNoSqlConn
 
-__all__ = ['NoSqlConnection', 'getNoSqlConn']
+__all__ = ['NoSqlConnection', 'getNoSqlConn', 'AsyncNoSqlConnection', 'getAsyncNoSqlConn']
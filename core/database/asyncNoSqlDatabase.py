@@ -0,0 +1,706 @@
+# -*- coding: utf-8 -*-
+"""
+File Name: asyncNoSqlDatabase.py
+Description: This module provides an asyncio class for interacting with a NoSQL
+ database, with the same method surface as NoSqlConnection.
+Author: MathTeixeira
+Date: October 17, 2026
+Version: 3.0.1
+License: MIT License
+Contact Information: mathteixeira55
+"""
+
+### Imports ###
+import asyncio
+import base64
+import binascii
+from datetime import datetime
+from typing import AsyncIterator, Mapping
+from bson import ObjectId
+from bson.codec_options import CodecOptions, TypeDecoder, TypeRegistry
+from bson.errors import InvalidId
+from bson.raw_bson import RawBSONDocument
+from pymongo import AsyncMongoClient, ReturnDocument, UpdateOne, WriteConcern
+from pymongo.asynchronous.client_session import AsyncClientSession
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.asynchronous.database import AsyncDatabase
+from pymongo.errors import BulkWriteError, DuplicateKeyError, ConnectionFailure, OperationFailure
+from core.config import noSql
+from enums import WriteModeEnum
+
+from .noSqlDatabase import NoSqlConnection
+
+import logging
+
+logger = logging.getLogger("uvicorn")
+
+
+class ObjectIdStringDecoder(TypeDecoder):
+  """
+  Decodes every ObjectId to its hex string while the driver parses BSON, so
+  ids, userIds and status arrays come out in the shape of the API without a
+  second pass over the documents.
+  """
+  bson_type = ObjectId
+
+  def transform_bson(self, value: ObjectId) -> str:
+    return str(value)
+
+
+# Codec options of every read made through AsyncNoSqlConnection
+API_CODEC_OPTIONS = CodecOptions(type_registry=TypeRegistry([ObjectIdStringDecoder()]))
+# Codec options of the raw reads, whose fields are only decoded when accessed
+RAW_CODEC_OPTIONS = API_CODEC_OPTIONS.with_options(document_class=RawBSONDocument)
+
+
+class AsyncNoSqlConnection:
+  """
+  A class to handle connections and operations with a NoSQL database from
+  asyncio code.
+
+  Every operation is a coroutine, so a round trip to the database releases
+  the event loop instead of holding it. The database decodes ObjectIds to
+  strings, so a read document only needs its _id renamed to id, while
+  written documents are converted like NoSqlConnection does.
+
+  Attributes:
+    dbUrl (str): The URL for the NoSql connection.
+    dbName (str): The name of the database to connect to.
+    NoSqlClient (AsyncMongoClient): The NoSql client instance.
+    database (AsyncDatabase): The NoSql database instance.
+  """
+
+  _instance: 'AsyncNoSqlConnection | None' = None
+
+  # Fields read by the ranking index, everything else stays on the server
+  RANKING_PROJECTION: dict = {
+      "_id": 1,
+      "userId": 1,
+      "primarySkills": 1,
+      "secondarySkills": 1,
+      "skills_extracted": 1
+  }
+
+  # Documents fetched per round trip when streaming a collection
+  STREAM_BATCH_SIZE: int = 500
+
+  # Server error code of a transaction on a deployment without replica set
+  ILLEGAL_OPERATION: int = 20
+
+  # Whether the deployment runs transactions, None until the first attempt
+  transactions: bool | None = None
+
+  # The conversions of written documents are shared with NoSqlConnection
+  convertObjectIdsToStrings = NoSqlConnection.convertObjectIdsToStrings
+  convertStringsToObjectIds = NoSqlConnection.convertStringsToObjectIds
+
+  def __init__(self, dbUrl: str = noSql.URL, dbName: str = noSql.NAME):
+    """
+    Initialize the AsyncNoSqlConnection instance. The client connects on first use.
+
+    Args:
+      dbUrl (str): The URL for the NoSql connection. Defaults to the URL from noSqlConfig.
+      dbName (str): The name of the database to connect to. Defaults to the NAME from noSqlConfig.
+    """
+    self.dbUrl: str = dbUrl
+    self.dbName: str = dbName
+
+    try:
+      self.NoSqlClient: AsyncMongoClient = AsyncMongoClient(dbUrl)
+      self.database: AsyncDatabase = self.NoSqlClient.get_database(
+          dbName, codec_options=API_CODEC_OPTIONS)
+      logger.info("Async client of the NoSql database created!")
+    except ConnectionFailure as e:
+      logger.error(f"Connection error: {e}")
+
+  @staticmethod
+  def renameId(document: dict | None) -> dict | None:
+    """
+    Expose the _id of a read document as id. The other ids are already strings.
+
+    Args:
+      document (dict | None): A document read through the database.
+
+    Returns:
+      dict | None: The same document, or None if there was none.
+    """
+    if document is not None and "_id" in document:
+      document["id"] = document.pop("_id")
+    return document
+
+  @classmethod
+  def getInstance(cls) -> 'AsyncNoSqlConnection':
+    """
+    Get the singleton instance of AsyncNoSqlConnection.
+
+    Returns:
+      AsyncNoSqlConnection: The singleton instance of AsyncNoSqlConnection.
+    """
+    if cls._instance is None:
+      cls._instance = cls()
+    return cls._instance
+
+  def writeCollection(self, collectionName: str, mode: WriteModeEnum,
+                      writeConcern: WriteConcern | None = None) -> AsyncCollection:
+    """
+    Get a collection that writes with the write concern of a write mode.
+
+    Args:
+      collectionName (str): The name of the collection.
+      mode (WriteModeEnum): The write mode. UNACKNOWLEDGED writes with w=0 by default.
+      writeConcern (WriteConcern | None): A write concern replacing the default of the mode.
+
+    Returns:
+      AsyncCollection: The collection to write to.
+    """
+    if writeConcern is None and mode == WriteModeEnum.UNACKNOWLEDGED:
+      writeConcern = WriteConcern(w=0)
+    collection = self.database[collectionName]
+    if writeConcern is None:
+      return collection
+    return collection.with_options(write_concern=writeConcern)
+
+  def readCollection(self, collectionName: str, raw: bool = False) -> AsyncCollection:
+    """
+    Get a collection that reads decoded documents, or RawBSONDocuments when raw.
+
+    A RawBSONDocument keeps the bytes sent by the server and decodes its top
+    level fields on first access, while embedded documents stay raw until they
+    are accessed themselves. It is read-only and keeps its _id key.
+
+    Args:
+      collectionName (str): The name of the collection.
+      raw (bool): Read RawBSONDocuments.
+
+    Returns:
+      AsyncCollection: The collection to read from.
+    """
+    collection = self.database[collectionName]
+    if not raw:
+      return collection
+    return collection.with_options(codec_options=RAW_CODEC_OPTIONS)
+
+  async def shutdownDbClient(self) -> None:
+    """
+    Close the NoSql client connection.
+    """
+    await self.NoSqlClient.close()
+    logger.info("NoSql connection closed.")
+
+  # Create
+  async def insertDocument(self, collectionName: str, document: dict,
+                           mode: WriteModeEnum = WriteModeEnum.DOCUMENT,
+                           writeConcern: WriteConcern | None = None) -> dict | None:
+    """
+    Insert a document into a specified collection.
+
+    Args:
+      collection_name (str): The name of the collection to insert the document into.
+      document (dict): The document to be inserted.
+      mode (WriteModeEnum): DOCUMENT reads the stored document back, ACKNOWLEDGED
+        returns the document as sent with its generated ID and UNACKNOWLEDGED
+        does not wait for the server.
+      writeConcern (WriteConcern | None): A write concern replacing the default of the mode.
+
+    Returns:
+      dict | None: The inserted document with its ID, or None when unacknowledged.
+    """
+    try:
+      document = self.convertStringsToObjectIds(document)
+      collection = self.writeCollection(collectionName, mode, writeConcern)
+      newDocument = await collection.insert_one(document)
+      if mode == WriteModeEnum.UNACKNOWLEDGED:
+        return None
+      if mode == WriteModeEnum.ACKNOWLEDGED:
+        # insert_one set the generated _id on the document it was given
+        return self.convertObjectIdsToStrings(document)
+      insertedDocument = await self.database[collectionName].find_one(
+          {"_id": newDocument.inserted_id})
+      insertedDocument = self.renameId(insertedDocument)
+      return insertedDocument
+    except DuplicateKeyError as e:
+      # Handle documents with duplicate identifiers
+      logger.error(f"A document with this identifier already exists. {e}")
+      raise ValueError(f"A document with this identifier already exists. {e}")
+    except Exception as e:
+      logger.error(f"Error inserting document: {e}")
+      raise  Exception(f"Error inserting document: {e}")
+
+  async def insertManyDocuments(self, collectionName: str,
+                                documents: list[dict]) -> tuple[list[dict | None], dict[int, dict]]:
+    """
+    Insert several documents with a single unordered insert_many.
+
+    A failing document does not stop the others. The inserted documents are
+    returned as sent, with their generated id, instead of being read back.
+
+    Args:
+      collectionName (str): The name of the collection to insert the documents into.
+      documents (list[dict]): The documents to be inserted.
+
+    Returns:
+      tuple[list[dict | None], dict[int, dict]]: The inserted documents in the
+        order of the input, None for the failed ones, and the write error of
+        each failed document keyed by its index.
+    """
+    if not documents:
+      return [], {}
+    documents = [self.convertStringsToObjectIds(document) for document in documents]
+    errors = {}
+    try:
+      await self.database[collectionName].insert_many(documents, ordered=False)
+    except BulkWriteError as e:
+      errors = {error["index"]: error for error in e.details.get("writeErrors", [])}
+    inserted = [None if index in errors else self.convertObjectIdsToStrings(document)
+                for index, document in enumerate(documents)]
+    return inserted, errors
+
+  # Retrieve
+  async def findAllDocuments(self, collectionName: str, raw: bool = False) -> list:
+    """
+    Find all documents in a specified collection.
+
+    Args:
+      collectionName (str): The name of the collection to search in.
+      raw (bool): Return RawBSONDocuments, keyed by _id, that decode a field only when accessed.
+
+    Returns:
+      list: A list of all documents in the collection.
+    """
+    try:
+      documents = await self.readCollection(collectionName, raw).find().to_list()
+      if raw:
+        return documents
+      documents = [self.renameId(document) for document in documents]
+      return documents
+    except Exception as e:
+      logger.error(f"Error finding documents: {e}")
+      return None
+
+  async def streamDocuments(self, collectionName: str, query: dict | None = None,
+                            batchSize: int = STREAM_BATCH_SIZE) -> AsyncIterator[dict]:
+    """
+    Iterate the documents of a collection, one cursor batch in memory at a time.
+
+    Args:
+      collectionName (str): The name of the collection to search in.
+      query (dict): The query to search by. Defaults to the whole collection.
+      batchSize (int): The number of documents fetched per round trip.
+
+    Yields:
+      dict: Each document, converted like findAllDocuments does.
+    """
+    query = self.convertStringsToObjectIds(query or {})
+    cursor = self.database[collectionName].find(query, batch_size=batchSize)
+    try:
+      async for document in cursor:
+        yield self.renameId(document)
+    finally:
+      # Release the server cursor when the client goes away mid-stream
+      await cursor.close()
+
+  async def findPageDocuments(self, collectionName: str, limit: int,
+                              after: str | None = None) -> tuple[list[dict], str | None]:
+    """
+    Find one page of a collection in _id order.
+
+    The page starts right after the cursor with a range query on the _id
+    index, so every page costs the same whatever its depth, unlike skip.
+
+    Args:
+      collectionName (str): The name of the collection to search in.
+      limit (int): The maximum number of documents of the page.
+      after (str | None): The cursor returned with the previous page, None for the first page.
+
+    Returns:
+      tuple[list[dict], str | None]: The documents of the page and the cursor of
+        the next page, None when this page is the last one.
+
+    Raises:
+      ValueError: If the cursor is not one returned by this method.
+    """
+    query = {} if after is None else {"_id": {"$gt": self.decodeCursor(after)}}
+    # One extra document tells whether a next page exists
+    documents = await self.database[collectionName].find(query).sort(
+        "_id", 1).limit(limit + 1).to_list()
+    nextCursor = None
+    if len(documents) > limit:
+      documents = documents[:limit]
+      nextCursor = self.encodeCursor(ObjectId(documents[-1]["_id"]))
+    return [self.renameId(document) for document in documents], nextCursor
+
+  @staticmethod
+  def encodeCursor(lastId: ObjectId) -> str:
+    """
+    Encode the _id of the last document of a page as an opaque cursor.
+
+    Args:
+      lastId (ObjectId): The _id of the last document of the page.
+
+    Returns:
+      str: The URL-safe cursor of the next page.
+    """
+    return base64.urlsafe_b64encode(lastId.binary).decode().rstrip("=")
+
+  @staticmethod
+  def decodeCursor(cursor: str) -> ObjectId:
+    """
+    Decode a cursor returned by encodeCursor.
+
+    Args:
+      cursor (str): The cursor of the page.
+
+    Returns:
+      ObjectId: The _id the page starts after.
+
+    Raises:
+      ValueError: If the cursor is malformed.
+    """
+    try:
+      return ObjectId(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, InvalidId, TypeError) as e:
+      raise ValueError(f"Invalid page cursor: {cursor}") from e
+
+  async def findExistingIds(self, collectionName: str, ids: list[str],
+                            field: str = "_id") -> set[str]:
+    """
+    Find which of several ids exist in a collection, with a single $in query.
+
+    Args:
+      collectionName (str): The name of the collection to search in.
+      ids (list[str]): The ids to look for. Malformed ids never exist.
+      field (str): The ObjectId field holding the ids. Defaults to _id.
+
+    Returns:
+      set[str]: The ids that exist in the collection.
+    """
+    objectIds = [ObjectId(id) for id in set(ids) if ObjectId.is_valid(id)]
+    if not objectIds:
+      return set()
+    existing = await self.database[collectionName].distinct(field,
+                                                            {field: {"$in": objectIds}})
+    return set(existing)
+
+  async def findDocumentByFilters(self, collection_name: str, filters: dict) -> dict:
+    """
+    Find a document in a specified collection by a filters.
+
+    Args:
+      collection_name (str): The name of the collection to search in.
+      filters (dict): The filters to search by.
+    Returns:
+      dict: The found document or None if no document is found.
+    """
+    try:
+      filters = self.convertStringsToObjectIds(filters)
+      document = await self.database[collection_name].find_one(filters)
+      document = self.renameId(document)
+      return document
+    except Exception as e:
+      logger.error(f"Error finding document: {e}")
+      return None
+
+  async def findListDocumentsByQuery(self, collection_name: str, query: dict,
+                                     raw: bool = False) -> list[Mapping]:
+    """
+    Find a list of document in a specified collection given some.
+
+    Args:
+      collection_name (str): The name of the collection to search in.
+      filters (dict): The filters to search by.
+      raw (bool): Return RawBSONDocuments, keyed by _id, that decode a field only when accessed.
+    Returns:
+      list[Mapping]: The list of found documents.
+    """
+    try:
+      query = self.convertStringsToObjectIds(query)
+      listDocument = await self.readCollection(collection_name, raw).find(query).to_list()
+      if raw:
+        return listDocument
+      listDocument = [self.renameId(document) for document in listDocument]
+      return listDocument
+    except Exception as e:
+      logger.error(f"Error finding documents: {e}")
+      return None
+
+  async def findRankingDocuments(self, collectionName: str, query: dict | None = None,
+                                 raw: bool = False) -> list[Mapping]:
+    """
+    Find the compact records used by the ranking index.
+
+    Args:
+      collectionName (str): The name of the collection to search in.
+      query (dict): The query to search by. Defaults to the whole collection.
+      raw (bool): Return RawBSONDocuments, keyed by _id, so the skill arrays
+        of records that store 'skills_extracted' are never decoded.
+
+    Returns:
+      list[Mapping]: Records with 'id', 'userId', 'primarySkills', 'secondarySkills'
+        and 'skills_extracted' when stored.
+    """
+    try:
+      query = self.convertStringsToObjectIds(query or {})
+      cursor = self.readCollection(collectionName, raw).find(query, self.RANKING_PROJECTION)
+      if raw:
+        return await cursor.to_list()
+      records = []
+      async for document in cursor:
+        records.append(self.renameId(document))
+      return records
+    except Exception as e:
+      logger.error(f"Error finding ranking documents: {e}")
+      return None
+
+  # ---------------------------------- Update
+  # 1. ----- set operation
+  async def bulkUpdateDocuments(self, collectionName: str,
+                                updates: list[tuple[dict, dict]]) -> dict[int, dict]:
+    """
+    Apply several single-document updates with one ordered bulk_write.
+
+    The updates run in the given order, so two updates of the same document
+    keep their effect. After a failure the remaining updates are not run and
+    are reported as errors too.
+
+    Args:
+      collectionName (str): The name of the collection to update the documents in.
+      updates (list[tuple[dict, dict]]): The filters and the update operators of each update.
+
+    Returns:
+      dict[int, dict]: The write error of each update that was not applied,
+        keyed by its index.
+    """
+    if not updates:
+      return {}
+    operations = [UpdateOne(self.convertStringsToObjectIds(filters),
+                            self.withUpdatedDate(operation))
+                  for filters, operation in updates]
+    try:
+      await self.database[collectionName].bulk_write(operations, ordered=True)
+    except BulkWriteError as e:
+      errors = {error["index"]: error for error in e.details.get("writeErrors", [])}
+      failedAt = min(errors, default=len(operations))
+      for index in range(failedAt + 1, len(operations)):
+        errors[index] = {"index": index, "errmsg": "Not applied after an earlier error"}
+      return errors
+    return {}
+
+  async def setDocument(self, collectionName: str, filters: dict,
+                        newInfoDoc: dict,
+                        mode: WriteModeEnum = WriteModeEnum.DOCUMENT,
+                        writeConcern: WriteConcern | None = None,
+                        unsetFields: list[str] | None = None) -> dict | int | None:
+    """
+    Update a document in a specified collection.
+
+    Args:
+      collectionName (str): The name of the collection to update the document in.
+      filters (dict): The filters to find the document to update.
+      newInfoDoc (dict): The new information to update the document with.
+      mode (WriteModeEnum): DOCUMENT returns the updated document, ACKNOWLEDGED
+        only the number of matched documents and UNACKNOWLEDGED does not wait
+        for the server.
+      writeConcern (WriteConcern | None): A write concern replacing the default of the mode.
+      unsetFields (list[str] | None): Fields removed in the same update.
+
+    Returns:
+      dict | int | None: The updated document or None if the document was not
+        updated, or the number of matched documents when acknowledged.
+    """
+    try:
+      filters = self.convertStringsToObjectIds(filters)
+      newInfoDoc = self.convertStringsToObjectIds(newInfoDoc)
+
+      newInfoDoc = {k: v for k, v in newInfoDoc.items() if v is not None}
+      newInfoDoc["updatedDate"] = str(datetime.now())
+      update = {"$set": newInfoDoc}
+      if unsetFields:
+        update["$unset"] = {field: "" for field in unsetFields}
+      return await self.updateWithMode(collectionName, filters, update,
+                                       mode, writeConcern)
+    except Exception as e:
+      logger.error(f"Error updating document: {e}")
+      return None
+
+  async def documentOperation(self, collectionName: str, filters: dict,
+                              operation: dict,
+                              mode: WriteModeEnum = WriteModeEnum.DOCUMENT,
+                              writeConcern: WriteConcern | None = None) -> dict | int | None:
+    """
+    Update a document in a specified collection.
+
+    Args:
+      collectionName (str): The name of the collection to update the document in.
+      filters (dict): The filters to find the document to update.
+      operation (dict): The operation to update the document with.
+      mode (WriteModeEnum): DOCUMENT returns the updated document, ACKNOWLEDGED
+        only the number of matched documents and UNACKNOWLEDGED does not wait
+        for the server.
+      writeConcern (WriteConcern | None): A write concern replacing the default of the mode.
+
+    Returns:
+      dict | int | None: The updated document or None if the document was not
+        updated, or the number of matched documents when acknowledged.
+    """
+    try:
+      return await self.updateWithMode(collectionName, filters,
+                                       self.withUpdatedDate(operation),
+                                       mode, writeConcern)
+    except Exception as e:
+      logger.error(f"Error updating document: {e}")
+      return None
+
+  async def updateWithMode(self, collectionName: str, filters: dict, update: dict,
+                           mode: WriteModeEnum,
+                           writeConcern: WriteConcern | None = None) -> dict | int | None:
+    """
+    Apply an update to one document and return what the write mode asks for.
+
+    Only DOCUMENT pays for sending the updated document back, the other modes
+    use a plain update_one.
+
+    Args:
+      collectionName (str): The name of the collection to update the document in.
+      filters (dict): The filters to find the document to update.
+      update (dict): The update operators.
+      mode (WriteModeEnum): The write mode.
+      writeConcern (WriteConcern | None): A write concern replacing the default of the mode.
+
+    Returns:
+      dict | int | None: The updated document, the number of matched
+        documents, or None when unacknowledged.
+    """
+    collection = self.writeCollection(collectionName, mode, writeConcern)
+    if mode == WriteModeEnum.DOCUMENT:
+      updatedDocument = await collection.find_one_and_update(
+          filters, update, return_document=ReturnDocument.AFTER)
+      return self.renameId(updatedDocument)
+    updateResult = await collection.update_one(filters, update)
+    if mode == WriteModeEnum.UNACKNOWLEDGED:
+      return None
+    return updateResult.matched_count
+
+  async def documentOperations(self, updates: list[tuple[str, dict, dict]]) -> list[int]:
+    """
+    Update several documents, possibly of different collections, all or nothing.
+
+    On a replica set or a sharded cluster the updates run in one multi-document
+    transaction, one after the other since a session does not allow concurrent
+    operations, and nothing is written unless every update matches a document.
+    On a deployment without transactions they are sent concurrently instead,
+    and a failed update does not undo the others.
+
+    Args:
+      updates (list[tuple[str, dict, dict]]): The collection name, the filters
+        and the update operators of each update.
+
+    Returns:
+      list[int]: The number of matched documents of each update. With a
+        transaction these are all 0 when any update matched nothing.
+    """
+    updates = [(collectionName, self.convertStringsToObjectIds(filters),
+                self.withUpdatedDate(operation))
+               for collectionName, filters, operation in updates]
+    if self.transactions is not False:
+      try:
+        async with self.NoSqlClient.start_session() as session:
+          matched = await session.with_transaction(
+              lambda session: self.transactionUpdates(session, updates))
+        self.transactions = True
+        return matched
+      except OperationFailure as e:
+        if e.code != self.ILLEGAL_OPERATION:
+          raise
+        logger.info("Transactions are not supported, updating documents concurrently.")
+        self.transactions = False
+    return list(await asyncio.gather(*(
+        self.updateWithMode(collectionName, filters, operation, WriteModeEnum.ACKNOWLEDGED)
+        for collectionName, filters, operation in updates)))
+
+  async def transactionUpdates(self, session: AsyncClientSession,
+                               updates: list[tuple[str, dict, dict]]) -> list[int]:
+    """
+    Run the updates of documentOperations in the transaction of a session.
+
+    Args:
+      session (AsyncClientSession): The session holding the transaction.
+      updates (list[tuple[str, dict, dict]]): The collection name, the filters
+        and the update operators of each update.
+
+    Returns:
+      list[int]: The number of matched documents of each update, all 0 when
+        the transaction was aborted.
+    """
+    matched = []
+    for collectionName, filters, operation in updates:
+      updateResult = await self.database[collectionName].update_one(filters, operation,
+                                                                    session=session)
+      if updateResult.matched_count == 0:
+        # with_transaction returns without committing an aborted transaction
+        await session.abort_transaction()
+        return [0] * len(updates)
+      matched.append(updateResult.matched_count)
+    return matched
+
+  def withUpdatedDate(self, operation: dict) -> dict:
+    """
+    Drop the empty operators of an update and stamp its updatedDate.
+
+    Args:
+      operation (dict): The update operators.
+
+    Returns:
+      dict: A copy of the update also setting updatedDate.
+    """
+    operation = {k: v for k, v in operation.items() if v is not None}
+    operation["$set"] = {**operation.get("$set", {}), "updatedDate": str(datetime.now())}
+    return operation
+
+  # Delete
+  async def deleteDocument(self, collectionName: str, filters: dict) -> bool:
+    """
+    Delete a document in a specified collection.
+
+    Args:
+      collectionName (str): The name of the collection to delete the document from.
+      filters (dict): The filters to find the document to delete.
+
+    Returns:
+      bool: True if the document was deleted, False otherwise.
+    """
+    try:
+      filters = self.convertStringsToObjectIds(filters)
+
+      deleteResult = await self.database[collectionName].delete_one(filters)
+      return deleteResult.deleted_count > 0
+    except Exception as e:
+      logger.error(f"Error deleting document: {e}")
+      return False
+
+  async def findAndDeleteDocument(self, collectionName: str, filters: dict,
+                                  projection: dict | None = None) -> dict:
+    """
+    Delete a document in a specified collection and return it.
+
+    Args:
+      collectionName (str): The name of the collection to delete the document from.
+      filters (dict): The filters to find the document to delete.
+      projection (dict): The fields of the deleted document to return. Defaults to all.
+
+    Returns:
+      dict: The deleted document or None if no document was deleted.
+    """
+    try:
+      filters = self.convertStringsToObjectIds(filters)
+
+      deletedDocument = await self.database[collectionName].find_one_and_delete(
+          filters, projection=projection)
+      return self.renameId(deletedDocument)
+    except Exception as e:
+      logger.error(f"Error deleting document: {e}")
+      return None
+
+
+# Alias for AsyncNoSqlConnection.getInstance
+# This alias allows for easier access to the AsyncNoSqlConnection singleton instance.
+getAsyncNoSqlConn = AsyncNoSqlConnection.getInstance
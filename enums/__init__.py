@@ -10,5 +10,6 @@ Contact Information: mathteixeira55
 """
 
 from enums.proeficiencyLevelEnum import ProficiencyLevelEnum
+from enums.writeModeEnum import WriteModeEnum
 
-__all__ = ['ProficiencyLevelEnum']
+__all__ = ['ProficiencyLevelEnum', 'WriteModeEnum']
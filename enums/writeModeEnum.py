@@ -0,0 +1,18 @@
+"""
+File Name: writeModeEnum.py
+Description: This file contains the WriteModeEnum enumeration class.
+Author: MathTeixeira
+Date: October 17, 2026
+Version: 3.0.0
+License: MIT License
+Contact Information: mathteixeira55
+
+This file contains the WriteModeEnum enumeration class, which defines what a
+  write to the NoSql database waits for and returns.
+"""
+from enum import Enum
+
+class WriteModeEnum(str, Enum):
+  DOCUMENT = 'document'
+  ACKNOWLEDGED = 'acknowledged'
+  UNACKNOWLEDGED = 'unacknowledged'
@@ -15,11 +15,12 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 from schemas import ResponseSchema
 from routers import applicationRouter, seekerRouter, jobRouter, aiRouter, authRouter
-from core.database import getNoSqlConn
+from core.config import noSql
+from core.database import getAsyncNoSqlConn
 from services import getAIService
+from utils import OrjsonResponse
 from pymongo import ASCENDING
 
 import logging
@@ -30,22 +31,30 @@ logger = logging.getLogger("uvicorn")
 @asynccontextmanager
 async def lifespan(app: FastAPI):
   logger.info("Starting up...")
-  app.noSqlConn = getNoSqlConn()
+  app.noSqlConn = getAsyncNoSqlConn()
   app.aiService = getAIService()
   # Create the index if it doesn't already exist, in the background
   app.collection = app.noSqlConn.database["seekers"]
   logger.info("Ensuring index on 'userId' field for seekers")
-  app.collection.create_index([("userId", ASCENDING)],
-                              unique=True,
-                              background=True)
+  await app.collection.create_index([("userId", ASCENDING)],
+                                    unique=True,
+                                    background=True)
   app.collection = app.noSqlConn.database["users"]
   logger.info("Ensuring index on 'username' field")
-  app.collection.create_index([("username", ASCENDING)],
-                              unique=True,
-                              background=True)
+  await app.collection.create_index([("username", ASCENDING)],
+                                    unique=True,
+                                    background=True)
+  # Fit the ranking indexes once so requests only vectorize the query side.
+  # Raw records leave the skill arrays undecoded when skills_extracted is stored
+  logger.info("Building the job and seeker ranking indexes")
+  app.aiService.build_job_index(
+      await app.noSqlConn.findRankingDocuments(noSql.JOBS_COLLECTION, raw=True) or [], '_id')
+  app.aiService.build_seeker_index(
+      await app.noSqlConn.findRankingDocuments(noSql.SEEKERS_COLLECTION, raw=True) or [])
   yield
   logger.info("Shutting down...")
-  app.noSqlConn.shutdownDbClient()
+  app.aiService.executor.shutdown()
+  await app.noSqlConn.shutdownDbClient()
 
 
 ### Initialize FastAPI App ###
@@ -53,6 +62,8 @@ app = FastAPI(
     title="Opus API",
     version="1.0.0",
     lifespan=lifespan,
+    # Response models are encoded by pydantic-core and orjson
+    default_response_class=OrjsonResponse,
     description=
     "API for the Jobswipe application."
 )
@@ -64,7 +75,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         "message": f"Error - Validation failed: {exc.errors()}",
         "code": status.HTTP_422_UNPROCESSABLE_ENTITY
     }
-    return JSONResponse(content=response_content, status_code=status.HTTP_422_UNPROCESSABLE_ENTITY)
+    return OrjsonResponse(content=response_content, status_code=status.HTTP_422_UNPROCESSABLE_ENTITY)
 
 ### Include Routers ###
 # Uncomment and modify these lines if you add authentication and user management in the future
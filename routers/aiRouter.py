@@ -14,9 +14,9 @@ from bson import ObjectId
 from fastapi import APIRouter, HTTPException, status
 
 from models import Job, Seeker
-from schemas import ResponseSchema
+from schemas import ResponseSchema, BatchRankingSchema
 from services import JobService, getAIService, SeekerService
-from utils import userIdPath, jobIdPath
+from utils import userIdPath, jobIdPath, RankingQueueFullError, OrjsonResponse
 
 aiRouter = APIRouter()
 
@@ -30,65 +30,137 @@ async def getTopJobs(userId: str = userIdPath):
   try:
     aiService = getAIService()
 
-    # Get the seeker by userId
-    seeker = await SeekerService.getSeekerByFilters('seekers',
-                                                    {'userId': ObjectId(userId)})
-    # Convert seeker to JSON (dict)
-    seeker = Seeker.model_dump(seeker)
-    
-    # Get all jobs
-    jobs = await JobService.getJobs('jobs')
-    # Convert jobs to JSON (dict)
-    jobs = [Job.model_dump(job) for job in jobs]
-
-    rankedJobsIDs = aiService.get_top_jobs_for_candidate(seeker, jobs)
-
-    query = {"id": {"$in": rankedJobsIDs}}
-    listJob = await JobService.getListJobByQuery('jobs', query)
-    if listJob:
-      job_dict = {str(job.id): job for job in listJob}
-      ordered_jobs = [job_dict[job_id] for job_id in rankedJobsIDs if job_id in job_dict]
-      return ResponseSchema(message=ordered_jobs, code=status.HTTP_200_OK)
+    # Read the seeker skills from the seeker index, the database is the fallback
+    seeker = aiService.indexed_seeker(userId)
+    if seeker is None:
+      seeker = await SeekerService.getSeekerByFilters('seekers',
+                                                      {'userId': ObjectId(userId)})
+      if seeker is None:
+        return ResponseSchema(message="Seeker not found",
+                              code=status.HTTP_404_NOT_FOUND)
+      # Convert seeker to JSON (dict)
+      seeker = Seeker.model_dump(seeker)
+
+    # Rank against the resident job index built at startup
+    rankedJobsIDs = await aiService.get_top_jobs_for_candidate_async(seeker)
+
+    ordered_jobs = await JobService.getJobsByIds('jobs', rankedJobsIDs)
+    if ordered_jobs:
+      responseContent = {
+        "message": ordered_jobs,
+        "code": status.HTTP_200_OK
+      }
+      return OrjsonResponse(content=responseContent, status_code=status.HTTP_200_OK)
     else:
       return ResponseSchema(message="Jobs not found",
                             code=status.HTTP_404_NOT_FOUND)
+  except RankingQueueFullError as e:
+    raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                        detail=str(e))
   except Exception as e:
     raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                         detail=str(e))
 
 
-@aiRouter.get("/seekers/{jobId}",
-              summary="Get the list of seekers for a given job",
-              response_model=ResponseSchema)
-async def getTopSeekers(jobId: str = jobIdPath):
+@aiRouter.post("/jobs/batch",
+               summary="Get the list of job ids for many seekers at once",
+               response_model=ResponseSchema)
+async def getTopJobsBatch(batch: BatchRankingSchema):
   """
+  Rank the jobs of many seekers in one call.
+
+  The seeker skills are read from the resident seeker index, with one lean
+  query for the seekers it misses, and scored against the resident job index
+  in fixed-size chunks, which suits digests and prefetching.
+
+  Args:
+    batch (BatchRankingSchema): The seeker user ids and the number of jobs per seeker.
+
+  Returns:
+    OrjsonResponse: The ranked job ids keyed by seeker userId and a status code.
   """
   try:
     aiService = getAIService()
-    # Get the job by jobId
-    job = await JobService.getJobByFilters('jobs', {'id': jobId})
 
-    # Convert job to JSON (dict)
-    job = Job.model_dump(job)
+    # Read the seeker skills from the seeker index, the database is the fallback
+    seekers, missing = [], []
+    for userId in dict.fromkeys(batch.userIds):
+      seeker = aiService.indexed_seeker(userId)
+      if seeker is None:
+        missing.append(userId)
+      else:
+        seekers.append(seeker)
+    if missing:
+      query = {"userId": {"$in": missing}}
+      seekers += await SeekerService.getRankingSeekers('seekers', query)
+    if not seekers:
+      return ResponseSchema(message="Seekers not found",
+                            code=status.HTTP_404_NOT_FOUND)
+
+    rankedJobsIDs = await aiService.get_top_jobs_for_candidates_async(seekers, batch.topJobs)
+    responseContent = {
+      "message": rankedJobsIDs,
+      "code": status.HTTP_200_OK
+    }
+    return OrjsonResponse(content=responseContent, status_code=status.HTTP_200_OK)
+  except RankingQueueFullError as e:
+    raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                        detail=str(e))
+  except Exception as e:
+    raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                        detail=str(e))
 
-    # Get all seekers
-    seekers = await SeekerService.getSeekers('seekers')
 
-    # Convert seekers to JSON (dict)
-    seekers = [Seeker.model_dump(seeker) for seeker in seekers]
+@aiRouter.get("/cache/stats",
+              summary="Get the size and hit rate of the ranking caches")
+async def getCacheStats():
+  """
+  Report the ranking caches, to size them.
 
-    rankedIds = aiService.get_top_candidates_for_job(job, seekers)
+  Returns:
+    OrjsonResponse: The size, ttl, hits, misses and hit rate of each cache and a status code.
+  """
+  responseContent = {
+    "message": getAIService().cache_stats(),
+    "code": status.HTTP_200_OK
+  }
+  return OrjsonResponse(content=responseContent, status_code=status.HTTP_200_OK)
 
-    query = {"userId": {"$in": rankedIds}}
 
-    listSeekers = await SeekerService.getListSeekerByQuery('seekers', query)
-    if listSeekers:
-      seeker_dict = {str(seeker.userId): seeker for seeker in listSeekers}
-      ordered_seekers = [seeker_dict[seeker_id] for seeker_id in rankedIds if seeker_id in seeker_dict]
-      return ResponseSchema(message=ordered_seekers, code=status.HTTP_200_OK)
+@aiRouter.get("/seekers/{jobId}",
+              summary="Get the list of seekers for a given job",
+              response_model=ResponseSchema)
+async def getTopSeekers(jobId: str = jobIdPath):
+  """
+  """
+  try:
+    aiService = getAIService()
+    # Read the job skills from the job index, the database is the fallback
+    job = aiService.indexed_job(jobId)
+    if job is None:
+      job = await JobService.getJobByFilters('jobs', {'id': jobId})
+      if job is None:
+        return ResponseSchema(message="Job not found",
+                              code=status.HTTP_404_NOT_FOUND)
+      # Convert job to JSON (dict)
+      job = Job.model_dump(job)
+
+    # Rank against the resident seeker index built at startup
+    rankedIds = await aiService.get_top_candidates_for_job_async(job)
+
+    ordered_seekers = await SeekerService.getSeekersByUserIds('seekers', rankedIds)
+    if ordered_seekers:
+      responseContent = {
+        "message": ordered_seekers,
+        "code": status.HTTP_200_OK
+      }
+      return OrjsonResponse(content=responseContent, status_code=status.HTTP_200_OK)
     else:
       return ResponseSchema(message="Seekers not found",
                             code=status.HTTP_404_NOT_FOUND)
+  except RankingQueueFullError as e:
+    raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                        detail=str(e))
   except Exception as e:
     raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                         detail=str(e))
@@ -112,37 +184,44 @@ async def getTopAppliedSeekers(
     """
     try:
         aiService = getAIService()
-        # Get the job by jobId
-        job = await JobService.getJobByFilters('jobs', {'id': jobId})
-
-        # Convert job to JSON (dict)
-        job = Job.model_dump(job)
-
-        # Filter seekers by provided IDs
-        query = {"userId": {"$in": userIds}}
-        seekers = await SeekerService.getListSeekerByQuery('seekers', query)
+        # Read the job skills from the job index, the database is the fallback
+        job = aiService.indexed_job(jobId)
+        if job is None:
+            job = await JobService.getJobByFilters('jobs', {'id': jobId})
+            if job is None:
+                return ResponseSchema(message="Job not found",
+                                      code=status.HTTP_404_NOT_FOUND)
+            # Convert job to JSON (dict)
+            job = Job.model_dump(job)
+
+        if aiService.seeker_index.ready:
+            # Rank the provided IDs straight from the resident seeker index
+            rankedIds = await aiService.get_top_candidates_for_job_async(job, among=userIds)
+        else:
+            # Fetch only the skills of the provided IDs
+            query = {"userId": {"$in": userIds}}
+            seekers = await SeekerService.getRankingSeekers('seekers', query)
+            rankedIds = await aiService.get_top_candidates_for_job_async(job, seekers) if seekers else []
 
-        if not seekers:
+        if not rankedIds:
             return ResponseSchema(message="No seekers found for the provided IDs",
                                   code=status.HTTP_404_NOT_FOUND)
 
-        # Convert seekers to JSON (dict)
-        seekers = [Seeker.model_dump(seeker) for seeker in seekers]
-
-        # Use AI service to rank the filtered seekers for the job
-        rankedIds = aiService.get_top_candidates_for_job(job, seekers)
-
         # Get detailed seeker information for the ranked IDs
-        query = {"userId": {"$in": rankedIds}}
-        listSeekers = await SeekerService.getListSeekerByQuery('seekers', query)
-
-        if listSeekers:
-          seeker_dict = {str(seeker.userId): seeker for seeker in listSeekers}
-          ordered_seekers = [seeker_dict[seeker_id] for seeker_id in rankedIds if seeker_id in seeker_dict]
-          return ResponseSchema(message=ordered_seekers, code=status.HTTP_200_OK)
+        ordered_seekers = await SeekerService.getSeekersByUserIds('seekers', rankedIds)
+
+        if ordered_seekers:
+          responseContent = {
+            "message": ordered_seekers,
+            "code": status.HTTP_200_OK
+          }
+          return OrjsonResponse(content=responseContent, status_code=status.HTTP_200_OK)
         else:
             return ResponseSchema(message="No ranked seekers found",
                                   code=status.HTTP_404_NOT_FOUND)
+    except RankingQueueFullError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                            detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                            detail=str(e))
\ No newline at end of file
+                            detail=str(e))
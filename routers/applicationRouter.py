@@ -9,14 +9,18 @@ License: MIT License
 Contact Information: mathteixeira55
 """
 
-from fastapi import APIRouter, status
-from fastapi.responses import JSONResponse
+from typing import List
+from fastapi import APIRouter, Body, status
 
 from schemas import ResponseSchema, ApplicationSchema
 from services import ApplicationService
+from utils import OrjsonResponse
 
 applicationRouter = APIRouter()
 
+# Largest request body of the batch route
+MAX_BATCH_ITEMS = 500
+
 # ---------------------------------- Update
 @applicationRouter.patch("/updateApplication",
                        summary="Update Aplication",
@@ -32,10 +36,7 @@ async def updateJob(appdict: ApplicationSchema):
     ResponseSchema: The response message and status code.
   """
   try:
-    updatedJob = await ApplicationService.jobOperation(appdict)
-    updatedSeeker = await ApplicationService.seekerOperation(appdict)
-
-    if updatedJob and updatedSeeker:
+    if await ApplicationService.applicationOperation(appdict):
       return ResponseSchema(message=f"{appdict.newStatus} for user {appdict.userId} to job {appdict.jobId} successfully",
                             code=status.HTTP_200_OK)
     else:
@@ -43,10 +44,43 @@ async def updateJob(appdict: ApplicationSchema):
         "message": f"Error - Not able to {appdict.newStatus} for user {appdict.userId} to job {appdict.jobId}",
         "code": status.HTTP_404_NOT_FOUND
       }
-      return JSONResponse(content=responseContent, status_code=status.HTTP_404_NOT_FOUND)
+      return OrjsonResponse(content=responseContent, status_code=status.HTTP_404_NOT_FOUND)
   except Exception as e:
     responseContent = {
       "message": f"Error -  - Not able to {appdict.newStatus} for user {appdict.userId} to job {appdict.jobId} successfully: {str(e)}",
       "code": status.HTTP_500_INTERNAL_SERVER_ERROR
     }
-    return JSONResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    return OrjsonResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@applicationRouter.patch("/updateApplications",
+                       summary="Update many applications at once")
+async def updateApplications(appdicts: List[ApplicationSchema] = Body(..., min_length=1,
+                                                                       max_length=MAX_BATCH_ITEMS)):
+  """
+  Update the application status of many jobs, such as a whole swipe session.
+
+  The updates are applied in order with one write per collection.
+
+  Args:
+    appdicts (List[ApplicationSchema]): The application updates, at most MAX_BATCH_ITEMS.
+
+  Returns:
+    OrjsonResponse: The outcome of each update in request order, with 200 when
+      all were applied and 207 otherwise.
+  """
+  try:
+    results = await ApplicationService.batchOperation(appdicts)
+    code = (status.HTTP_200_OK
+            if all(result.code == status.HTTP_200_OK for result in results)
+            else status.HTTP_207_MULTI_STATUS)
+    responseContent = {
+      "message": results,
+      "code": code
+    }
+    return OrjsonResponse(content=responseContent, status_code=code)
+  except Exception as e:
+    responseContent = {
+      "message": f"Error - Not able to update applications: {str(e)}",
+      "code": status.HTTP_500_INTERNAL_SERVER_ERROR
+    }
+    return OrjsonResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
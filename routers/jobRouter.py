@@ -10,18 +10,24 @@ Contact Information: mathteixeira55
 """
 
 import json
-from fastapi import APIRouter, status
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
+from typing import List
+from fastapi import APIRouter, Body, status
+from fastapi.responses import StreamingResponse
 from pymongo.errors import PyMongoError
 
 from models import Job, JobUpdate
 from schemas import ResponseSchema
 from services import JobService
-from utils import jobCollectionPath, jobFiltersPath, jobQueryPath
+from utils import jobCollectionPath, jobFiltersPath, jobQueryPath, streamQuery
+from utils import NDJSON_MEDIA_TYPE, ndjsonLines, limitQuery, afterQuery, OrjsonResponse
 
 jobRouter = APIRouter()
 
+# Page size when a page is requested with after but without limit
+DEFAULT_PAGE_SIZE = 100
+# Largest request body of the bulk routes
+MAX_BULK_ITEMS = 500
+
 # -------------------------------- Create
 @jobRouter.post("/{collectionName}",
                         summary="Create new job post",
@@ -49,44 +55,118 @@ async def createJob(*,
     createdJob = await JobService.createJob(
         collectionName, job)
     responseContent = {
-      "message": jsonable_encoder(createdJob),
+      "message": createdJob,
       "code": status.HTTP_201_CREATED
     }
-    return JSONResponse(content=responseContent, status_code=status.HTTP_201_CREATED)
+    return OrjsonResponse(content=responseContent, status_code=status.HTTP_201_CREATED)
   except Exception as e:
     responseContent = {
       "message": f"Error - Not able to create job: {str(e)}",
       "code": status.HTTP_500_INTERNAL_SERVER_ERROR
     }
-    return JSONResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    return OrjsonResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+# -------------------------------- Bulk create
+@jobRouter.post("/{collectionName}/bulk",
+                        summary="Create many jobs at once",
+                        status_code=status.HTTP_201_CREATED)
+async def createJobs(*,
+                        collectionName: str = jobCollectionPath,
+                        jobs: List[Job] = Body(..., min_length=1, max_length=MAX_BULK_ITEMS)):
+  """
+  Create many job entries in one request.
+
+  The owners of all jobs are checked with one query and the jobs are
+  written with one unordered insert, so a failing job does not stop the others.
+
+  Args:
+      collectionName (str): The name of the collection to insert the documents into.
+      jobs (List[Job]): The jobs to be created, at most MAX_BULK_ITEMS.
+
+  Returns:
+      OrjsonResponse: The outcome of each job in request order, with 201 when
+        all were created and 207 otherwise.
+  """
+  try:
+    results = await JobService.createJobs(collectionName, jobs)
+    code = (status.HTTP_201_CREATED
+            if all(result.code == status.HTTP_201_CREATED for result in results)
+            else status.HTTP_207_MULTI_STATUS)
+    responseContent = {
+      "message": results,
+      "code": code
+    }
+    return OrjsonResponse(content=responseContent, status_code=code)
+  except Exception as e:
+    responseContent = {
+      "message": f"Error - Not able to create jobs: {str(e)}",
+      "code": status.HTTP_500_INTERNAL_SERVER_ERROR
+    }
+    return OrjsonResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 # -------------------------------- Retrieve
 # 1. ----- get all jobs
 @jobRouter.get("/{collectionName}",
                   summary="Get all jobs",
                   response_model=ResponseSchema)
-async def getJobs(collectionName: str = jobCollectionPath):
+async def getJobs(collectionName: str = jobCollectionPath,
+                  stream: bool = streamQuery,
+                  limit: int | None = limitQuery,
+                  after: str | None = afterQuery):
   """
   Retrieve all job documents from a specified collection.
 
+  With stream, the jobs are written as NDJSON while the cursor is read, so
+  memory stays flat whatever the size of the collection. With limit or after,
+  one page is returned with the cursor of the next one in nextCursor.
+
   Args:
       collectionName (str): The name of the collection to retrieve the documents from.
+      stream (bool): Stream the jobs as NDJSON instead of one ResponseSchema.
+      limit (int | None): The page size, DEFAULT_PAGE_SIZE when only after is given.
+      after (str | None): The nextCursor of the previous page.
 
   Returns:
-      ResponseSchema: A response containing all jobs and a status code.
+      OrjsonResponse: A response containing all jobs and a status code, or a
+        StreamingResponse of one job per line, or an OrjsonResponse of one
+        page and its nextCursor.
 
   Raises:
       HTTPException: If there's an error retrieving the jobs.
   """
   try:
+    if stream:
+      return StreamingResponse(ndjsonLines(JobService.streamJobs(collectionName)),
+                               media_type=NDJSON_MEDIA_TYPE)
+    if limit is not None or after is not None:
+      try:
+        jobs, nextCursor = await JobService.getJobsPage(collectionName,
+                                                        limit or DEFAULT_PAGE_SIZE,
+                                                        after)
+      except ValueError as e:
+        responseContent = {
+          "message": f"Error - {str(e)}",
+          "code": status.HTTP_400_BAD_REQUEST
+        }
+        return OrjsonResponse(content=responseContent, status_code=status.HTTP_400_BAD_REQUEST)
+      responseContent = {
+        "message": jobs,
+        "code": status.HTTP_200_OK,
+        "nextCursor": nextCursor
+      }
+      return OrjsonResponse(content=responseContent, status_code=status.HTTP_200_OK)
     jobs = await JobService.getJobs(collectionName)
-    return ResponseSchema(message=jobs, code=status.HTTP_200_OK)
+    responseContent = {
+      "message": jobs,
+      "code": status.HTTP_200_OK
+    }
+    return OrjsonResponse(content=responseContent, status_code=status.HTTP_200_OK)
   except Exception as e:
     responseContent = {
       "message": f"Error - Not able to retrieve jobs: {str(e)}",
       "code": status.HTTP_500_INTERNAL_SERVER_ERROR
     }
-    return JSONResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    return OrjsonResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 # 2. ----- get one job by filters
 @jobRouter.get("/{collectionName}/{filters}",
@@ -115,19 +195,19 @@ async def getJobByFilters(collectionName: str = jobCollectionPath,
         "message": "Job not found",
         "code": status.HTTP_404_NOT_FOUND
       }
-      return JSONResponse(content=responseContent, status_code=status.HTTP_404_NOT_FOUND)
+      return OrjsonResponse(content=responseContent, status_code=status.HTTP_404_NOT_FOUND)
   except PyMongoError as e:
     responseContent = {
       "message": f"Database error: {str(e)}",
       "code": status.HTTP_500_INTERNAL_SERVER_ERROR
     }
-    return JSONResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    return OrjsonResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
   except Exception as e:
     responseContent = {
       "message": f"Error - Not able to retrieve job: {str(e)}",
       "code": status.HTTP_500_INTERNAL_SERVER_ERROR
     }
-    return JSONResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    return OrjsonResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 # 3. ----- get jobs by filters
 @jobRouter.get("/{collectionName}/list/{query}",
@@ -143,32 +223,36 @@ async def getJobByQuery(collectionName: str = jobCollectionPath,
     query (str): The query to apply to the database.
 
   Returns:
-    ResponseSchema: A response containing a list of jobs and a status code.
+    OrjsonResponse: A response containing a list of jobs and a status code.
   """
   try:
     query = json.loads(query)
     jobList = await JobService.getListJobByQuery(
         collectionName, query)
     if jobList:
-      return ResponseSchema(message=jobList, code=status.HTTP_200_OK)
+      responseContent = {
+        "message": jobList,
+        "code": status.HTTP_200_OK
+      }
+      return OrjsonResponse(content=responseContent, status_code=status.HTTP_200_OK)
     else: # send a 404 response if the job is not found
       responseContent = {
         "message": "No job found",
         "code": status.HTTP_404_NOT_FOUND
       }
-      return JSONResponse(content=responseContent, status_code=status.HTTP_404_NOT_FOUND)
+      return OrjsonResponse(content=responseContent, status_code=status.HTTP_404_NOT_FOUND)
   except PyMongoError as e:
     responseContent = {
       "message": f"Database error: {str(e)}",
       "code": status.HTTP_500_INTERNAL_SERVER_ERROR
     }
-    return JSONResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    return OrjsonResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
   except Exception as e:
     responseContent = {
       "message": f"Error - Not able to retrieve any job: {str(e)}",
       "code": status.HTTP_500_INTERNAL_SERVER_ERROR
     }
-    return JSONResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    return OrjsonResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
 # ---------------------------------- Update
@@ -203,13 +287,13 @@ async def updateJob(collectionName: str = jobCollectionPath, filters: str = jobF
         "message": f"Error - Either job do not exist or not updated {filters}",
         "code": status.HTTP_404_NOT_FOUND
       }
-      return JSONResponse(content=responseContent, status_code=status.HTTP_404_NOT_FOUND)
+      return OrjsonResponse(content=responseContent, status_code=status.HTTP_404_NOT_FOUND)
   except Exception as e:
     responseContent = {
       "message": f"Error - Not able to update job: {str(e)}",
       "code": status.HTTP_500_INTERNAL_SERVER_ERROR
     }
-    return JSONResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    return OrjsonResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 # ----------------------------------- Delete
 @jobRouter.delete("/{collectionName}/{filters}",
@@ -241,10 +325,10 @@ async def deleteJob(collectionName: str = jobCollectionPath, filters: str = jobF
         "message": f"Error - Either job was not found or not deleted {filters}",
         "code": status.HTTP_500_INTERNAL_SERVER_ERROR
       }
-      return JSONResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+      return OrjsonResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
   except Exception as e:
     responseContent = {
       "message": f"Error - Unable to delete job: {str(e)}",
       "code": status.HTTP_500_INTERNAL_SERVER_ERROR
     }
-    return JSONResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    return OrjsonResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -10,18 +10,24 @@ Contact Information: mathteixeira55
 """
 
 import json
-from fastapi import APIRouter, status
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
+from typing import List
+from fastapi import APIRouter, Body, status
+from fastapi.responses import StreamingResponse
 from pymongo.errors import PyMongoError
 
 from services import SeekerService
 from models import Seeker, SeekerUpdate
 from schemas import ResponseSchema
-from utils import seekerCollectionPath, userIdFilterPath, seekerQueryPath
+from utils import seekerCollectionPath, userIdFilterPath, seekerQueryPath, streamQuery
+from utils import NDJSON_MEDIA_TYPE, ndjsonLines, limitQuery, afterQuery, OrjsonResponse
 
 seekerRouter = APIRouter()
 
+# Page size when a page is requested with after but without limit
+DEFAULT_PAGE_SIZE = 100
+# Largest request body of the bulk routes
+MAX_BULK_ITEMS = 500
+
 # -------------------------------- Create
 @seekerRouter.post("/{seekerCollection}",
                         summary="Create new seeker",
@@ -49,44 +55,118 @@ async def createSeeker(*,
     createdSeeker = await SeekerService.createSeeker(
         seekerCollection, seeker)
     responseContent = {
-      "message": jsonable_encoder(createdSeeker),
+      "message": createdSeeker,
       "code": status.HTTP_201_CREATED
     }
-    return JSONResponse(content=responseContent, status_code=status.HTTP_201_CREATED)
+    return OrjsonResponse(content=responseContent, status_code=status.HTTP_201_CREATED)
   except Exception as e:
     responseContent = {
       "message": f"Error - Not able to create job: {str(e)}",
       "code": status.HTTP_500_INTERNAL_SERVER_ERROR
     }
-    return JSONResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    return OrjsonResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+# -------------------------------- Bulk create
+@seekerRouter.post("/{seekerCollection}/bulk",
+                        summary="Create many seekers at once",
+                        status_code=status.HTTP_201_CREATED)
+async def createSeekers(*,
+                        seekerCollection: str = seekerCollectionPath,
+                        seekers: List[Seeker] = Body(..., min_length=1, max_length=MAX_BULK_ITEMS)):
+  """
+  Create many seeker entries in one request.
+
+  The owners of all seekers are checked with one query and the seekers are
+  written with one unordered insert, so a failing seeker does not stop the others.
+
+  Args:
+      seekerCollection (str): The name of the collection to insert the documents into.
+      seekers (List[Seeker]): The seekers to be created, at most MAX_BULK_ITEMS.
+
+  Returns:
+      OrjsonResponse: The outcome of each seeker in request order, with 201 when
+        all were created and 207 otherwise.
+  """
+  try:
+    results = await SeekerService.createSeekers(seekerCollection, seekers)
+    code = (status.HTTP_201_CREATED
+            if all(result.code == status.HTTP_201_CREATED for result in results)
+            else status.HTTP_207_MULTI_STATUS)
+    responseContent = {
+      "message": results,
+      "code": code
+    }
+    return OrjsonResponse(content=responseContent, status_code=code)
+  except Exception as e:
+    responseContent = {
+      "message": f"Error - Not able to create seekers: {str(e)}",
+      "code": status.HTTP_500_INTERNAL_SERVER_ERROR
+    }
+    return OrjsonResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 # --------------------------------- Retrieve
 # 1. ----- Get all seekers
 @seekerRouter.get("/{seekerCollection}",
                   summary="Get all seekers",
                   response_model=ResponseSchema)
-async def getSeekers(seekerCollection: str = seekerCollectionPath):
+async def getSeekers(seekerCollection: str = seekerCollectionPath,
+                     stream: bool = streamQuery,
+                     limit: int | None = limitQuery,
+                     after: str | None = afterQuery):
   """
   Retrieve all seeker documents from a specified collection.
 
+  With stream, the seekers are written as NDJSON while the cursor is read, so
+  memory stays flat whatever the size of the collection. With limit or after,
+  one page is returned with the cursor of the next one in nextCursor.
+
   Args:
       collectionName (str): The name of the collection to retrieve the documents from.
+      stream (bool): Stream the seekers as NDJSON instead of one ResponseSchema.
+      limit (int | None): The page size, DEFAULT_PAGE_SIZE when only after is given.
+      after (str | None): The nextCursor of the previous page.
 
   Returns:
-      ResponseSchema: A response containing all seekers and a status code.
+      OrjsonResponse: A response containing all seekers and a status code, or a
+        StreamingResponse of one seeker per line, or an OrjsonResponse of one
+        page and its nextCursor.
 
   Raises:
       HTTPException: If there's an error retrieving the seekers.
   """
   try:
+    if stream:
+      return StreamingResponse(ndjsonLines(SeekerService.streamSeekers(seekerCollection)),
+                               media_type=NDJSON_MEDIA_TYPE)
+    if limit is not None or after is not None:
+      try:
+        seekers, nextCursor = await SeekerService.getSeekersPage(seekerCollection,
+                                                                 limit or DEFAULT_PAGE_SIZE,
+                                                                 after)
+      except ValueError as e:
+        responseContent = {
+          "message": f"Error - {str(e)}",
+          "code": status.HTTP_400_BAD_REQUEST
+        }
+        return OrjsonResponse(content=responseContent, status_code=status.HTTP_400_BAD_REQUEST)
+      responseContent = {
+        "message": seekers,
+        "code": status.HTTP_200_OK,
+        "nextCursor": nextCursor
+      }
+      return OrjsonResponse(content=responseContent, status_code=status.HTTP_200_OK)
     seekers = await SeekerService.getSeekers(seekerCollection)
-    return ResponseSchema(message=seekers, code=status.HTTP_200_OK)
+    responseContent = {
+      "message": seekers,
+      "code": status.HTTP_200_OK
+    }
+    return OrjsonResponse(content=responseContent, status_code=status.HTTP_200_OK)
   except Exception as e:
     responseContent = {
       "message": f"Error - Not able to retrieve seekers: {str(e)}",
       "code": status.HTTP_500_INTERNAL_SERVER_ERROR
     }
-    return JSONResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    return OrjsonResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 # 2. ----- Get one seeker
 @seekerRouter.get("/{seekerCollection}/{filters}",
@@ -115,19 +195,19 @@ async def getSeekerByFilters(seekerCollection: str = seekerCollectionPath,
         "message": f"Seeker not found with {filters}",
         "code": status.HTTP_404_NOT_FOUND
       }
-      return JSONResponse(content=responseContent, status_code=status.HTTP_404_NOT_FOUND)
+      return OrjsonResponse(content=responseContent, status_code=status.HTTP_404_NOT_FOUND)
   except PyMongoError as e:
     responseContent = {
       "message": f"Database error: {str(e)}",
       "code": status.HTTP_500_INTERNAL_SERVER_ERROR
     }
-    return JSONResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    return OrjsonResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
   except Exception as e:
     responseContent = {
       "message": f"Error - Not able to retrieve job: {str(e)}",
       "code": status.HTTP_500_INTERNAL_SERVER_ERROR
     }
-    return JSONResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    return OrjsonResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 # 3. ----- Get one seeker by query
 @seekerRouter.get("/{seekerCollection}/list/{query}",
@@ -143,31 +223,35 @@ async def getSeekerByQuery(seekerCollection: str = seekerCollectionPath,
     query (str): The query to apply to the database query.
 
   Returns:
-    ResponseSchema: A response containing the seeker document and a status code.
+    OrjsonResponse: A response containing the seeker documents and a status code.
   """
   try:
     query = json.loads(query)
     seeker = await SeekerService.getListSeekerByQuery(seekerCollection, query)
     if seeker:
-      return ResponseSchema(message=seeker, code=status.HTTP_200_OK)
+      responseContent = {
+        "message": seeker,
+        "code": status.HTTP_200_OK
+      }
+      return OrjsonResponse(content=responseContent, status_code=status.HTTP_200_OK)
     else: # send a 404 response if the seeker is not found
       responseContent = {
         "message": f"Seeker not found with {query}",
         "code": status.HTTP_404_NOT_FOUND
       }
-      return JSONResponse(content=responseContent, status_code=status.HTTP_404_NOT_FOUND)
+      return OrjsonResponse(content=responseContent, status_code=status.HTTP_404_NOT_FOUND)
   except PyMongoError as e:
     responseContent = {
       "message": f"Database error: {str(e)}",
       "code": status.HTTP_500_INTERNAL_SERVER_ERROR
     }
-    return JSONResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    return OrjsonResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
   except Exception as e:
     responseContent = {
       "message": f"Error - Not able to retrieve job: {str(e)}",
       "code": status.HTTP_500_INTERNAL_SERVER_ERROR
     }
-    return JSONResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    return OrjsonResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
 # -------------------------------- Update
@@ -202,13 +286,13 @@ async def patchSeeker(seekerCollection: str = seekerCollectionPath, filters: str
         "message": f"Error - Either seeker do not exist or not updated {filters}",
         "code": status.HTTP_404_NOT_FOUND
       }
-      return JSONResponse(content=responseContent, status_code=status.HTTP_404_NOT_FOUND)
+      return OrjsonResponse(content=responseContent, status_code=status.HTTP_404_NOT_FOUND)
   except Exception as e:
     responseContent = {
       "message": f"Error - Not able to update seker: {str(e)}",
       "code": status.HTTP_500_INTERNAL_SERVER_ERROR
     }
-    return JSONResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    return OrjsonResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 # ------------------------------------ Delete
 @seekerRouter.delete("/{seekerCollection}/{filters}",
@@ -240,10 +324,10 @@ async def deleteSeeker(seekerCollection: str = seekerCollectionPath, filters: st
         "message": f"Error - Either seeker was not found or not deleted {filters}",
         "code": status.HTTP_500_INTERNAL_SERVER_ERROR
       }
-      return JSONResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+      return OrjsonResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
   except Exception as e:
     responseContent = {
       "message": f"Error - Unable to delete seeker: {str(e)}",
       "code": status.HTTP_500_INTERNAL_SERVER_ERROR
     }
-    return JSONResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    return OrjsonResponse(content=responseContent, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -28,7 +28,10 @@ from .seekerFilterSchema import SeekerFilterSchema
 from .jobInfoSchema import JobInfoSchema
 from .userProtectedSchema import UserProtectedSchema
 from .applicationSchema import ApplicationSchema
+from .batchRankingSchema import BatchRankingSchema
+from .bulkItemResultSchema import BulkItemResultSchema
 
 __all__ = [
     'ResponseSchema', 'SkillSchema', 'EducationSchema', 'PersonalInfoSchema',
-    'SeekerFilterSchema', 'JobInfoSchema', 'UserProtectedSchema', 'ApplicationSchema']
+    'SeekerFilterSchema', 'JobInfoSchema', 'UserProtectedSchema', 'ApplicationSchema',
+    'BatchRankingSchema', 'BulkItemResultSchema']
@@ -0,0 +1,52 @@
+# -*- config: utf-8 -*-
+"""
+File Name: batchRankingSchema.py
+Description: This script defines the request body of the batch job ranking
+ endpoint.
+Author: MathTeixeira
+Date: October 17, 2026
+Version: 3.0.0
+License: MIT License
+Contact Information: mathteixeira55
+"""
+
+### imports ###
+from typing import List
+from bson import ObjectId
+from pydantic import BaseModel, Field, model_validator
+
+# Largest number of seekers ranked in one request
+MAX_BATCH_SEEKERS = 500
+
+
+class BatchRankingSchema(BaseModel):
+  """
+  Request body to rank the jobs of many seekers in a single call.
+
+  Attributes:
+    userIds (List[str]): The user Ids of the seekers to rank jobs for, at most
+      MAX_BATCH_SEEKERS. Every id must be a valid ObjectId.
+    topJobs (int): The number of jobs to return for each seeker.
+  """
+  # userIds: { type: [String], required: true }
+  userIds: List[str] = Field(...,
+                             min_length=1,
+                             max_length=MAX_BATCH_SEEKERS,
+                             description="The user Ids of the seekers",
+                             json_schema_extra={"example": ["6733aec175eb0fba49f14363"]})
+  # topJobs: { type: Number, default: 10 }
+  topJobs: int = Field(10,
+                       ge=1,
+                       le=100,
+                       description="The number of jobs to return for each seeker",
+                       json_schema_extra={"example": 10})
+
+  @model_validator(mode='after')
+  def check_user_ids(self):
+    # One malformed id would make the query of the whole batch fail
+    invalid = [userId for userId in self.userIds if not ObjectId.is_valid(userId)]
+
+    if invalid:
+      raise ValueError(f'Invalid userIds: {", ".join(invalid)}')
+
+    return self
@@ -0,0 +1,38 @@
+# -*- config: utf-8 -*-
+"""
+File Name: bulkItemResultSchema.py
+Description: This script defines the outcome of one item of a bulk write
+ endpoint.
+Author: MathTeixeira
+Date: October 17, 2026
+Version: 3.0.0
+License: MIT License
+Contact Information: mathteixeira55
+"""
+
+### imports ###
+from pydantic import BaseModel, Field
+
+
+class BulkItemResultSchema(BaseModel):
+  """
+  Outcome of one item of a bulk request, reported in the order of the request.
+
+  Attributes:
+    index (int): The position of the item in the request body.
+    code (int): The status code of the item, as if it had been sent alone.
+    id (str | None): The id of the written document, None if it failed.
+    message (str | None): The reason of the failure, None if it succeeded.
+  """
+  index: int = Field(...,
+                     description="The position of the item in the request body",
+                     json_schema_extra={"example": 0})
+  code: int = Field(...,
+                    description="The status code of the item",
+                    json_schema_extra={"example": 201})
+  id: str | None = Field(None,
+                         description="The id of the written document",
+                         json_schema_extra={"example": "6735a696d6cff11d57b1d9b1"})
+  message: str | None = Field(None,
+                              description="The reason of the failure",
+                              json_schema_extra={"example": None})
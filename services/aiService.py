@@ -1,19 +1,470 @@
 # Import necessary libraries
+import json
+import logging
+import os
+import pickle
 import subprocess
 import sys
+import threading
+from functools import lru_cache
+import numpy as np
 import pandas as pd
+import scipy.sparse as sp
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from sklearn.preprocessing import normalize
 
-import spacy
-from spacy.matcher import PhraseMatcher
+from core.config import ai
+from utils import LruCache, RankingExecutor
 
-# Load default skills database
-from skillNer.general_params import SKILL_DB
+logger = logging.getLogger("uvicorn")
 
-# Import skill extractor
-from skillNer.skill_extractor_class import SkillExtractor
+# File names skillNer reads when general_params is first imported
+SKILL_DB_FILE = 'skill_db_relax_20.json'
+TOKEN_DIST_FILE = 'token_dist.json'
+
+# Seekers scored per sparse product by the batch ranking, so the dense-ish
+# (seekers x jobs) score block stays bounded whatever the batch size
+BATCH_CHUNK_SIZE = 64
+
+# Characters dropped from or turned into spaces in a skill name
+SKILL_NAME_TABLE = str.maketrans({'(': None, ')': None, ',': ' ', '/': ' ', '-': ' ', '.': ' '})
+
+
+@lru_cache(maxsize=ai.SKILL_NAME_CACHE_SIZE)
+def normalize_skill_name(text: str) -> str:
+    """
+    Function to normalise a skill name into a single token, e.g.
+    'Front-End (Web) Dev.' -> 'front_end_web_dev'. The same few thousand
+    names repeat across documents, so results are memoised
+    Parameters:
+        text: str, the raw skill name
+    Returns:
+        name: str, the lowercased name with words joined by underscores
+    """
+    return '_'.join(text.translate(SKILL_NAME_TABLE).lower().split())
+
+
+def skill_name_stats() -> dict:
+    """
+    Function to report the skill name memo in the shape of LruCache.stats
+    Returns:
+        stats: dict, the size, maximum size, ttl, hits, misses and hit rate
+    """
+    info = normalize_skill_name.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        'size': info.currsize,
+        'maxSize': info.maxsize,
+        'ttl': 0,
+        'hits': info.hits,
+        'misses': info.misses,
+        'hitRate': info.hits / lookups if lookups else 0.0
+    }
+
+
+def sparse_cosine_scores(matrix, query) -> np.ndarray:
+    """
+    Function to score every row of a TF-IDF matrix against a single query row.
+    TfidfVectorizer L2-normalises its rows, so the cosine similarity is a plain
+    sparse dot product and no dense copy of the matrix is ever built.
+    Parameters:
+        matrix: sparse matrix, the CSR TF-IDF matrix of the documents
+        query: sparse matrix, the 1 x n_features TF-IDF row of the query
+    Returns:
+        scores: ndarray, the cosine similarity of each document row
+    """
+    return (matrix @ query.T).toarray().ravel()
+
+
+def id_ranks(ids: list) -> np.ndarray:
+    """
+    Function to rank row ids once, so ties are broken on integers at query time
+    Parameters:
+        ids: list, the id of each row
+    Returns:
+        ranks: ndarray, the position of each row id in sorted order
+    """
+    order = sorted(range(len(ids)), key=lambda row: str(ids[row]))
+    ranks = np.empty(len(ids), dtype=np.intp)
+    ranks[order] = np.arange(len(ids))
+    return ranks
+
+
+def top_k_indices(scores: np.ndarray, k: int, offset: int=0, ranks: np.ndarray=None) -> np.ndarray:
+    """
+    Function to select the rows ranked offset..offset+k by descending score.
+    The cut-off score is found with a partition in O(n), so only the best
+    offset+k rows are sorted. Rows tied on score are ordered by rank (or by row
+    when no ranks are given) so pages are deterministic.
+    Parameters:
+        scores: ndarray, the score of each row
+        k: int, the number of rows to return
+        offset: int, the number of best rows to skip
+        ranks: ndarray, the tie-breaking rank of each row, see id_ranks
+    Returns:
+        indices: ndarray, the selected row indices, best first
+    """
+    n = scores.shape[0]
+    end = min(offset + k, n)
+    if k <= 0 or offset >= n:
+        return np.empty(0, dtype=np.intp)
+    ranks = np.arange(n) if ranks is None else ranks
+    if end < n:
+        cutoff = np.partition(scores, n - end)[n - end]
+        above = np.flatnonzero(scores > cutoff)
+        tied = np.flatnonzero(scores == cutoff)
+        # A query with few matches ties most rows at 0, so only the best
+        # ranked rows of the tie are kept, again with a partition
+        needed = end - above.size
+        if needed < tied.size:
+            tied = tied[np.argpartition(ranks[tied], needed - 1)[:needed]]
+        candidates = np.concatenate((above, tied))
+    else:
+        candidates = np.arange(n)
+    order = np.lexsort((ranks[candidates], -scores[candidates]))
+    return candidates[order][offset:end]
+
+
+def cached_feed(cache: LruCache, key: str, generation: int, page: tuple):
+    """
+    Function to read one page of a ranked feed. Feeds are cached per document
+    with the index generation they were computed on, so an older generation
+    is a miss and a write drops every page of the document with one pop
+    Parameters:
+        cache: LruCache, the ranked feed cache
+        key: str, the id of the document the feed was ranked for
+        generation: int, the current generation of the ranked index
+        page: tuple, the (k, offset) of the page
+    Returns:
+        pages: dict, the cached pages of the current generation, to extend
+        feed: tuple, the ranked ids of the page, or None on a miss
+    """
+    entry = cache.get(key)
+    pages = entry[1] if entry is not None and entry[0] == generation else {}
+    return pages, pages.get(page)
+
+
+def store_feed(cache: LruCache, key: str, generation: int, pages: dict, page: tuple, feed: list) -> None:
+    """
+    Function to cache one page of a ranked feed next to the pages read by cached_feed
+    Parameters:
+        cache: LruCache, the ranked feed cache
+        key: str, the id of the document the feed was ranked for
+        generation: int, the generation the feed was computed on
+        pages: dict, the pages returned by cached_feed
+        page: tuple, the (k, offset) of the page
+        feed: list, the ranked ids of the page
+    """
+    # Copy on write, the pages dict may be held by a concurrent reader
+    cache.put(key, (generation, {**pages, page: tuple(feed)}))
+
+
+class _VocabPickler(pickle.Pickler):
+    """
+    Pickler that writes a reference instead of the shared spaCy vocab, which
+    holds the word vectors and is already saved with the pipeline
+    """
+
+    def __init__(self, file, vocab):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.vocab = vocab
+
+    def persistent_id(self, obj):
+        return 'vocab' if obj is self.vocab else None
+
+
+class _VocabUnpickler(pickle.Unpickler):
+    """
+    Unpickler that resolves the vocab reference to the restored pipeline vocab
+    """
+
+    def __init__(self, file, vocab):
+        super().__init__(file)
+        self.vocab = vocab
+
+    def persistent_load(self, pid):
+        return self.vocab
+
+
+class SkillIndex:
+    """
+    Class to hold a long-lived TF-IDF index over the skills of a collection.
+    Writes are applied incrementally: new documents are appended as rows
+    vectorized with the fitted vocabulary, patched documents replace their row
+    and deleted documents are tombstoned. Once tombstones, or rows appended
+    since the last fit, pass compaction_threshold of the rows the index is
+    refitted in the background. Below min_fit_size live documents every write
+    refits the vocabulary, since a small vocabulary misses most new terms.
+
+    atributtes:
+        max_features: int, the maximum number of features of the vectorizer
+        compaction_threshold: float, the tombstone or appended row ratio that triggers a compaction
+        min_fit_size: int, the number of live documents below which every write refits
+        vectorizer: TfidfVectorizer, the vectorizer fitted on the collection
+        matrix: sparse matrix, one L2-normalised TF-IDF row per document
+        ids: list, the document id of each row of the matrix
+        alive: ndarray, False for tombstoned rows
+        ranks: ndarray, the tie-breaking rank of each row: the id order at the
+            last build, then write order for rows appended since
+        texts: list, the concatenated skills of each row, kept for refits
+        rows: dict, the row of each live document id
+        tombstones: int, the number of tombstoned rows
+        appended: int, the number of rows appended since the last fit
+        generation: int, bumped by every change of the rows, so cached rankings
+            computed on an older generation can be told apart
+
+    methods:
+        __init__(self, max_features: int=50000, compaction_threshold: float=0.25, min_fit_size: int=50) -> None
+        ready(self) -> bool
+        view(self) -> Tuple[TfidfVectorizer, csr_matrix, list, ndarray, ndarray]
+        subset_view(self, ids: list[str]) -> Tuple[TfidfVectorizer, csr_matrix, list, ndarray]
+        text_of(self, id: str) -> str | None
+        build(self, texts: list[str], ids: list[str]) -> None
+        transform(self, texts: list[str]) -> sparse matrix
+        upsert(self, id: str, text: str) -> None
+        remove(self, id: str) -> bool
+        compact(self) -> None
+        top_ids(self, scores: ndarray, k: int, offset: int=0, ids: list=None, alive: ndarray=None, ranks: ndarray=None) -> list
+    """
+
+    def __init__(self, max_features: int=50000, compaction_threshold: float=0.25,
+                 min_fit_size: int=50):
+        self.max_features = max_features
+        self.compaction_threshold = compaction_threshold
+        self.min_fit_size = min_fit_size
+        self.vectorizer = None
+        self.matrix = None
+        self.ids = []
+        self.alive = np.ones(0, dtype=bool)
+        self.ranks = np.empty(0, dtype=np.intp)
+        self.texts = []
+        self.rows = {}
+        self.tombstones = 0
+        self.appended = 0
+        self.generation = 0
+        self._lock = threading.RLock()
+        # Writes received while a background compaction is refitting
+        self._journal = None
+        # Bumped by every build, a compaction started before one is dropped
+        self._epoch = 0
+
+    @property
+    def ready(self) -> bool:
+        """
+        Whether the index has been built and holds at least one document
+        """
+        return self.matrix is not None
+
+    def view(self):
+        """
+        Function to read a consistent view of the index while writers may be active
+        Returns:
+            vectorizer: TfidfVectorizer, the fitted vectorizer
+            matrix: csr_matrix, the document matrix
+            ids: list, the document id of each row
+            alive: ndarray, False for tombstoned rows
+            ranks: ndarray, the tie-breaking rank of each row
+        """
+        with self._lock:
+            return self.vectorizer, self.matrix, self.ids, self.alive, self.ranks
+
+    def subset_view(self, ids: list[str]):
+        """
+        Function to read the live rows of some documents only
+        Parameters:
+            ids: list, the ids of the documents, unknown ids are skipped
+        Returns:
+            vectorizer: TfidfVectorizer, the fitted vectorizer
+            matrix: csr_matrix, the rows of the known documents
+            ids: list, the id of each returned row
+            ranks: ndarray, the tie-breaking rank of each returned row
+        """
+        with self._lock:
+            known = [id for id in dict.fromkeys(ids) if id in self.rows]
+            if self.matrix is None or not known:
+                return self.vectorizer, None, [], self.ranks[:0]
+            rows = [self.rows[id] for id in known]
+            return self.vectorizer, self.matrix[rows], known, self.ranks[rows]
+
+    def text_of(self, id: str) -> str | None:
+        """
+        Function to get the indexed skills text of a document
+        Parameters:
+            id: str, the id of the document
+        Returns:
+            text: str, the concatenated skills, or None if the document is not indexed
+        """
+        with self._lock:
+            row = self.rows.get(id)
+            return None if row is None else self.texts[row]
+
+    def build(self, texts: list[str], ids: list[str]) -> None:
+        """
+        Function to fit the vectorizer and the document matrix from scratch
+        Parameters:
+            texts: list, the concatenated skills of each document
+            ids: list, the id of each document, aligned with texts
+        """
+        vectorizer, matrix = self._fit(texts)
+        with self._lock:
+            # Swap everything at once so readers never see a half built index
+            self._swap(vectorizer, matrix, list(ids), list(texts))
+            self._epoch += 1
+
+    def transform(self, texts: list[str]):
+        """
+        Function to vectorize query texts with the fitted vocabulary
+        Parameters:
+            texts: list, the concatenated skills to vectorize
+        Returns:
+            matrix: sparse matrix, one L2-normalised TF-IDF row per text
+        """
+        return self.vectorizer.transform(texts)
+
+    def upsert(self, id: str, text: str) -> None:
+        """
+        Function to add a new document or replace the row of an existing one.
+        Terms outside the fitted vocabulary are ignored until the next compaction.
+        Parameters:
+            id: str, the id of the document
+            text: str, the concatenated skills of the document
+        """
+        with self._lock:
+            if self._journal is not None:
+                self._journal.append((id, text))
+            self._upsert(id, text)
+        self._maybe_compact()
+
+    def remove(self, id: str) -> bool:
+        """
+        Function to tombstone the row of a deleted document
+        Parameters:
+            id: str, the id of the document
+        Returns:
+            removed: bool, True if the document was indexed
+        """
+        with self._lock:
+            if self._journal is not None:
+                self._journal.append((id, None))
+            removed = self._tombstone(id)
+        self._maybe_compact()
+        return removed
+
+    def compact(self) -> None:
+        """
+        Function to drop the tombstoned rows and refit the vocabulary on the live
+        documents. The refit runs without the lock; writes received meanwhile are
+        journaled and replayed on the new index in the same critical section as
+        the swap, so no later write can be overwritten by the replay. The result
+        is dropped if build replaced the index during the refit.
+        """
+        with self._lock:
+            if self._journal is not None:
+                return
+            self._journal = []
+            epoch = self._epoch
+            live = sorted(self.rows.values())
+            ids = [self.ids[row] for row in live]
+            texts = [self.texts[row] for row in live]
+        try:
+            vectorizer, matrix = self._fit(texts)
+        except Exception as e:
+            logger.error(f"Error compacting skill index: {e}")
+            with self._lock:
+                self._journal = None
+            return
+        with self._lock:
+            journal, self._journal = self._journal, None
+            if epoch != self._epoch:
+                logger.info("Skill index rebuilt during compaction, compaction dropped")
+                return
+            self._swap(vectorizer, matrix, ids, texts)
+            for id, text in journal:
+                if text is None:
+                    self._tombstone(id)
+                else:
+                    self._upsert(id, text)
+        self._maybe_compact()
+        logger.info(f"Skill index compacted to {len(ids)} rows")
+
+    def top_ids(self, scores: np.ndarray, k: int, offset: int=0, ids: list=None,
+                alive: np.ndarray=None, ranks: np.ndarray=None) -> list:
+        """
+        Function to select the ids of the best live rows for a score vector
+        Parameters:
+            scores: ndarray, the score of each row of the matrix
+            k: int, the number of ids to return
+            offset: int, the number of best live rows to skip
+            ids: list, the ids of the view the scores were computed on
+            alive: ndarray, the tombstone mask of the same view
+            ranks: ndarray, the tie-breaking ranks of the same view
+        Returns:
+            top_ids: list, the ids of the selected rows, best first
+        """
+        ids = self.ids if ids is None else ids
+        alive = self.alive if alive is None else alive
+        ranks = self.ranks if ranks is None else ranks
+        # Tombstoned rows sink to the bottom and are dropped from short pages
+        scores = np.where(alive, scores, -np.inf)
+        return [ids[i] for i in top_k_indices(scores, k, offset, ranks) if alive[i]]
+
+    # --------------------------- Auxiliary Methods
+    def _fit(self, texts: list[str]):
+        if not texts:
+            return None, None
+        vectorizer = TfidfVectorizer(max_features=self.max_features)
+        return vectorizer, vectorizer.fit_transform(texts)
+
+    def _swap(self, vectorizer, matrix, ids: list, texts: list) -> None:
+        if matrix is None:
+            ids, texts = [], []
+        self.vectorizer, self.matrix, self.ids, self.texts = vectorizer, matrix, ids, texts
+        self.alive = np.ones(len(ids), dtype=bool)
+        self.ranks = id_ranks(ids)
+        self.rows = {id: row for row, id in enumerate(ids)}
+        self.tombstones = 0
+        self.appended = 0
+        self.generation += 1
+
+    def _upsert(self, id: str, text: str) -> None:
+        if not self.ready or len(self.rows) < self.min_fit_size:
+            live = [row for row in sorted(self.rows.values()) if self.ids[row] != id]
+            ids = [self.ids[row] for row in live] + [id]
+            texts = [self.texts[row] for row in live] + [text]
+            vectorizer, matrix = self._fit(texts)
+            self._swap(vectorizer, matrix, ids, texts)
+            return
+        self._tombstone(id)
+        row = self.vectorizer.transform([text])
+        self.matrix = sp.vstack([self.matrix, row], format='csr')
+        self.ids = self.ids + [id]
+        self.texts.append(text)
+        self.alive = np.append(self.alive, True)
+        # Appended rows rank after the built ones, in write order
+        self.ranks = np.append(self.ranks, len(self.ids) - 1)
+        self.rows[id] = len(self.ids) - 1
+        self.appended += 1
+        self.generation += 1
+
+    def _tombstone(self, id: str) -> bool:
+        row = self.rows.pop(id, None)
+        if row is None:
+            return False
+        # Copy on write so a view taken by a reader is never mutated
+        alive = self.alive.copy()
+        alive[row] = False
+        self.alive = alive
+        self.tombstones += 1
+        self.generation += 1
+        return True
+
+    def _maybe_compact(self) -> None:
+        with self._lock:
+            # Appended rows ignore the terms outside the fitted vocabulary
+            stale = max(self.tombstones, self.appended)
+            due = (self._journal is None and self.ids
+                   and stale / len(self.ids) > self.compaction_threshold)
+        if due:
+            threading.Thread(target=self.compact, daemon=True).start()
 
 
 class AIService:
@@ -22,30 +473,69 @@ class AIService:
 
     atributtes:
         _instance: 'AIService | None' = None
-        skill_extractor: SkillExtractor = None
+        ranking_only: bool, never load the NLP pipeline, extraction methods raise instead
+        skill_extractor: SkillExtractor, loaded with spaCy on first use
+        job_index: SkillIndex, the resident TF-IDF index of the jobs collection
+        seeker_index: SkillIndex, the resident TF-IDF index of the seekers collection, keyed by userId
+        job_records: LruCache, recently served Job models keyed by id
+        seeker_records: LruCache, recently served Seeker models keyed by userId
+        ranked_jobs: LruCache, (job index generation, ranked job ids keyed by (top_jobs, offset)) keyed by userId
+        ranked_seekers: LruCache, (seeker index generation, ranked userIds keyed by (top_candidates, offset)) keyed by jobId
+        executor: RankingExecutor, the pool the awaitable ranking methods run on
 
     methods:
-        __init__(self) -> None
+        __init__(self, ranking_only: bool=None) -> None
         getInstance(cls) -> 'AIService'
+        skill_extractor(self) -> SkillExtractor
+        save_skill_extractor(path: str) -> None
+        restore_skill_extractor(path: str) -> SkillExtractor
         install_spacy_model(model_name) -> None
         preprocess_text(text: str) -> str
+        extract_skills_from_text(text: str) -> str
         extract_skills(data) -> Tuple[list, list, list, list]
         clone_and_concatenate_skills(primary_hard_skills, primary_soft_skills, secondary_hard_skills, secondary_soft_skills, primary_multiplier=3, secondary_multiplier=1, hard_multiplier=2, soft_multiplier=1) -> str
         extract_and_concatenate_skills_without_weights(data: dict, primary_multiplier: int=3, secondary_multiplier: int=1, hard_multiplier: int=2, soft_multiplier: int=1) -> str
-        json_to_tfidf(self, job_list, max_features=50000) -> Tuple[pd.DataFrame, TfidfVectorizer]
-        get_top_jobs_for_candidate(seeker: dict, listJobs: list[dict], top_jobs: int=10) -> list[dict]
-        get_top_candidates_for_job(job: dict, candidates_json: list, top_candidates=10) -> list
+        build_skills_extracted(data: dict) -> str | None
+        json_to_tfidf(self, job_list, max_features=50000, as_dataframe=False) -> Tuple[csr_matrix | pd.DataFrame, TfidfVectorizer]
+        build_job_index(listJobs: list[dict]) -> None
+        index_job(job: dict) -> None
+        indexed_job(jobId: str) -> dict | None
+        remove_job(jobId: str) -> None
+        invalidate_job(jobId: str) -> None
+        get_top_jobs_for_candidate(seeker: dict, listJobs: list[dict]=None, top_jobs: int=10, offset: int=0) -> list[dict]
+        get_top_jobs_for_candidates(seekers: list[dict], top_jobs: int=10, offset: int=0) -> dict[str, list]
+        build_seeker_index(listSeekers: list[dict]) -> None
+        index_seeker(seeker: dict) -> None
+        indexed_seeker(userId: str) -> dict | None
+        remove_seeker(userId: str) -> None
+        invalidate_seeker(userId: str) -> None
+        cache_stats() -> dict[str, dict]
+        get_top_candidates_for_job(job: dict, candidates_json: list=None, top_candidates=10, offset=0, among: list=None) -> list
+        get_top_jobs_for_candidate_async(...) -> list, awaitable, runs on the executor
+        get_top_jobs_for_candidates_async(...) -> dict[str, list], awaitable, runs on the executor
+        get_top_candidates_for_job_async(...) -> list, awaitable, runs on the executor
     """
 
     _instance: 'AIService | None' = None
 
-    def __init__(self):
-        # Install spaCy model
-        AIService.install_spacy_model("en_core_web_lg")
-        # Initialize parameters of skill extractor
-        nlp = spacy.load("en_core_web_lg")
-        # Initialize skill extractor
-        self.skill_extractor = SkillExtractor(nlp, SKILL_DB, PhraseMatcher)
+    def __init__(self, ranking_only: bool=None):
+        # The TF-IDF ranking never needs spaCy, the skill extractor is loaded on first use
+        self.ranking_only = ai.RANKING_ONLY if ranking_only is None else ranking_only
+        self._skill_extractor = None
+        self._skill_extractor_lock = threading.Lock()
+        # Resident ranking indexes, built once at startup
+        self.job_index = SkillIndex(compaction_threshold=ai.INDEX_COMPACTION_THRESHOLD,
+                                    min_fit_size=ai.INDEX_MIN_FIT_SIZE)
+        self.seeker_index = SkillIndex(compaction_threshold=ai.INDEX_COMPACTION_THRESHOLD,
+                                       min_fit_size=ai.INDEX_MIN_FIT_SIZE)
+        # Documents of ranked results, so rankings are answered without a second query
+        self.job_records = LruCache(ai.RECORD_CACHE_SIZE, ai.RECORD_CACHE_TTL)
+        self.seeker_records = LruCache(ai.RECORD_CACHE_SIZE, ai.RECORD_CACHE_TTL)
+        # Ranked feeds, stored with the index generation they were computed on
+        self.ranked_jobs = LruCache(ai.RANKING_CACHE_SIZE, ai.RANKING_CACHE_TTL)
+        self.ranked_seekers = LruCache(ai.RANKING_CACHE_SIZE, ai.RANKING_CACHE_TTL)
+        # Ranking is CPU-bound, the routers await it on this pool instead of the event loop
+        self.executor = RankingExecutor(ai.EXECUTOR, ai.EXECUTOR_WORKERS, ai.EXECUTOR_QUEUE)
 
     @classmethod
     def getInstance(cls) -> 'AIService':
@@ -60,14 +550,16 @@ class AIService:
         return cls._instance
 
 
-    def json_to_tfidf(self, job_list, max_features=50000):
+    def json_to_tfidf(self, job_list, max_features=50000, as_dataframe=False):
         """
         Function to convert a list of job descriptions in JSON format to a TF-IDF matrix
         Parameters:
             job_list: list, the list of job descriptions in JSON format
             max_features: int, the maximum number of features to consider in the TF-IDF vectorizer
+            as_dataframe: bool, return a dense DataFrame instead of the sparse matrix.
+                Debug only, the dense copy grows with jobs x features
         Returns:
-            tfidf_df: DataFrame, the TF-IDF matrix in DataFrame format
+            tfidf_matrix: csr_matrix, the TF-IDF matrix (DataFrame if as_dataframe)
             vectorizer: TfidfVectorizer, the fitted TfidfVectorizer object
         """
         # Initialize the TfidfVectorizer
@@ -84,61 +576,451 @@ class AIService:
         # Fit and transform the skills_list
         tfidf_matrix = vectorizer.fit_transform(skills_list)
 
-        # Convert the TF-IDF matrix to a DataFrame for better readability
-        tfidf_df = pd.DataFrame(tfidf_matrix.toarray(), columns=vectorizer.get_feature_names_out())
+        if as_dataframe:
+            # Convert the TF-IDF matrix to a DataFrame for better readability
+            tfidf_df = pd.DataFrame(tfidf_matrix.toarray(), columns=vectorizer.get_feature_names_out())
+            return tfidf_df, vectorizer
 
-        return tfidf_df, vectorizer
+        return tfidf_matrix, vectorizer
+
+    def build_job_index(self, listJobs: list[dict], id_field: str = 'id') -> None:
+        """
+        Function to (re)build the resident job index used by the ranking methods
+        Parameters:
+            listJobs: list, the list of job descriptions in JSON format
+            id_field: str, the field holding the job id, '_id' for raw documents
+        """
+        texts, ids = self.collect_skills(listJobs, id_field)
+        self.job_index.build(texts, ids)
+        logger.info(f"Job index built with {len(ids)} jobs")
+
+    def index_job(self, job: dict) -> None:
+        """
+        Function to add a created job to the job index, or replace its row after a patch
+        Parameters:
+            job: dict, the job document in JSON format
+        """
+        self.index_document(self.job_index, job, 'id')
+        self.invalidate_job(job.get('id'))
+
+    def indexed_job(self, jobId: str) -> dict | None:
+        """
+        Function to get the skills of a job from the job index instead of the database
+        Parameters:
+            jobId: str, the id of the job
+        Returns:
+            job: dict, the job id and its 'skills_extracted', or None if the job is not indexed
+        """
+        text = self.job_index.text_of(str(jobId))
+        return None if text is None else {'id': str(jobId), 'skills_extracted': text}
+
+    def remove_job(self, jobId: str) -> None:
+        """
+        Function to tombstone a deleted job in the job index
+        Parameters:
+            jobId: str, the id of the deleted job
+        """
+        self.job_index.remove(str(jobId))
+        self.invalidate_job(jobId)
+
+    def invalidate_job(self, jobId: str) -> None:
+        """
+        Function to drop the cached seeker rankings of a job after it was written.
+        Feeds of other jobs stay valid until the seeker index changes
+        Parameters:
+            jobId: str, the id of the job
+        """
+        self.ranked_seekers.pop(str(jobId))
 
     def get_top_jobs_for_candidate(self,
                                    seeker: dict,
-                                   listJobs: list[dict],
-                                   top_jobs: int=10) -> list[dict]:
+                                   listJobs: list[dict]=None,
+                                   top_jobs: int=10,
+                                   offset: int=0) -> list[dict]:
         """
         Function to get the top 10 job IDs for a given candidate skills
         Parameters:
             seekers: dict, the skills of the candidate
-            listJobs: list, the list of job descriptions in JSON format
+            listJobs: list, the list of job descriptions in JSON format. When
+                omitted the resident job index is used instead
             top_jobs: int, the number of top jobs to return
+            offset: int, the number of best jobs to skip, for deeper pages
         Returns:
             top10_jobs_ids: list, the list of top 10 job IDs
         """
-        extracted_seeker_skills = self.extract_and_concatenate_skills_without_weights(seeker)
-        job_tfidf_df, vectorizer = self.json_to_tfidf(listJobs)
+        if listJobs is None:
+            # Read the generation before the view, a concurrent write then only makes the entry stale
+            generation, page = self.job_index.generation, (top_jobs, offset)
+            pages, cached = {}, None
+            if 'userId' in seeker:
+                pages, cached = cached_feed(self.ranked_jobs, str(seeker['userId']), generation, page)
+            if cached is not None:
+                return list(cached)
+            extracted_seeker_skills = seeker.get('skills_extracted') or self.extract_and_concatenate_skills_without_weights(seeker)
+            vectorizer, matrix, ids, alive, ranks = self.job_index.view()
+            if matrix is None:
+                return []
+            seeker_skills_tfidf = vectorizer.transform([extracted_seeker_skills])
+            cosine_similarities = sparse_cosine_scores(matrix, seeker_skills_tfidf)
+            top_jobs_ids = self.job_index.top_ids(cosine_similarities, top_jobs, offset, ids, alive, ranks)
+            if 'userId' in seeker:
+                store_feed(self.ranked_jobs, str(seeker['userId']), generation, pages, page, top_jobs_ids)
+            return top_jobs_ids
+
+        extracted_seeker_skills = seeker.get('skills_extracted') or self.extract_and_concatenate_skills_without_weights(seeker)
+
+        job_tfidf_matrix, vectorizer = self.json_to_tfidf(listJobs)
         seeker_skills_tfidf = vectorizer.transform([extracted_seeker_skills])
         # Compute cosine similarity between the seeker skills and job descriptions
-        cosine_similarities = cosine_similarity(seeker_skills_tfidf, job_tfidf_df).flatten()
+        cosine_similarities = sparse_cosine_scores(job_tfidf_matrix, seeker_skills_tfidf)
         # Get the indices of the top most similar job descriptions
-        top10_jobs_indices = cosine_similarities.argsort()[-top_jobs:][::-1]
+        job_ids = [job['id'] for job in listJobs]
+        top10_jobs_indices = top_k_indices(cosine_similarities, top_jobs, offset, id_ranks(job_ids))
         # Get the corresponding job IDs
-        top10_jobs_ids = [listJobs[i]['id'] for i in top10_jobs_indices]
+        top10_jobs_ids = [job_ids[i] for i in top10_jobs_indices]
 
         return top10_jobs_ids
 
+    def get_top_jobs_for_candidates(self,
+                                    seekers: list[dict],
+                                    top_jobs: int=10,
+                                    offset: int=0) -> dict[str, list]:
+        """
+        Function to get the top job IDs of many candidates at once. All seekers
+        are vectorized into one query matrix and scored against the resident
+        job index BATCH_CHUNK_SIZE seekers per sparse-sparse multiply.
+        Parameters:
+            seekers: list, the list of candidate profiles in JSON format
+            top_jobs: int, the number of top jobs to return per candidate
+            offset: int, the number of best jobs to skip, for deeper pages
+        Returns:
+            top_jobs_ids: dict, the list of top job IDs keyed by candidate userId.
+                Candidates without skills get an empty list
+        """
+        top_jobs_ids = {str(seeker['userId']): [] for seeker in seekers}
+        texts, user_ids = self.collect_skills(seekers, 'userId')
+        vectorizer, matrix, ids, alive, ranks = self.job_index.view()
+        if not texts or matrix is None:
+            return top_jobs_ids
+
+        seekers_tfidf = vectorizer.transform(texts)
+        for start in range(0, len(user_ids), BATCH_CHUNK_SIZE):
+            # One (chunk x jobs) product instead of one query per seeker
+            scores = (seekers_tfidf[start:start + BATCH_CHUNK_SIZE] @ matrix.T).toarray()
+            for row, user_id in enumerate(user_ids[start:start + BATCH_CHUNK_SIZE]):
+                top_jobs_ids[user_id] = self.job_index.top_ids(scores[row], top_jobs, offset, ids, alive, ranks)
+
+        return top_jobs_ids
+
+    def build_seeker_index(self, listSeekers: list[dict]) -> None:
+        """
+        Function to (re)build the resident seeker index, keyed by userId
+        Parameters:
+            listSeekers: list, the list of candidate profiles in JSON format
+        """
+        texts, ids = self.collect_skills(listSeekers, 'userId')
+        self.seeker_index.build(texts, ids)
+        logger.info(f"Seeker index built with {len(ids)} seekers")
+
+    def index_seeker(self, seeker: dict) -> None:
+        """
+        Function to add a created seeker to the seeker index, or replace its row after a patch
+        Parameters:
+            seeker: dict, the candidate profile in JSON format
+        """
+        self.index_document(self.seeker_index, seeker, 'userId')
+        self.invalidate_seeker(seeker.get('userId'))
+
+    def indexed_seeker(self, userId: str) -> dict | None:
+        """
+        Function to get the skills of a seeker from the seeker index instead of the database
+        Parameters:
+            userId: str, the userId of the seeker
+        Returns:
+            seeker: dict, the userId and its 'skills_extracted', or None if the seeker is not indexed
+        """
+        text = self.seeker_index.text_of(str(userId))
+        return None if text is None else {'userId': str(userId), 'skills_extracted': text}
+
+    def remove_seeker(self, userId: str) -> None:
+        """
+        Function to tombstone a deleted seeker in the seeker index
+        Parameters:
+            userId: str, the userId of the deleted seeker
+        """
+        self.seeker_index.remove(str(userId))
+        self.invalidate_seeker(userId)
+
+    def invalidate_seeker(self, userId: str) -> None:
+        """
+        Function to drop the cached job feed of a seeker after its profile was written.
+        Feeds of other seekers stay valid until the job index changes
+        Parameters:
+            userId: str, the userId of the seeker
+        """
+        self.ranked_jobs.pop(str(userId))
+
+    def cache_stats(self) -> dict[str, dict]:
+        """
+        Function to report the size and hit rate of the ranking caches, to size them
+        Returns:
+            stats: dict, the statistics of each cache keyed by cache name
+        """
+        return {
+            'rankedJobs': self.ranked_jobs.stats(),
+            'rankedSeekers': self.ranked_seekers.stats(),
+            'jobRecords': self.job_records.stats(),
+            'seekerRecords': self.seeker_records.stats(),
+            'skillNames': skill_name_stats()
+        }
+
     def get_top_candidates_for_job(self, job: dict,
-                                   candidates_json: list,
-                                   top_candidates=10) -> list:
+                                   candidates_json: list=None,
+                                   top_candidates=10,
+                                   offset=0,
+                                   among: list=None) -> list:
         """
         Function to get the top 10 candidate IDs for a given job skills
         Parameters:
             job_skills: dict, the skills of the job
-            candidates_json: list, the list of candidate profiles in JSON format
+            candidates_json: list, the list of candidate profiles in JSON format.
+                When omitted the resident seeker index is used instead
             top_candidates: int, the number of top candidates to return
+            offset: int, the number of best candidates to skip, for deeper pages
+            among: list, restrict the resident seeker index to these userIds
         Returns:
             top10_candidates_ids: list, the list of top 10 candidate IDs
         """
-        extracted_job_skills = self.extract_and_concatenate_skills_without_weights(job)
-        candidate_tfidf_df, vectorizer = self.json_to_tfidf(candidates_json)
+        if candidates_json is None and among is None:
+            # Read the generation before the view, a concurrent write then only makes the entry stale
+            generation, page = self.seeker_index.generation, (top_candidates, offset)
+            pages, cached = {}, None
+            if 'id' in job:
+                pages, cached = cached_feed(self.ranked_seekers, str(job['id']), generation, page)
+            if cached is not None:
+                return list(cached)
+        extracted_job_skills = job.get('skills_extracted') or self.extract_and_concatenate_skills_without_weights(job)
+        if candidates_json is None and among is not None:
+            vectorizer, matrix, ids, ranks = self.seeker_index.subset_view([str(id) for id in among])
+            if matrix is None:
+                return []
+            job_skills_tfidf = vectorizer.transform([extracted_job_skills])
+            cosine_similarities = sparse_cosine_scores(matrix, job_skills_tfidf)
+            return [ids[i] for i in top_k_indices(cosine_similarities, top_candidates, offset, ranks)]
+        if candidates_json is None:
+            vectorizer, matrix, ids, alive, ranks = self.seeker_index.view()
+            if matrix is None:
+                return []
+            job_skills_tfidf = vectorizer.transform([extracted_job_skills])
+            cosine_similarities = sparse_cosine_scores(matrix, job_skills_tfidf)
+            top_candidates_ids = self.seeker_index.top_ids(cosine_similarities, top_candidates, offset, ids, alive, ranks)
+            if 'id' in job:
+                store_feed(self.ranked_seekers, str(job['id']), generation, pages, page, top_candidates_ids)
+            return top_candidates_ids
+
+        candidate_tfidf_matrix, vectorizer = self.json_to_tfidf(candidates_json)
         job_skills_tfidf = vectorizer.transform([extracted_job_skills])
         # Compute cosine similarity between the job skills and candidate profiles
-        cosine_similarities = cosine_similarity(job_skills_tfidf, candidate_tfidf_df).flatten()
+        cosine_similarities = sparse_cosine_scores(candidate_tfidf_matrix, job_skills_tfidf)
         # Get the indices of the top most similar candidate profiles
-        top10_candidates_indices = cosine_similarities.argsort()[-top_candidates:][::-1]
+        candidate_ids = [candidate['userId'] for candidate in candidates_json]
+        top10_candidates_indices = top_k_indices(cosine_similarities, top_candidates, offset, id_ranks(candidate_ids))
         # Get the corresponding candidate IDs
-        top10_candidates_ids = [candidates_json[i]['userId'] for i in top10_candidates_indices]
+        top10_candidates_ids = [candidate_ids[i] for i in top10_candidates_indices]
 
         return top10_candidates_ids
 
+    async def get_top_jobs_for_candidate_async(self,
+                                               seeker: dict,
+                                               listJobs: list[dict]=None,
+                                               top_jobs: int=10,
+                                               offset: int=0) -> list:
+        """
+        Function to await get_top_jobs_for_candidate on the ranking executor.
+        Rankings over a provided job list may run on the process pool, rankings
+        over the resident job index always run on a thread
+        Raises:
+            RankingQueueFullError: if the ranking queue is full
+        """
+        if listJobs is not None:
+            return await self.executor.run(_run_in_process, 'get_top_jobs_for_candidate',
+                                           seeker, listJobs, top_jobs, offset, isolated=True)
+        return await self.executor.run(self.get_top_jobs_for_candidate,
+                                       seeker, None, top_jobs, offset)
+
+    async def get_top_jobs_for_candidates_async(self,
+                                                seekers: list[dict],
+                                                top_jobs: int=10,
+                                                offset: int=0) -> dict[str, list]:
+        """
+        Function to await get_top_jobs_for_candidates on the ranking executor,
+        always on a thread since it ranks over the resident job index
+        Raises:
+            RankingQueueFullError: if the ranking queue is full
+        """
+        return await self.executor.run(self.get_top_jobs_for_candidates,
+                                       seekers, top_jobs, offset)
+
+    async def get_top_candidates_for_job_async(self, job: dict,
+                                               candidates_json: list=None,
+                                               top_candidates=10,
+                                               offset=0,
+                                               among: list=None) -> list:
+        """
+        Function to await get_top_candidates_for_job on the ranking executor.
+        Rankings over a provided candidate list may run on the process pool,
+        rankings over the resident seeker index always run on a thread
+        Raises:
+            RankingQueueFullError: if the ranking queue is full
+        """
+        if candidates_json is not None:
+            return await self.executor.run(_run_in_process, 'get_top_candidates_for_job',
+                                           job, candidates_json, top_candidates, offset,
+                                           isolated=True)
+        return await self.executor.run(self.get_top_candidates_for_job,
+                                       job, None, top_candidates, offset, among)
+
     # --------------------------- Auxiliary Methods
+    @property
+    def skill_extractor(self):
+        """
+        The skillNer extractor, loaded with its spaCy model on first use
+        Returns:
+            skill_extractor: SkillExtractor, the shared skill extractor
+        Raises:
+            RuntimeError: if the service runs in ranking-only mode
+        """
+        if self._skill_extractor is None:
+            if self.ranking_only:
+                raise RuntimeError("Skill extraction is disabled in ranking-only mode (AI_RANKING_ONLY)")
+            with self._skill_extractor_lock:
+                if self._skill_extractor is None:
+                    self._skill_extractor = self._load_skill_extractor()
+        return self._skill_extractor
+
+    @staticmethod
+    def _load_skill_extractor():
+        artifact = ai.SKILL_EXTRACTOR_ARTIFACT
+        if artifact and os.path.isfile(os.path.join(artifact, 'meta.json')):
+            try:
+                return AIService.restore_skill_extractor(artifact)
+            except Exception as e:
+                logger.warning(f"Rebuilding the skill extractor, artifact {artifact} is not usable: {e}")
+        return AIService._build_skill_extractor()
+
+    @staticmethod
+    def _build_skill_extractor():
+        # Imported here, skillNer loads its skills database when imported
+        import spacy
+        from spacy.matcher import PhraseMatcher
+        from skillNer.general_params import SKILL_DB
+        from skillNer.skill_extractor_class import SkillExtractor
+
+        AIService.install_spacy_model(ai.SPACY_MODEL)
+        nlp = spacy.load(ai.SPACY_MODEL)
+        logger.info(f"Skill extractor built with spaCy model {ai.SPACY_MODEL}")
+        return SkillExtractor(nlp, SKILL_DB, PhraseMatcher)
+
+    @staticmethod
+    def save_skill_extractor(path: str) -> None:
+        """
+        Function to build the skill extractor and write it to an artifact directory:
+        the spaCy pipeline, the skillNer databases and the compiled phrase matchers
+        Parameters:
+            path: str, the artifact directory, created if missing
+        """
+        from skillNer.general_params import TOKEN_DIST
+
+        skill_extractor = AIService._build_skill_extractor()
+        os.makedirs(path, exist_ok=True)
+        skill_extractor.nlp.to_disk(os.path.join(path, 'nlp'))
+        with open(os.path.join(path, SKILL_DB_FILE), 'w') as file:
+            json.dump(skill_extractor.skills_db, file)
+        with open(os.path.join(path, TOKEN_DIST_FILE), 'w') as file:
+            json.dump(TOKEN_DIST, file)
+        with open(os.path.join(path, 'matchers.pkl'), 'wb') as file:
+            _VocabPickler(file, skill_extractor.nlp.vocab).dump(skill_extractor.matchers)
+        # Written last, an artifact without meta.json is never loaded
+        with open(os.path.join(path, 'meta.json'), 'w') as file:
+            json.dump(AIService._artifact_meta(), file)
+        logger.info(f"Skill extractor saved to {path}")
+
+    @staticmethod
+    def restore_skill_extractor(path: str):
+        """
+        Function to restore the skill extractor written by save_skill_extractor,
+        without network access nor recompiling the phrase matchers
+        Parameters:
+            path: str, the artifact directory
+        Returns:
+            skill_extractor: SkillExtractor, the restored skill extractor
+        Raises:
+            ValueError: if the artifact was built for another model, spaCy or skillNer version
+        """
+        import spacy
+        from spacy.matcher import PhraseMatcher
+
+        path = os.path.abspath(path)
+        with open(os.path.join(path, 'meta.json')) as file:
+            meta = json.load(file)
+        if meta != AIService._artifact_meta():
+            raise ValueError(f"artifact built for {meta}")
+
+        AIService._import_skillner_params(path)
+        from skillNer.skill_extractor_class import SkillExtractor
+        from skillNer.matcher_class import SkillsGetter
+        from skillNer.utils import Utils
+
+        nlp = spacy.load(os.path.join(path, 'nlp'))
+        with open(os.path.join(path, SKILL_DB_FILE)) as file:
+            skills_db = json.load(file)
+        with open(os.path.join(path, 'matchers.pkl'), 'rb') as file:
+            matchers = _VocabUnpickler(file, nlp.vocab).load()
+
+        # Same state as SkillExtractor.__init__ of the pinned skillNer, minus compiling the matchers
+        skill_extractor = SkillExtractor.__new__(SkillExtractor)
+        skill_extractor.tranlsator_func = False
+        skill_extractor.nlp = nlp
+        skill_extractor.skills_db = skills_db
+        skill_extractor.phraseMatcher = PhraseMatcher
+        skill_extractor.matchers = matchers
+        skill_extractor.skill_getters = SkillsGetter(nlp)
+        skill_extractor.utils = Utils(nlp, skills_db)
+        logger.info(f"Skill extractor restored from {path}")
+        return skill_extractor
+
+    @staticmethod
+    def _artifact_meta() -> dict:
+        import spacy
+        from importlib.metadata import version
+
+        # The restore rebuilds SkillExtractor by hand, so it is tied to the skillNer release
+        return {'spacyModel': ai.SPACY_MODEL, 'spacyVersion': spacy.__version__,
+                'skillNerVersion': version('skillNer')}
+
+    @staticmethod
+    def _import_skillner_params(path: str) -> None:
+        # skillNer opens its databases with paths relative to the working
+        # directory when general_params is first imported, and downloads them
+        # if missing. Run that module with an open() resolving them in the
+        # artifact, rather than changing the directory of the whole process
+        import importlib.util
+
+        name = 'skillNer.general_params'
+        if name in sys.modules:
+            return
+        spec = importlib.util.find_spec(name)
+        module = importlib.util.module_from_spec(spec)
+        files = {SKILL_DB_FILE, TOKEN_DIST_FILE}
+        module.open = lambda file, *args, **kwargs: open(
+            os.path.join(path, file) if file in files else file, *args, **kwargs)
+        sys.modules[name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[name]
+            raise
+
     @staticmethod
     def install_spacy_model(model_name):
         """
@@ -146,25 +1028,82 @@ class AIService:
         Parameters:
             model_name: str, the name of the spaCy model to install
         """
-        try:
-            spacy.load(model_name)
-        except OSError:
+        import spacy
+
+        # Check the installed packages instead of loading the model twice
+        if not spacy.util.is_package(model_name):
             subprocess.check_call(
                 [sys.executable, "-m", "spacy", "download", model_name])
 
     def preprocess_text(self, text: str) -> str:
-        # Remove any unwanted characters or extra spaces
-        text = text.replace('(', '').replace(')', '').replace(',', ' ').replace('/', ' ').replace('-', ' ').replace('.', ' ')
-        text = ' '.join(text.split())
-        # Lowercase
-        text = text.lower()
-        # Replace space with underscore
-        text = text.replace(' ', '_')
-        return text
+        # One translate pass, memoised per raw name
+        return normalize_skill_name(text)
+
+    def extract_skills_from_text(self, text: str) -> str:
+        """
+        Function to extract skills from free text, e.g. a resume or a job description.
+        The first call loads the spaCy pipeline
+        Parameters:
+            text: str, the text from which to extract skills
+        Returns:
+            skills: str, the distinct extracted skills separated by spaces
+        """
+        annotations = self.skill_extractor.annotate(text)
+        results = annotations.get('results', {})
+        skills_list = [skill['doc_node_value']
+                       for match in ('full_matches', 'ngram_scored')
+                       for skill in results.get(match, [])]
+        # Remove duplicates, keeping the first occurrence
+        return ' '.join(self.preprocess_text(skill) for skill in dict.fromkeys(skills_list))
+
+    def collect_skills(self, items: list[dict], id_field: str) -> tuple[list[str], list[str]]:
+        """
+        Function to build the concatenated skills of every document of a collection.
+        Documents without any skill are skipped since they can never be ranked.
+        Parameters:
+            items: list, the list of documents in JSON format
+            id_field: str, the field holding the id reported for each document
+        Returns:
+            texts: list, the concatenated skills of each kept document
+            ids: list, the id of each kept document
+        """
+        texts = []
+        ids = []
+        for item in items:
+            try:
+                if 'skills_extracted' in item:
+                    texts.append(item['skills_extracted'])
+                else:
+                    texts.append(self.extract_and_concatenate_skills_without_weights(item))
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Skipping document {item.get(id_field)} in index: {e}")
+                continue
+            ids.append(str(item[id_field]))
+        return texts, ids
+
+    def index_document(self, index: SkillIndex, item: dict, id_field: str) -> None:
+        """
+        Function to upsert one document in a resident index. A document left
+        without skills is removed, since it can no longer be ranked. Index
+        failures are logged and never propagated to the write that triggered them.
+        Parameters:
+            index: SkillIndex, the index to update
+            item: dict, the document in JSON format
+            id_field: str, the field holding the id of the document
+        """
+        try:
+            texts, ids = self.collect_skills([item], id_field)
+            if texts:
+                index.upsert(ids[0], texts[0])
+            else:
+                index.remove(str(item[id_field]))
+        except Exception as e:
+            logger.error(f"Error updating skill index: {e}")
 
     def extract_skills(self, data):
         """
-        Function to extract skills from the given data model.
+        Function to extract skills from the given data model. The data is only
+        read, so read-only documents such as RawBSONDocument are accepted.
         Parameters:
             data: dict, the data model containing job information and skills
         Returns:
@@ -181,26 +1120,22 @@ class AIService:
         # Extract primary hard skills
         if 'primarySkills' in data and 'technicalSkills' in data['primarySkills']:
             for skill in data['primarySkills']['technicalSkills']:
-                skill['skillName'] = self.preprocess_text(skill['skillName'])
-                primary_hard_skills.append(skill['skillName'])
+                primary_hard_skills.append(self.preprocess_text(skill['skillName']))
 
         # Extract primary soft skills
         if 'primarySkills' in data and 'transferableSkills' in data['primarySkills']:
             for skill in data['primarySkills']['transferableSkills']:
-                skill['skillName'] = self.preprocess_text(skill['skillName'])
-                primary_soft_skills.append(skill['skillName'])
+                primary_soft_skills.append(self.preprocess_text(skill['skillName']))
 
         # Extract secondary hard skills
         if 'secondarySkills' in data and 'technicalSkills' in data['secondarySkills']:
             for skill in data['secondarySkills']['technicalSkills']:
-                skill['skillName'] = self.preprocess_text(skill['skillName'])
-                secondary_hard_skills.append(skill['skillName'])
+                secondary_hard_skills.append(self.preprocess_text(skill['skillName']))
 
         # Extract secondary soft skills
         if 'secondarySkills' in data and 'transferableSkills' in data['secondarySkills']:
             for skill in data['secondarySkills']['transferableSkills']:
-                skill['skillName'] = self.preprocess_text(skill['skillName'])
-                secondary_soft_skills.append(skill['skillName'])
+                secondary_soft_skills.append(self.preprocess_text(skill['skillName']))
 
         return primary_hard_skills, primary_soft_skills, secondary_hard_skills, secondary_soft_skills
 
@@ -280,6 +1215,38 @@ class AIService:
         except Exception as e:
             raise e
 
+    def build_skills_extracted(self, data: dict) -> str | None:
+        """
+        Function to compute the weighted skills text persisted as 'skills_extracted'
+        at write time, so the ranking path never re-normalises stored skills.
+        Parameters:
+            data: dict, the job or candidate document in JSON format
+        Returns:
+            skills_extracted: str, the concatenated skills, or None if the document has none
+        """
+        # extract_skills only reads the document, no copy is needed
+        skills = {key: data[key] for key in ('primarySkills', 'secondarySkills') if key in data}
+        try:
+            return self.extract_and_concatenate_skills_without_weights(skills)
+        except (ValueError, TypeError):
+            return None
+
 # Alias for NoSqlConnection.getInstance
 # This alias allows for easier access to the NoSqlDatabase singleton instance.
 getAIService = AIService.getInstance
+
+
+def _run_in_process(method: str, *args):
+    """
+    Function to run a ranking method on the AIService of the current process,
+    the entry point of the process pool. Only rankings over their own document
+    lists are sent here. The resident indexes of the parent are not shared,
+    since every worker would need each upsert and compaction replayed
+    Parameters:
+        method: str, the name of the AIService method
+        args: the positional arguments of the method
+    Returns:
+        result: the result of the method
+    """
+    return getattr(getAIService(), method)(*args)
+
@@ -9,18 +9,27 @@ License: MIT License
 Contact Information: mathteixeira55
 """
 from bson import ObjectId
-from core.database import getNoSqlConn
+from fastapi import status
+from core.database import getAsyncNoSqlConn
 from core.config import noSql
 
-from schemas import ApplicationSchema
+from enums import WriteModeEnum
+from schemas import ApplicationSchema, BulkItemResultSchema
 
-from models import Job
-from models import Seeker
+from .aiService import getAIService
 
 import logging
 
 logger = logging.getLogger("uvicorn")
 
+# Status array of each application status
+STATUS_FIELDS = {
+  "apply": "status.applied",
+  "reject": "status.rejected",
+  "accept": "status.accepted",
+  "decline": "status.declined"
+}
+
 
 class ApplicationService:
   """
@@ -32,13 +41,15 @@ class ApplicationService:
 
 
   Methods:
-    jobOperation(appdict: dict) -> Job: Update the job document with the application details.
-    seekerOperation(appdict: dict) -> Seeker: Update the seeker document with the application details.
+    jobOperation(appdict: dict) -> bool: Update the job document with the application details.
+    seekerOperation(appdict: dict) -> bool: Update the seeker document with the application details.
+    applicationOperation(appdict: dict) -> bool: Update the job and the seeker documents together.
+    batchOperation(appdicts: list) -> list: Apply many application updates with one write per collection.
   """
   # --------------------------- Update
   # 1. ----- job operation
   @staticmethod
-  async def jobOperation(appdict: ApplicationSchema) -> Job:
+  async def jobOperation(appdict: ApplicationSchema) -> bool:
     """
     Update the job document with the application details.
 
@@ -61,46 +72,33 @@ class ApplicationService:
           }
 
     Returns:
-      Job: The updated job document, or None if an error occurred.
+      bool: True if the job document was updated, False otherwise.
 
     Raises:
       Exception: Any exception that occurs during the update process is caught,
-                 logged, and results in returning None.
+                 logged, and results in returning False.
     """
     try:
       jobFilter = {"_id": ObjectId(appdict.jobId)}
 
-      operation = {}
-
-      if appdict.oldStatus == "apply":
-        operation["$pull"] = {"status.applied": ObjectId(appdict.userId)}
-      elif appdict.oldStatus == "reject":
-        operation["$pull"] = {"status.rejected": ObjectId(appdict.userId)}
-      elif appdict.oldStatus == "accept":
-        operation["$pull"] = {"status.accepted": ObjectId(appdict.userId)}
-      elif appdict.oldStatus == "decline":
-        operation["$pull"] = {"status.declined": ObjectId(appdict.userId)}
-
-      if appdict.newStatus == "apply":
-        operation["$addToSet"] = {"status.applied": ObjectId(appdict.userId)}
-      elif appdict.newStatus == "reject":
-        operation["$addToSet"] = {"status.rejected": ObjectId(appdict.userId)}
-      elif appdict.newStatus == "accept":
-        operation["$addToSet"] = {"status.accepted": ObjectId(appdict.userId)}
-      elif appdict.newStatus == "decline":
-        operation["$addToSet"] = {"status.declined": ObjectId(appdict.userId)}
-
-      updateResult = getNoSqlConn().documentOperation(noSql.JOBS_COLLECTION,
-                                                   jobFilter, operation)
-
-      return Job.model_validate(updateResult)
+      operation = ApplicationService.statusOperation(appdict.oldStatus,
+                                                     appdict.newStatus, appdict.userId)
+
+      # Only the match count is needed, the updated job is not sent back
+      matched = await getAsyncNoSqlConn().documentOperation(noSql.JOBS_COLLECTION,
+                                                            jobFilter, operation,
+                                                            WriteModeEnum.ACKNOWLEDGED)
+
+      # The cached job has stale status arrays, it is read again on next use
+      getAIService().job_records.pop(appdict.jobId)
+      return bool(matched)
     except Exception as e:
       logger.error(f"Error - Not able to update job status: {e}")
-      return None
+      return False
 
   # 2. ----- seeker operation
   @staticmethod
-  async def seekerOperation(appdict: ApplicationSchema) -> Seeker:
+  async def seekerOperation(appdict: ApplicationSchema) -> bool:
     """
     Update the seeker document with the application details.
 
@@ -123,40 +121,156 @@ class ApplicationService:
           }
 
     Returns:
-      Seeker: The updated seeker document, or None if an error occurred.
+      bool: True if the seeker document was updated, False otherwise.
 
     Raises:
       Exception: Any exception that occurs during the update process is caught,
-                 logged, and results in returning None.
+                 logged, and results in returning False.
     """
     try:
       seekerFilter = {"userId": ObjectId(appdict.userId)}
-      operation = {}
-
-      if appdict.oldStatus == "apply":
-        operation["$pull"] = {"status.applied": ObjectId(appdict.jobId)}
-      elif appdict.oldStatus == "reject":
-        operation["$pull"] = {"status.rejected": ObjectId(appdict.jobId)}
-      elif appdict.oldStatus == "accept":
-        operation["$pull"] = {"status.accepted": ObjectId(appdict.jobId)}
-      elif appdict.oldStatus == "decline":
-        operation["$pull"] = {"status.declined": ObjectId(appdict.jobId)}
-
-      if appdict.newStatus == "apply":
-        operation["$addToSet"] = {"status.applied": ObjectId(appdict.jobId)}
-      elif appdict.newStatus == "reject":
-        operation["$addToSet"] = {"status.rejected": ObjectId(appdict.jobId)}
-      elif appdict.newStatus == "accept":
-        operation["$addToSet"] = {"status.accepted": ObjectId(appdict.jobId)}
-      elif appdict.newStatus == "decline":
-        operation["$addToSet"] = {"status.declined": ObjectId(appdict.jobId)}
-
-      updateResult = getNoSqlConn().documentOperation(noSql.SEEKERS_COLLECTION,
-                                                   seekerFilter, operation)
-
-
-      return Seeker.model_validate(updateResult)
+      operation = ApplicationService.statusOperation(appdict.oldStatus,
+                                                     appdict.newStatus, appdict.jobId)
+
+      # Only the match count is needed, the updated seeker is not sent back
+      matched = await getAsyncNoSqlConn().documentOperation(noSql.SEEKERS_COLLECTION,
+                                                            seekerFilter, operation,
+                                                            WriteModeEnum.ACKNOWLEDGED)
+
+      # The cached seeker has stale status arrays, it is read again on next use
+      getAIService().seeker_records.pop(appdict.userId)
+      return bool(matched)
     except Exception as e:
       logger.error(f"Error - not able to update seeker status: {e}")
-      return None
+      return False
+
+  # 3. ----- job and seeker operation
+  @staticmethod
+  async def applicationOperation(appdict: ApplicationSchema) -> bool:
+    """
+    Update the job and the seeker documents of an application together.
+
+    Both updates run in one transaction where the deployment supports it, so
+    the job and seeker status arrays never disagree. Otherwise they are sent
+    concurrently.
 
+    Args:
+      appdict (ApplicationSchema): The application details, as for jobOperation.
+
+    Returns:
+      bool: True if both documents were updated, False otherwise.
+
+    Raises:
+      Exception: Any exception that occurs during the update process is caught,
+                 logged, and results in returning False.
+    """
+    try:
+      matched = await getAsyncNoSqlConn().documentOperations([
+          (noSql.JOBS_COLLECTION, {"_id": ObjectId(appdict.jobId)},
+           ApplicationService.statusOperation(appdict.oldStatus, appdict.newStatus,
+                                              appdict.userId)),
+          (noSql.SEEKERS_COLLECTION, {"userId": ObjectId(appdict.userId)},
+           ApplicationService.statusOperation(appdict.oldStatus, appdict.newStatus,
+                                              appdict.jobId))
+      ])
+
+      # The cached records have stale status arrays, they are read again on next use
+      getAIService().job_records.pop(appdict.jobId)
+      getAIService().seeker_records.pop(appdict.userId)
+      return all(matched)
+    except Exception as e:
+      logger.error(f"Error - Not able to update application: {e}")
+      return False
+
+  # 4. ----- batch operation
+  @staticmethod
+  async def batchOperation(appdicts: list[ApplicationSchema]) -> list[BulkItemResultSchema]:
+    """
+    Apply many application updates, such as a swipe session, at once.
+
+    The jobs and seekers of every update are checked with one $in query per
+    collection, then the updates are written with one ordered bulk_write per
+    collection. An update is only written when both its job and its seeker
+    exist, its seeker only once its job was updated, and the updates of a same
+    document keep their order.
+
+    Args:
+      appdicts (list[ApplicationSchema]): The application updates, in the order they happened.
+
+    Returns:
+      list[BulkItemResultSchema]: The outcome of each update, in the order of appdicts.
+    """
+    results: list[BulkItemResultSchema | None] = [None] * len(appdicts)
+    for index, appdict in enumerate(appdicts):
+      if not (ObjectId.is_valid(appdict.jobId) and ObjectId.is_valid(appdict.userId)):
+        results[index] = BulkItemResultSchema(index=index,
+                                              code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                                              message="Invalid userId or jobId")
+      elif appdict.oldStatus == appdict.newStatus:
+        # $pull and $addToSet on one array conflict and would stop the bulk write
+        results[index] = BulkItemResultSchema(index=index,
+                                              code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                                              message="oldStatus and newStatus must differ")
+
+    pending = [index for index, result in enumerate(results) if result is None]
+    existingJobs = await getAsyncNoSqlConn().findExistingIds(
+        noSql.JOBS_COLLECTION, [appdicts[index].jobId for index in pending])
+    existingSeekers = await getAsyncNoSqlConn().findExistingIds(
+        noSql.SEEKERS_COLLECTION, [appdicts[index].userId for index in pending], "userId")
+    for index in pending:
+      appdict = appdicts[index]
+      if appdict.jobId not in existingJobs or appdict.userId not in existingSeekers:
+        results[index] = BulkItemResultSchema(
+            index=index, code=status.HTTP_404_NOT_FOUND,
+            message=f"Not able to {appdict.newStatus} for user {appdict.userId} to job {appdict.jobId}")
+    pending = [index for index in pending if results[index] is None]
+
+    jobErrors = await getAsyncNoSqlConn().bulkUpdateDocuments(noSql.JOBS_COLLECTION, [
+        ({"_id": ObjectId(appdicts[index].jobId)},
+         ApplicationService.statusOperation(appdicts[index].oldStatus,
+                                            appdicts[index].newStatus, appdicts[index].userId))
+        for index in pending])
+    # A seeker is left alone when its job failed, so the two status arrays never disagree
+    jobUpdated = [index for position, index in enumerate(pending) if position not in jobErrors]
+    seekerErrors = await getAsyncNoSqlConn().bulkUpdateDocuments(noSql.SEEKERS_COLLECTION, [
+        ({"userId": ObjectId(appdicts[index].userId)},
+         ApplicationService.statusOperation(appdicts[index].oldStatus,
+                                            appdicts[index].newStatus, appdicts[index].jobId))
+        for index in jobUpdated])
+    errors = {pending[position]: error for position, error in jobErrors.items()}
+    errors.update({jobUpdated[position]: error for position, error in seekerErrors.items()})
+
+    for index in pending:
+      appdict = appdicts[index]
+      # The cached records have stale status arrays, they are read again on next use
+      getAIService().job_records.pop(appdict.jobId)
+      getAIService().seeker_records.pop(appdict.userId)
+      error = errors.get(index)
+      if error is not None:
+        logger.error(f"Error - Not able to update application {index}: {error.get('errmsg')}")
+        results[index] = BulkItemResultSchema(index=index,
+                                              code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                                              message=error.get("errmsg"))
+      else:
+        results[index] = BulkItemResultSchema(index=index, code=status.HTTP_200_OK)
+    return results
+
+  @staticmethod
+  def statusOperation(oldStatus: str | None, newStatus: str | None, memberId: str) -> dict:
+    """
+    Build the update moving an id from the array of its old status to the one of its new status.
+
+    Args:
+      oldStatus (str | None): The old status. Must be "apply", "reject", "accept", or "decline".
+      newStatus (str | None): The new status. Must be "apply", "reject", "accept", or "decline".
+      memberId (str): The id to move, a userId on a job or a jobId on a seeker.
+
+    Returns:
+      dict: The $pull and $addToSet operators of the update. Unknown statuses are left out.
+    """
+    operation = {}
+    if oldStatus in STATUS_FIELDS:
+      operation["$pull"] = {STATUS_FIELDS[oldStatus]: ObjectId(memberId)}
+    if newStatus in STATUS_FIELDS:
+      operation["$addToSet"] = {STATUS_FIELDS[newStatus]: ObjectId(memberId)}
+    return operation
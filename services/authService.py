@@ -10,7 +10,8 @@ Contact Information: mathteixeira55
 """
 
 from fastapi.encoders import jsonable_encoder
-from core.database import getNoSqlConn
+from core.database import getAsyncNoSqlConn
+from enums import WriteModeEnum
 from models import User
 from bson import ObjectId
 
@@ -46,7 +47,8 @@ class AuthService:
     # Use 'jsonable_encoder' directly on the 'seeker' object
     user_json = jsonable_encoder(user, exclude={"id"})
 
-    createdUser = getNoSqlConn().insertDocument(collectionName, user_json)
+    createdUser = await getAsyncNoSqlConn().insertDocument(collectionName, user_json,
+                                                           WriteModeEnum.ACKNOWLEDGED)
 
     # Convert the ObjectId to string for the response
     if "_id" in createdUser and isinstance(createdUser["_id"], ObjectId):
@@ -68,7 +70,7 @@ class AuthService:
     Returns:
       User: The seeker document that matches the field-value pair.
     """
-    user = getNoSqlConn().findDocumentByFilters(collectionName, filters)
+    user = await getAsyncNoSqlConn().findDocumentByFilters(collectionName, filters)
     if "_id" in user and isinstance(user["_id"], ObjectId):
       user["id"] = str(user["_id"])
       del user["_id"]  # Remove '_id' to avoid confusion
@@ -92,8 +94,9 @@ class AuthService:
     """
     try:
       user = jsonable_encoder(user)
-      updateResult = getNoSqlConn().setDocument(collectionName, filters, user)
-      return updateResult is not None
+      matched = await getAsyncNoSqlConn().setDocument(collectionName, filters, user,
+                                                      WriteModeEnum.ACKNOWLEDGED)
+      return bool(matched)
     except Exception as e:
       logging.error(f"Error updating user: {e}")
       return False
@@ -112,7 +115,7 @@ class AuthService:
       bool: True if the document was deleted, False otherwise.
     """
     try:
-      deleteResult = getNoSqlConn().deleteDocument(collectionName, filters)
+      deleteResult = await getAsyncNoSqlConn().deleteDocument(collectionName, filters)
       return deleteResult
     except Exception as e:
       logging.error(f"Error deleting seeker: {e}")
@@ -9,16 +9,26 @@ License: MIT License
 Contact Information: mathteixeira55
 """
 from datetime import datetime
+from typing import AsyncIterator
+from fastapi import status
 from fastapi.encoders import jsonable_encoder
-from core.database import getNoSqlConn
+from core.database import getAsyncNoSqlConn
 from core.config import noSql
+from enums import WriteModeEnum
 from models import Job, JobUpdate
-from schemas import JobInfoSchema, SkillSchema
+from schemas import BulkItemResultSchema, JobInfoSchema, SkillSchema
+from utils import validateList
+from .aiService import getAIService
 
 import logging
 
 logger = logging.getLogger("uvicorn")
 
+# The skill fields 'skills_extracted' is computed from
+SKILL_FIELDS = ("primarySkills", "secondarySkills")
+# Reads and guarded writes of a skills patch before giving up on a busy document
+SKILLS_PATCH_ATTEMPTS = 3
+
 
 class JobService:
   """
@@ -54,15 +64,88 @@ class JobService:
     job_json = jsonable_encoder(job, exclude={"id"})
 
     # Check if user exists
-    if not getNoSqlConn().findDocumentByFilters(noSql.USERS_COLLECTION,
-                                                {"id":  job_json["userId"]}):
+    if not await getAsyncNoSqlConn().findDocumentByFilters(noSql.USERS_COLLECTION,
+                                                           {"id":  job_json["userId"]}):
       logger.error(f"User does not exist: {job_json['userId']}")
       raise Exception("User does not exist")
 
-    createdJob = getNoSqlConn().insertDocument(collectionName, job_json)
+    # Persist the normalised skills so ranking never recomputes them
+    skillsExtracted = getAIService().build_skills_extracted(job_json)
+    if skillsExtracted is not None:
+      job_json["skills_extracted"] = skillsExtracted
+
+    createdJob = await getAsyncNoSqlConn().insertDocument(collectionName, job_json,
+                                                          WriteModeEnum.ACKNOWLEDGED)
+    # Make the new job rankable right away
+    if collectionName == noSql.JOBS_COLLECTION:
+      getAIService().index_job(createdJob)
 
     return Job.model_validate(createdJob)
 
+  @staticmethod
+  async def createJobs(collectionName: str, jobs: list[Job]) -> list[BulkItemResultSchema]:
+    """
+    Create several job documents in three round trips whatever their number.
+
+    Every job is parsed like createJob does, the owners of all of them are
+    checked with one $in query and the valid ones are written with a single
+    unordered insert_many, so a failing job does not stop the others.
+
+    Args:
+      collectionName (str): The name of the collection to insert the documents into.
+      jobs (list[Job]): The job data to be inserted.
+
+    Returns:
+      list[BulkItemResultSchema]: The outcome of each job, in the order of jobs.
+    """
+    results: list[BulkItemResultSchema | None] = [None] * len(jobs)
+    pending = {}
+    for index, job in enumerate(jobs):
+      try:
+        job = JobService.parsing(job)
+      except Exception as e:
+        logger.error(f"Error parsing job: {e}")
+        results[index] = BulkItemResultSchema(index=index,
+                                              code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                                              message=f"Error parsing job: {e}")
+        continue
+      job_json = jsonable_encoder(job, exclude={"id"})
+      # Persist the normalised skills so ranking never recomputes them
+      skillsExtracted = getAIService().build_skills_extracted(job_json)
+      if skillsExtracted is not None:
+        job_json["skills_extracted"] = skillsExtracted
+      pending[index] = job_json
+
+    # Check every referenced user at once
+    existingUsers = await getAsyncNoSqlConn().findExistingIds(
+        noSql.USERS_COLLECTION, [str(doc["userId"]) for doc in pending.values()])
+    for index in list(pending):
+      userId = str(pending[index]["userId"])
+      if userId not in existingUsers:
+        results[index] = BulkItemResultSchema(index=index,
+                                              code=status.HTTP_404_NOT_FOUND,
+                                              message=f"User does not exist with id {userId}")
+        del pending[index]
+
+    indexes = list(pending)
+    inserted, errors = await getAsyncNoSqlConn().insertManyDocuments(
+        collectionName, [pending[index] for index in indexes])
+    for position, index in enumerate(indexes):
+      if position in errors:
+        error = errors[position]
+        code = (status.HTTP_409_CONFLICT if error.get("code") == 11000
+                else status.HTTP_500_INTERNAL_SERVER_ERROR)
+        results[index] = BulkItemResultSchema(index=index, code=code,
+                                              message=error.get("errmsg"))
+        continue
+      # Make the new job rankable right away
+      if collectionName == noSql.JOBS_COLLECTION:
+        getAIService().index_job(inserted[position])
+      results[index] = BulkItemResultSchema(index=index,
+                                            code=status.HTTP_201_CREATED,
+                                            id=inserted[position]["id"])
+    return results
+
   # ------------------------------ Retrieve
   # 1. ----- get all jobs
   @staticmethod
@@ -76,11 +159,47 @@ class JobService:
     Returns:
       list[Jobs]: A list of all jobs documents in the collection.
     """
-    listJobs = getNoSqlConn().findAllDocuments(collectionName)
-    listJobs = [Job.model_validate(data) for data in listJobs]
+    listJobs = await getAsyncNoSqlConn().findAllDocuments(collectionName)
+    listJobs = validateList(Job, listJobs)
 
     return listJobs
 
+  @staticmethod
+  async def getJobsPage(collectionName: str, limit: int,
+                        after: str | None = None) -> tuple[list[Job], str | None]:
+    """
+    Retrieve one page of job documents, in creation order.
+
+    Args:
+      collectionName (str): The name of the collection to retrieve the documents from.
+      limit (int): The maximum number of jobs of the page.
+      after (str | None): The cursor returned with the previous page, None for the first page.
+
+    Returns:
+      tuple[list[Job], str | None]: The jobs of the page and the cursor of the
+        next page, None on the last page.
+
+    Raises:
+      ValueError: If the cursor is invalid.
+    """
+    documents, nextCursor = await getAsyncNoSqlConn().findPageDocuments(collectionName,
+                                                                        limit, after)
+    return validateList(Job, documents), nextCursor
+
+  @staticmethod
+  async def streamJobs(collectionName: str) -> AsyncIterator[Job]:
+    """
+    Iterate all job documents of a specified collection without loading them all.
+
+    Args:
+      collectionName (str): The name of the collection to retrieve the documents from.
+
+    Yields:
+      Job: Each job of the collection, validated one at a time.
+    """
+    async for document in getAsyncNoSqlConn().streamDocuments(collectionName):
+      yield Job.model_validate(document)
+
   # 2. ----- get job by filters
   @staticmethod
   async def getJobByFilters(collectionName: str, filters: dict) -> Job:
@@ -94,7 +213,7 @@ class JobService:
     Returns:
       Job: The seeker document that matches the field-value pair.
     """
-    job = getNoSqlConn().findDocumentByFilters(collectionName, filters)
+    job = await getAsyncNoSqlConn().findDocumentByFilters(collectionName, filters)
 
     if job is None:
       logger.warning(f"Job not found with filters: {filters}")
@@ -116,11 +235,46 @@ class JobService:
     Returns:
       Job: The seeker document that matches the field-value pair.
     """
-    listJobs = getNoSqlConn().findListDocumentsByQuery(collectionName, query)
-    listJobs = [Job.model_validate(data) for data in listJobs]
+    listJobs = await getAsyncNoSqlConn().findListDocumentsByQuery(collectionName, query)
+    listJobs = validateList(Job, listJobs)
 
     return listJobs
 
+  # 4. ----- get jobs by ids, in the given order
+  @staticmethod
+  async def getJobsByIds(collectionName: str, jobIds: list[str]) -> list[Job]:
+    """
+    Retrieve jobs by id, keeping the order of the ids.
+
+    Jobs of the main collection are served from the AI record store, so a
+    ranking is answered from memory; only the missing ones are fetched, with a
+    single query, and remembered for the next request.
+
+    Args:
+      collectionName (str): The name of the collection to search in.
+      jobIds (list[str]): The ids of the jobs, in the order to return them.
+
+    Returns:
+      list[Job]: The jobs found, in the order of jobIds.
+    """
+    if collectionName != noSql.JOBS_COLLECTION:
+      listJobs = await JobService.getListJobByQuery(collectionName,
+                                                    {"id": {"$in": jobIds}})
+      jobsById = {str(job.id): job for job in listJobs}
+      return [jobsById[jobId] for jobId in jobIds if jobId in jobsById]
+
+    records = getAIService().job_records
+    # Taken before the read, so a job invalidated meanwhile is not cached again
+    version = records.version()
+    jobsById = records.getMany(jobIds)
+    missing = [jobId for jobId in jobIds if jobId not in jobsById]
+    if missing:
+      for job in await JobService.getListJobByQuery(collectionName,
+                                                    {"id": {"$in": missing}}):
+        records.put(str(job.id), job, version)
+        jobsById[str(job.id)] = job
+    return [jobsById[jobId] for jobId in jobIds if jobId in jobsById]
+
   # --------------------------- Update
   @staticmethod
   async def patchJob(collectionName: str, filters: dict,
@@ -138,9 +292,21 @@ class JobService:
     """
     try:
       job = jsonable_encoder(job)
-      updateResult = getNoSqlConn().setDocument(collectionName,
-                                                   filters, job)
-      return Job.model_validate(updateResult)
+      # Only a skills patch changes the stored skills text and the index row
+      skillsPatch = any(job.get(field) is not None for field in SKILL_FIELDS)
+      if skillsPatch:
+        updateResult = await JobService.setSkillsPatch(collectionName, filters, job)
+      else:
+        updateResult = await getAsyncNoSqlConn().setDocument(collectionName,
+                                                                filters, job)
+      if updateResult and skillsPatch and collectionName == noSql.JOBS_COLLECTION:
+        getAIService().index_job(updateResult)
+      updatedJob = Job.model_validate(updateResult)
+      if collectionName == noSql.JOBS_COLLECTION:
+        getAIService().job_records.put(updatedJob.id, updatedJob)
+        # Any job patch drops the cached seeker ranking of this job
+        getAIService().invalidate_job(updatedJob.id)
+      return updatedJob
     except Exception as e:
       logger.error(f"Error updating job: {e}")
       return None
@@ -159,13 +325,57 @@ class JobService:
       bool: True if the document was deleted, False otherwise.
     """
     try:
-      deleteResult = getNoSqlConn().deleteDocument(collectionName, filters)
-      return deleteResult
+      deletedJob = await getAsyncNoSqlConn().findAndDeleteDocument(collectionName, filters,
+                                                                   {"_id": 1})
+      if deletedJob is None:
+        return False
+      if collectionName == noSql.JOBS_COLLECTION:
+        getAIService().remove_job(deletedJob["id"])
+        getAIService().job_records.pop(deletedJob["id"])
+      return True
     except Exception as e:
       logger.error(f"Error deleting job: {e}")
       return None
 
   # --------------------------- Auxiliary Methods
+  @staticmethod
+  async def setSkillsPatch(collectionName: str, filters: dict, job: dict) -> dict | None:
+    """
+    Write a skills patch of a job and the 'skills_extracted' text of its merged skills in one update.
+
+    The skill field the patch leaves alone is read first and must still hold
+    the same value when the update is applied, so a concurrent patch of it is
+    never merged into a stale text; the merge is retried in that case.
+
+    Args:
+      collectionName (str): The name of the collection holding the job.
+      filters (dict): The filters to search by.
+      job (dict): The patch, with at least one skill field.
+
+    Returns:
+      dict | None: The updated job document, or None if it was not updated.
+    """
+    patched = {field: job[field] for field in SKILL_FIELDS if job.get(field) is not None}
+    kept = [field for field in SKILL_FIELDS if field not in patched]
+    for _ in range(SKILLS_PATCH_ATTEMPTS):
+      guard = {}
+      if kept:
+        current = await getAsyncNoSqlConn().findDocumentByFilters(collectionName, filters)
+        if current is None:
+          return None
+        guard = {field: current.get(field) for field in kept}
+      merged = {field: value for field, value in guard.items() if value is not None}
+      skillsExtracted = getAIService().build_skills_extracted({**merged, **patched})
+      # No skills left, drop the stale text instead of ranking on it
+      updated = await getAsyncNoSqlConn().setDocument(
+          collectionName, {**filters, **guard},
+          {**job, "skills_extracted": skillsExtracted},
+          unsetFields=None if skillsExtracted else ["skills_extracted"])
+      if updated is not None or not kept:
+        return updated
+    logger.error("Error updating job skills: they kept changing during the patch")
+    return None
+
   @staticmethod
   def parsing(job: Job) -> Job:
     """
@@ -10,16 +10,26 @@ Contact Information: mathteixeira55
 """
 
 from datetime import datetime
+from typing import AsyncIterator
+from fastapi import status
 from fastapi.encoders import jsonable_encoder
-from core.database import getNoSqlConn
+from core.database import getAsyncNoSqlConn
 from core.config import noSql
+from enums import WriteModeEnum
 from models import Seeker
-from schemas import PersonalInfoSchema, SkillSchema, EducationSchema
+from schemas import BulkItemResultSchema, PersonalInfoSchema, SkillSchema, EducationSchema
+from utils import validateList
+from .aiService import getAIService
 
 import logging
 
 logger = logging.getLogger("uvicorn")
 
+# The skill fields 'skills_extracted' is computed from
+SKILL_FIELDS = ("primarySkills", "secondarySkills")
+# Reads and guarded writes of a skills patch before giving up on a busy document
+SKILLS_PATCH_ATTEMPTS = 3
+
 class SeekerService:
   """
   A service class for managing seeker business logic.
@@ -54,15 +64,88 @@ class SeekerService:
     seeker_json = jsonable_encoder(seeker)
 
     # Check if the user exists
-    if not getNoSqlConn().findDocumentByFilters(noSql.USERS_COLLECTION,
-                                                {"id":  seeker_json["userId"]}):
+    if not await getAsyncNoSqlConn().findDocumentByFilters(noSql.USERS_COLLECTION,
+                                                           {"id":  seeker_json["userId"]}):
       logger.error(f"User does not exist with id {str(seeker_json['userId'])}")
       raise Exception(f"User does not exist with id {str(seeker_json['userId'])}")
 
-    createdSeeker = getNoSqlConn().insertDocument(seekerCollection, seeker_json)
+    # Persist the normalised skills so ranking never recomputes them
+    skillsExtracted = getAIService().build_skills_extracted(seeker_json)
+    if skillsExtracted is not None:
+      seeker_json["skills_extracted"] = skillsExtracted
+
+    createdSeeker = await getAsyncNoSqlConn().insertDocument(seekerCollection, seeker_json,
+                                                             WriteModeEnum.ACKNOWLEDGED)
+    # Make the new seeker rankable right away
+    if seekerCollection == noSql.SEEKERS_COLLECTION:
+      getAIService().index_seeker(createdSeeker)
 
     return Seeker.model_validate(createdSeeker)
 
+  @staticmethod
+  async def createSeekers(seekerCollection: str, seekers: list[Seeker]) -> list[BulkItemResultSchema]:
+    """
+    Create several seeker documents in three round trips whatever their number.
+
+    Every seeker is parsed like createSeeker does, the owners of all of them are
+    checked with one $in query and the valid ones are written with a single
+    unordered insert_many, so a failing seeker does not stop the others.
+
+    Args:
+      seekerCollection (str): The name of the collection to insert the documents into.
+      seekers (list[Seeker]): The seeker data to be inserted.
+
+    Returns:
+      list[BulkItemResultSchema]: The outcome of each seeker, in the order of seekers.
+    """
+    results: list[BulkItemResultSchema | None] = [None] * len(seekers)
+    pending = {}
+    for index, seeker in enumerate(seekers):
+      try:
+        seeker = SeekerService.parsing(seeker)
+      except Exception as e:
+        logger.error(f"Error parsing seeker: {e}")
+        results[index] = BulkItemResultSchema(index=index,
+                                              code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                                              message=f"Error parsing seeker: {e}")
+        continue
+      seeker_json = jsonable_encoder(seeker)
+      # Persist the normalised skills so ranking never recomputes them
+      skillsExtracted = getAIService().build_skills_extracted(seeker_json)
+      if skillsExtracted is not None:
+        seeker_json["skills_extracted"] = skillsExtracted
+      pending[index] = seeker_json
+
+    # Check every referenced user at once
+    existingUsers = await getAsyncNoSqlConn().findExistingIds(
+        noSql.USERS_COLLECTION, [str(doc["userId"]) for doc in pending.values()])
+    for index in list(pending):
+      userId = str(pending[index]["userId"])
+      if userId not in existingUsers:
+        results[index] = BulkItemResultSchema(index=index,
+                                              code=status.HTTP_404_NOT_FOUND,
+                                              message=f"User does not exist with id {userId}")
+        del pending[index]
+
+    indexes = list(pending)
+    inserted, errors = await getAsyncNoSqlConn().insertManyDocuments(
+        seekerCollection, [pending[index] for index in indexes])
+    for position, index in enumerate(indexes):
+      if position in errors:
+        error = errors[position]
+        code = (status.HTTP_409_CONFLICT if error.get("code") == 11000
+                else status.HTTP_500_INTERNAL_SERVER_ERROR)
+        results[index] = BulkItemResultSchema(index=index, code=code,
+                                              message=error.get("errmsg"))
+        continue
+      # Make the new seeker rankable right away
+      if seekerCollection == noSql.SEEKERS_COLLECTION:
+        getAIService().index_seeker(inserted[position])
+      results[index] = BulkItemResultSchema(index=index,
+                                            code=status.HTTP_201_CREATED,
+                                            id=inserted[position]["id"])
+    return results
+
   # ------------------------------ Retrieve
   @staticmethod
   async def getSeekers(collectionName: str) -> list[Seeker]:
@@ -75,11 +158,47 @@ class SeekerService:
     Returns:
       list[Seeker]: A list of all seeker documents in the collection.
     """
-    listSeekers = getNoSqlConn().findAllDocuments(collectionName)
-    listSeekers = [Seeker.model_validate(seeker) for seeker in listSeekers]
+    listSeekers = await getAsyncNoSqlConn().findAllDocuments(collectionName)
+    listSeekers = validateList(Seeker, listSeekers)
 
     return listSeekers
 
+  @staticmethod
+  async def getSeekersPage(collectionName: str, limit: int,
+                           after: str | None = None) -> tuple[list[Seeker], str | None]:
+    """
+    Retrieve one page of seeker documents, in creation order.
+
+    Args:
+      collectionName (str): The name of the collection to retrieve the documents from.
+      limit (int): The maximum number of seekers of the page.
+      after (str | None): The cursor returned with the previous page, None for the first page.
+
+    Returns:
+      tuple[list[Seeker], str | None]: The seekers of the page and the cursor of the
+        next page, None on the last page.
+
+    Raises:
+      ValueError: If the cursor is invalid.
+    """
+    documents, nextCursor = await getAsyncNoSqlConn().findPageDocuments(collectionName,
+                                                                        limit, after)
+    return validateList(Seeker, documents), nextCursor
+
+  @staticmethod
+  async def streamSeekers(collectionName: str) -> AsyncIterator[Seeker]:
+    """
+    Iterate all seeker documents of a specified collection without loading them all.
+
+    Args:
+      collectionName (str): The name of the collection to retrieve the documents from.
+
+    Yields:
+      Seeker: Each seeker of the collection, validated one at a time.
+    """
+    async for document in getAsyncNoSqlConn().streamDocuments(collectionName):
+      yield Seeker.model_validate(document)
+
   @staticmethod
   async def getSeekerByFilters(collectionName: str, filters: dict) -> Seeker:
     """
@@ -92,7 +211,7 @@ class SeekerService:
     Returns:
       Seeker: The seeker document that matches the field-value pair.
     """
-    seeker = getNoSqlConn().findDocumentByFilters(collectionName, filters)
+    seeker = await getAsyncNoSqlConn().findDocumentByFilters(collectionName, filters)
 
     if seeker is None:
       logger.warning(f"Seeker not found with filters: {filters}")
@@ -113,11 +232,62 @@ class SeekerService:
     Returns:
       Seeker: The seeker document that matches the field-value pair.
     """
-    listSeeker = getNoSqlConn().findListDocumentsByQuery(collectionName, query)
-    listSeeker = [Seeker.model_validate(seeker) for seeker in listSeeker]
+    listSeeker = await getAsyncNoSqlConn().findListDocumentsByQuery(collectionName, query)
+    listSeeker = validateList(Seeker, listSeeker)
 
     return listSeeker
 
+  @staticmethod
+  async def getRankingSeekers(collectionName: str, query: dict) -> list[dict]:
+    """
+    Retrieve the compact ranking records of the seekers matching a query.
+
+    Unlike getListSeekerByQuery, only ids and skills are fetched and no Seeker
+    model is built, since the ranking only reads the skills.
+
+    Args:
+      collectionName (str): The name of the collection to search in.
+      query (dict): The mongo query to search by.
+
+    Returns:
+      list[dict]: The ranking records of the matching seekers.
+    """
+    return await getAsyncNoSqlConn().findRankingDocuments(collectionName, query) or []
+
+  @staticmethod
+  async def getSeekersByUserIds(collectionName: str, userIds: list[str]) -> list[Seeker]:
+    """
+    Retrieve seekers by userId, keeping the order of the ids.
+
+    Seekers of the main collection are served from the AI record store, so a
+    ranking is answered from memory; only the missing ones are fetched, with a
+    single query, and remembered for the next request.
+
+    Args:
+      collectionName (str): The name of the collection to search in.
+      userIds (list[str]): The userIds of the seekers, in the order to return them.
+
+    Returns:
+      list[Seeker]: The seekers found, in the order of userIds.
+    """
+    if collectionName != noSql.SEEKERS_COLLECTION:
+      listSeekers = await SeekerService.getListSeekerByQuery(
+          collectionName, {"userId": {"$in": userIds}})
+      seekersById = {str(seeker.userId): seeker for seeker in listSeekers}
+      return [seekersById[userId] for userId in userIds if userId in seekersById]
+
+    records = getAIService().seeker_records
+    # Taken before the read, so a seeker invalidated meanwhile is not cached again
+    version = records.version()
+    seekersById = records.getMany(userIds)
+    missing = [userId for userId in userIds if userId not in seekersById]
+    if missing:
+      for seeker in await SeekerService.getListSeekerByQuery(
+          collectionName, {"userId": {"$in": missing}}):
+        records.put(str(seeker.userId), seeker, version)
+        seekersById[str(seeker.userId)] = seeker
+    return [seekersById[userId] for userId in userIds if userId in seekersById]
+
   # --------------------------- Update
   @staticmethod
   async def patchSeeker(collectionName: str, filters: dict,
@@ -135,9 +305,21 @@ class SeekerService:
     """
     try:
       seeker = jsonable_encoder(seeker)
-      updateResult = getNoSqlConn().setDocument(collectionName,
-                                                   filters, seeker)
-      return Seeker.model_validate(updateResult)
+      # Only a skills patch changes the stored skills text and the index row
+      skillsPatch = any(seeker.get(field) is not None for field in SKILL_FIELDS)
+      if skillsPatch:
+        updateResult = await SeekerService.setSkillsPatch(collectionName, filters, seeker)
+      else:
+        updateResult = await getAsyncNoSqlConn().setDocument(collectionName,
+                                                                filters, seeker)
+      if updateResult and skillsPatch and collectionName == noSql.SEEKERS_COLLECTION:
+        getAIService().index_seeker(updateResult)
+      updatedSeeker = Seeker.model_validate(updateResult)
+      if collectionName == noSql.SEEKERS_COLLECTION:
+        getAIService().seeker_records.put(updatedSeeker.userId, updatedSeeker)
+        # Any profile patch drops the cached job feed of this seeker
+        getAIService().invalidate_seeker(updatedSeeker.userId)
+      return updatedSeeker
     except Exception as e:
       logger.error(f"Error updating seeker: {e}")
       return None
@@ -156,13 +338,58 @@ class SeekerService:
       bool: True if the document was deleted, False otherwise.
     """
     try:
-      deleteResult = getNoSqlConn().deleteDocument(seekerCollection, filters)
-      return deleteResult
+      deletedSeeker = await getAsyncNoSqlConn().findAndDeleteDocument(seekerCollection,
+                                                                      filters,
+                                                                      {"userId": 1})
+      if deletedSeeker is None:
+        return False
+      if seekerCollection == noSql.SEEKERS_COLLECTION:
+        getAIService().remove_seeker(deletedSeeker["userId"])
+        getAIService().seeker_records.pop(deletedSeeker["userId"])
+      return True
     except Exception as e:
       logger.error(f"Error deleting seeker: {e}")
       return None
 
   # --------------------------- Auxiliary Methods
+  @staticmethod
+  async def setSkillsPatch(collectionName: str, filters: dict, seeker: dict) -> dict | None:
+    """
+    Write a skills patch of a seeker and the 'skills_extracted' text of its merged skills in one update.
+
+    The skill field the patch leaves alone is read first and must still hold
+    the same value when the update is applied, so a concurrent patch of it is
+    never merged into a stale text; the merge is retried in that case.
+
+    Args:
+      collectionName (str): The name of the collection holding the seeker.
+      filters (dict): The filters to search by.
+      seeker (dict): The patch, with at least one skill field.
+
+    Returns:
+      dict | None: The updated seeker document, or None if it was not updated.
+    """
+    patched = {field: seeker[field] for field in SKILL_FIELDS if seeker.get(field) is not None}
+    kept = [field for field in SKILL_FIELDS if field not in patched]
+    for _ in range(SKILLS_PATCH_ATTEMPTS):
+      guard = {}
+      if kept:
+        current = await getAsyncNoSqlConn().findDocumentByFilters(collectionName, filters)
+        if current is None:
+          return None
+        guard = {field: current.get(field) for field in kept}
+      merged = {field: value for field, value in guard.items() if value is not None}
+      skillsExtracted = getAIService().build_skills_extracted({**merged, **patched})
+      # No skills left, drop the stale text instead of ranking on it
+      updated = await getAsyncNoSqlConn().setDocument(
+          collectionName, {**filters, **guard},
+          {**seeker, "skills_extracted": skillsExtracted},
+          unsetFields=None if skillsExtracted else ["skills_extracted"])
+      if updated is not None or not kept:
+        return updated
+    logger.error("Error updating seeker skills: they kept changing during the patch")
+    return None
+
   @staticmethod
   def parsing(seeker: Seeker) -> Seeker:
     """
@@ -1,9 +1,12 @@
 # test_ai_service.py
 
 import json
+import numpy as np
 import pytest
 from unittest.mock import patch
-from services.aiService import AIService
+from scipy.sparse import issparse
+from sklearn.metrics.pairwise import cosine_similarity
+from services.aiService import AIService, SkillIndex, sparse_cosine_scores, top_k_indices, id_ranks
 
 # Sample data for testing
 with open("./test/unit/sampleData/twoJobs.json") as file:
@@ -15,9 +18,8 @@ with open("./test/unit/sampleData/twoCandidates.json") as file:
 @pytest.fixture
 def ai_service():
   """Fixture to provide an instance of AIService."""
-  # Mock the SkillExtractor initialization to avoid loading spacy during testing
-  with patch("services.aiService.SkillExtractor"):
-    return AIService.getInstance()
+  # spaCy and the SkillExtractor are loaded on first use only, never by ranking
+  return AIService.getInstance()
 
 def test_json_to_tfidf(ai_service):
   """Test json_to_tfidf method"""
@@ -25,6 +27,20 @@ def test_json_to_tfidf(ai_service):
   assert tfidf_df.shape[0] == 2  # Ensure 2 rows in the dataframe
   assert "web_developers" in vectorizer.get_feature_names_out()  # Ensure features are generated
 
+def test_json_to_tfidf_stays_sparse(ai_service):
+  """Test json_to_tfidf keeps CSR by default and builds a DataFrame only on request"""
+  tfidf_matrix, vectorizer = ai_service.json_to_tfidf(sample_jobs_json)
+  assert issparse(tfidf_matrix)
+  tfidf_df, _ = ai_service.json_to_tfidf(sample_jobs_json, as_dataframe=True)
+  assert list(tfidf_df.columns) == list(vectorizer.get_feature_names_out())
+
+def test_sparse_cosine_scores_match_cosine_similarity(ai_service):
+  """Test the sparse dot product equals sklearn cosine similarity on normalised rows"""
+  tfidf_matrix, vectorizer = ai_service.json_to_tfidf(sample_jobs_json)
+  query = vectorizer.transform([ai_service.extract_and_concatenate_skills_without_weights(sample_candidates_json[0])])
+  expected = cosine_similarity(query, tfidf_matrix).flatten()
+  assert sparse_cosine_scores(tfidf_matrix, query) == pytest.approx(expected)
+
 def test_get_top_jobs_for_candidate(ai_service):
   """Test get_top_jobs_for_candidate method"""
   top_jobs = ai_service.get_top_jobs_for_candidate(sample_candidates_json[0], sample_jobs_json)
@@ -36,3 +52,263 @@ def test_get_top_candidates_for_job(ai_service):
   top_candidates = ai_service.get_top_candidates_for_job(sample_jobs_json[0], sample_candidates_json)
   assert len(top_candidates) == 2  # Ensure we get 2 results since there are 2 candidates
   assert '6733aec175eb0fba49f14363' in top_candidates  # Ensure user_1 is in the top results
+
+def test_get_top_jobs_from_job_index(ai_service):
+  """Test get_top_jobs_for_candidate against the resident job index"""
+  ai_service.build_job_index(sample_jobs_json)
+  assert ai_service.job_index.ready
+  top_jobs = ai_service.get_top_jobs_for_candidate(sample_candidates_json[0])
+  assert top_jobs == ai_service.get_top_jobs_for_candidate(sample_candidates_json[0], sample_jobs_json)
+
+def test_get_top_candidates_from_seeker_index(ai_service):
+  """Test get_top_candidates_for_job against the resident seeker index"""
+  ai_service.build_seeker_index(sample_candidates_json)
+  assert ai_service.seeker_index.ids == [c["userId"] for c in sample_candidates_json]
+  top_candidates = ai_service.get_top_candidates_for_job(sample_jobs_json[0])
+  assert top_candidates == ai_service.get_top_candidates_for_job(sample_jobs_json[0], sample_candidates_json)
+
+def test_top_k_indices_pages_with_id_tie_breaking():
+  """Test top_k_indices ranks by score, breaks ties by id and honours offset"""
+  scores = np.array([0.2, 0.9, 0.5, 0.9, 0.1, 0.5])
+  ranks = id_ranks(["f", "e", "d", "c", "b", "a"])
+  assert list(top_k_indices(scores, 3, ranks=ranks)) == [3, 1, 5]
+  assert list(top_k_indices(scores, 3, offset=3, ranks=ranks)) == [2, 0, 4]
+  assert list(top_k_indices(scores, 10, offset=5, ranks=ranks)) == [4]
+  assert list(top_k_indices(scores, 2, offset=6, ranks=ranks)) == []
+
+def test_top_k_indices_fills_a_zero_cutoff_by_rank():
+  """Test a page cut in a tie of zero scores keeps the best ranked zero rows"""
+  rng = np.random.default_rng(0)
+  scores = np.zeros(1000)
+  scores[rng.choice(1000, 5, replace=False)] = rng.random(5)
+  ranks = rng.permutation(1000)
+  expected = np.lexsort((ranks, -scores))
+  assert list(top_k_indices(scores, 10, ranks=ranks)) == list(expected[:10])
+  assert list(top_k_indices(scores, 10, offset=10, ranks=ranks)) == list(expected[10:20])
+
+def test_get_top_jobs_for_candidates_matches_single_queries(ai_service):
+  """Test the batch ranking returns the same jobs as one query per candidate"""
+  ai_service.build_job_index(sample_jobs_json)
+  batch = ai_service.get_top_jobs_for_candidates(sample_candidates_json, top_jobs=1)
+  assert set(batch) == {c["userId"] for c in sample_candidates_json}
+  for candidate in sample_candidates_json:
+    assert batch[candidate["userId"]] == ai_service.get_top_jobs_for_candidate(candidate, top_jobs=1)
+
+def test_get_top_jobs_for_candidates_in_chunks(ai_service):
+  """Test the batch ranking gives the same result when seekers are scored one chunk at a time"""
+  ai_service.build_job_index(sample_jobs_json)
+  batch = ai_service.get_top_jobs_for_candidates(sample_candidates_json, top_jobs=2)
+  with patch('services.aiService.BATCH_CHUNK_SIZE', 1):
+    assert ai_service.get_top_jobs_for_candidates(sample_candidates_json, top_jobs=2) == batch
+
+def test_skill_index_incremental_updates():
+  """Test SkillIndex appends, replaces and tombstones rows without a rebuild"""
+  index = SkillIndex(compaction_threshold=1.0, min_fit_size=0)
+  index.build(["python sql", "excel accounting"], ["job_1", "job_2"])
+  vectorizer, matrix, ids, alive, ranks = index.view()
+  query = vectorizer.transform(["python"])
+
+  index.upsert("job_3", "python django")
+  assert index.matrix.shape[0] == 3 and index.rows["job_3"] == 2
+  index.upsert("job_1", "excel")
+  assert index.tombstones == 1 and index.rows["job_1"] == 3
+  assert index.remove("job_2") and not index.remove("job_2")
+
+  _, matrix, ids, alive, ranks = index.view()
+  assert index.top_ids(sparse_cosine_scores(matrix, query), 10, ids=ids, alive=alive, ranks=ranks) == ["job_3", "job_1"]
+
+def test_skill_index_compaction_drops_tombstones():
+  """Test compaction refits the vocabulary on live rows only"""
+  index = SkillIndex(compaction_threshold=1.0, min_fit_size=0)
+  index.build(["python sql", "excel accounting", "python"], ["job_1", "job_2", "job_3"])
+  index.remove("job_2")
+  index.upsert("job_4", "rust")
+  index.compact()
+  assert index.ids == ["job_1", "job_3", "job_4"] and index.tombstones == 0
+  assert "rust" in index.vectorizer.get_feature_names_out()
+  assert "excel" not in index.vectorizer.get_feature_names_out()
+
+def test_skill_index_compaction_replays_writes_made_during_refit():
+  """Test writes received while compaction refits are applied to the new index"""
+  index = SkillIndex(compaction_threshold=1.0, min_fit_size=0)
+  index.build(["python sql", "excel accounting"], ["job_1", "job_2"])
+  fit = index._fit
+
+  def fit_with_writes(texts):
+    index.upsert("job_1", "rust")
+    index.remove("job_2")
+    index.upsert("job_1", "go")
+    return fit(texts)
+
+  index._fit = fit_with_writes
+  index.compact()
+  assert index._journal is None
+  assert list(index.rows) == ["job_1"] and index.text_of("job_1") == "go"
+
+def test_skill_index_compaction_is_dropped_after_a_rebuild():
+  """Test a build made while compaction refits is not overwritten by the compaction"""
+  index = SkillIndex(compaction_threshold=1.0)
+  index.build(["python sql", "excel accounting"], ["a", "b"])
+  fit = index._fit
+
+  def fit_with_build(texts):
+    index._fit = fit
+    index.build(["rust", "go"], ["c", "d"])
+    return fit(texts)
+
+  index._fit = fit_with_build
+  index.compact()
+  assert index.ids == ["c", "d"] and index._journal is None
+
+def test_skill_index_vocabulary_follows_appended_documents():
+  """Test a small index refits on every write and appended rows trigger a compaction"""
+  index = SkillIndex(min_fit_size=50)
+  index.upsert("j1", "excel accounting")
+  for i in range(48):
+    index.upsert(f"j{i + 2}", "python django sql")
+  vectorizer, matrix, ids, alive, ranks = index.view()
+  scores = sparse_cosine_scores(matrix, vectorizer.transform(["python"]))
+  assert "python" in vectorizer.get_feature_names_out()
+  assert index.top_ids(scores, 1, ids=ids, alive=alive, ranks=ranks) != ["j1"]
+
+  index = SkillIndex(compaction_threshold=0.25, min_fit_size=0)
+  with patch.object(SkillIndex, "compact") as compact:
+    index.upsert("j1", "excel accounting")
+    index.upsert("j2", "python django sql")
+  assert index.appended == 1 and index.tombstones == 0
+  compact.assert_called_once()
+
+def test_index_job_updates_job_index(ai_service):
+  """Test index_job and remove_job keep the job index current"""
+  ai_service.build_job_index(sample_jobs_json[:1])
+  ai_service.index_job(sample_jobs_json[1])
+  assert sample_jobs_json[1]["id"] in ai_service.job_index.rows
+  ai_service.remove_job(sample_jobs_json[0]["id"])
+  assert ai_service.get_top_jobs_for_candidate(sample_candidates_json[0]) == [sample_jobs_json[1]["id"]]
+
+def test_build_job_index_from_raw_records(ai_service):
+  """Test the index builds from read-only raw records keyed by _id"""
+  import bson
+  from bson.raw_bson import RawBSONDocument
+  records = [RawBSONDocument(bson.encode({
+      "_id": job["id"],
+      "primarySkills": job["primarySkills"],
+      "secondarySkills": job["secondarySkills"]
+  })) for job in sample_jobs_json]
+  ai_service.build_job_index(records, '_id')
+  ranked = ai_service.get_top_jobs_for_candidate(sample_candidates_json[0])
+  ai_service.build_job_index(sample_jobs_json)
+  assert ranked == ai_service.get_top_jobs_for_candidate(sample_candidates_json[0])
+  assert sorted(ranked) == sorted(job["id"] for job in sample_jobs_json)
+
+def test_build_skills_extracted_leaves_input_untouched(ai_service):
+  """Test the write-time skills text matches ranking and does not mutate the document"""
+  job = {"primarySkills": {"technicalSkills": [{"skillName": "Machine Learning"}]}}
+  assert ai_service.build_skills_extracted(job) == " ".join(["machine_learning"] * 6)
+  assert job["primarySkills"]["technicalSkills"][0]["skillName"] == "Machine Learning"
+  assert ai_service.build_skills_extracted({"primarySkills": None}) is None
+
+def test_top_candidates_among_matches_ad_hoc_ranking(ai_service):
+  """Test ranking a subset of the seeker index equals ranking those seekers ad hoc"""
+  ai_service.build_seeker_index(sample_candidates_json)
+  among = [sample_candidates_json[1]["userId"], "missing_user"]
+  assert ai_service.get_top_candidates_for_job(sample_jobs_json[0], among=among) == [among[0]]
+  indexed = ai_service.indexed_seeker(among[0])
+  assert indexed["userId"] == among[0] and indexed["skills_extracted"]
+
+def test_ranked_feed_cache_invalidation(ai_service):
+  """Test ranked feeds are cached per index generation and dropped on seeker writes"""
+  ai_service.build_job_index(sample_jobs_json)
+  seeker = sample_candidates_json[0]
+  first = ai_service.get_top_jobs_for_candidate(seeker)
+  hits = ai_service.ranked_jobs.hits
+  assert ai_service.get_top_jobs_for_candidate(seeker) == first
+  assert ai_service.ranked_jobs.hits == hits + 1
+  ai_service.invalidate_seeker(seeker["userId"])
+  assert ai_service.get_top_jobs_for_candidate(seeker) == first
+  assert ai_service.ranked_jobs.hits == hits + 1
+  ai_service.remove_job(first[0])
+  assert first[0] not in ai_service.get_top_jobs_for_candidate(seeker)
+
+def test_ranked_feed_pages_share_one_entry_per_generation():
+  """Test every page of a feed lives in one entry that an index change replaces"""
+  # No background compaction may bump the generation while the test runs
+  ai_service = AIService(ranking_only=True)
+  ai_service.job_index = SkillIndex(compaction_threshold=1.0)
+  ai_service.build_job_index(sample_jobs_json)
+  seeker = sample_candidates_json[0]
+  ai_service.get_top_jobs_for_candidate(seeker, top_jobs=1)
+  ai_service.get_top_jobs_for_candidate(seeker, top_jobs=1, offset=1)
+  generation, pages = ai_service.ranked_jobs.get(seeker["userId"])
+  assert generation == ai_service.job_index.generation and set(pages) == {(1, 0), (1, 1)}
+  ai_service.index_job(sample_jobs_json[0])
+  ai_service.get_top_jobs_for_candidate(seeker, top_jobs=1)
+  generation, pages = ai_service.ranked_jobs.get(seeker["userId"])
+  assert generation == ai_service.job_index.generation and set(pages) == {(1, 0)}
+  assert ai_service.ranked_jobs.stats()["size"] == 1
+
+def test_skill_extractor_loads_lazily_once():
+  """Test the NLP pipeline loads on first extraction only and never in ranking-only mode"""
+  with patch.object(AIService, "_load_skill_extractor") as load:
+    service = AIService(ranking_only=False)
+    load.assert_not_called()
+    load.return_value.annotate.return_value = {"results": {
+      "full_matches": [{"doc_node_value": "python"}],
+      "ngram_scored": [{"doc_node_value": "machine learning"}, {"doc_node_value": "python"}]}}
+    assert service.extract_skills_from_text("Python and machine learning") == "python machine_learning"
+    service.extract_skills_from_text("more text")
+    load.assert_called_once()
+  with pytest.raises(RuntimeError):
+    AIService(ranking_only=True).skill_extractor
+
+def test_skill_extractor_artifact_round_trip(tmp_path):
+  """Test a saved skill extractor is restored offline and annotates like the original"""
+  import spacy
+  from spacy.matcher import PhraseMatcher
+  from skillNer.skill_extractor_class import SkillExtractor
+  skills_db = {
+    "KS1": {"skill_name": "Python", "skill_type": "Hard Skill", "skill_len": 1,
+            "high_surfce_forms": {"full": "python"}, "low_surface_forms": ["python"],
+            "match_on_tokens": False}}
+  built = SkillExtractor(spacy.blank("en"), skills_db, PhraseMatcher)
+  with patch.object(AIService, "_build_skill_extractor", return_value=built):
+    AIService.save_skill_extractor(str(tmp_path))
+  restored = AIService.restore_skill_extractor(str(tmp_path))
+  text = "I write python every day"
+  assert restored.annotate(text)["results"] == built.annotate(text)["results"]
+  assert restored.matchers["full_uni_matcher"].vocab is restored.nlp.vocab
+
+def test_skillner_databases_load_from_the_artifact_without_chdir(tmp_path, monkeypatch):
+  """Test skillNer reads its databases from the artifact while the working directory is left alone"""
+  import os
+  import sys
+  (tmp_path / "skill_db_relax_20.json").write_text('{"KS1": {}}')
+  (tmp_path / "token_dist.json").write_text('{"python": 1}')
+  monkeypatch.delitem(sys.modules, "skillNer.general_params")
+  cwd = os.getcwd()
+  with patch("os.chdir") as chdir:
+    AIService._import_skillner_params(str(tmp_path))
+  params = sys.modules["skillNer.general_params"]
+  assert params.SKILL_DB == {"KS1": {}} and params.TOKEN_DIST == {"python": 1}
+  assert os.getcwd() == cwd and not chdir.called
+
+async def test_ranking_async_matches_sync(ai_service):
+  """Test the awaitable ranking wrappers return the synchronous results"""
+  ai_service.build_job_index(sample_jobs_json)
+  seeker = sample_candidates_json[0]
+  assert await ai_service.get_top_jobs_for_candidate_async(seeker) == ai_service.get_top_jobs_for_candidate(seeker)
+  assert await ai_service.get_top_candidates_for_job_async(sample_jobs_json[0], sample_candidates_json) \
+    == ai_service.get_top_candidates_for_job(sample_jobs_json[0], sample_candidates_json)
+
+def test_skill_names_are_normalised_once_without_mutation(ai_service):
+  """Test the memoised normaliser, its hit rate and that extract_skills leaves documents intact"""
+  from services.aiService import normalize_skill_name
+  assert normalize_skill_name("Front-End (Web) Dev.") == "front_end_web_dev"
+  assert normalize_skill_name("  C/C++ ,  Node.js ") == "c_c++_node_js"
+  job = {"primarySkills": {"technicalSkills": [{"skillName": "Machine Learning"}] * 2}}
+  before = ai_service.cache_stats()['skillNames']
+  assert ai_service.extract_skills(job)[0] == ["machine_learning", "machine_learning"]
+  after = ai_service.cache_stats()['skillNames']
+  assert after['hits'] + after['misses'] == before['hits'] + before['misses'] + 2
+  assert after['hits'] >= before['hits'] + 1
+  assert job["primarySkills"]["technicalSkills"][0]["skillName"] == "Machine Learning"
@@ -1,8 +1,9 @@
 import json
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, patch
 from bson import ObjectId
 from services.applicationService import ApplicationService
+from enums import WriteModeEnum
 from schemas import ApplicationSchema
 
 # Load test data
@@ -17,8 +18,8 @@ pytestmark = pytest.mark.asyncio
 @pytest.fixture
 def mock_db():
     """Mock database connection to capture operations"""
-    with patch('services.applicationService.getNoSqlConn') as mock:
-        db = Mock()
+    with patch('services.applicationService.getAsyncNoSqlConn') as mock:
+        db = AsyncMock()
         mock.return_value = db
         yield db
 
@@ -116,4 +117,72 @@ class TestApplicationService:
         # Verify operation matches expected
         assert actual_operation == expected_operation
         assert collection_name == "jobs"
-        assert filters == {"_id": ObjectId(transition_app.jobId)}
\ No newline at end of file
+        assert filters == {"_id": ObjectId(transition_app.jobId)}
+
+    @pytest.mark.asyncio
+    async def test_job_operation_only_asks_for_the_match_count(self, sample_application, mock_db):
+        """Test the status update does not fetch the updated job back"""
+        mock_db.documentOperation.return_value = 1
+
+        updated = await ApplicationService.jobOperation(sample_application)
+
+        assert updated is True
+        assert mock_db.documentOperation.call_args.args[3] == WriteModeEnum.ACKNOWLEDGED
+
+        mock_db.documentOperation.return_value = 0
+        assert await ApplicationService.jobOperation(sample_application) is False
+
+    @pytest.mark.asyncio
+    async def test_batch_operation_writes_once_per_collection(self, sample_application, mock_db):
+        """Test a batch is checked and written with one call per collection and keeps item order"""
+        missing = ApplicationSchema(userId=sample_application.userId, jobId=str(ObjectId()),
+                                    newStatus="reject", oldStatus="apply")
+        invalid = ApplicationSchema(userId="not-an-id", jobId=sample_application.jobId,
+                                    newStatus="apply")
+        mock_db.findExistingIds.side_effect = [{sample_application.jobId}, {sample_application.userId}]
+        mock_db.bulkUpdateDocuments.return_value = {}
+
+        results = await ApplicationService.batchOperation([sample_application, missing, invalid])
+
+        assert [result.code for result in results] == [200, 404, 422]
+        assert mock_db.bulkUpdateDocuments.await_count == 2
+        jobCall, seekerCall = mock_db.bulkUpdateDocuments.call_args_list
+        assert jobCall.args == ("jobs", [({"_id": ObjectId(sample_application.jobId)}, {
+            "$pull": {"status.rejected": ObjectId(sample_application.userId)},
+            "$addToSet": {"status.applied": ObjectId(sample_application.userId)}
+        })])
+        assert seekerCall.args[0] == "seekers"
+        assert seekerCall.args[1][0][0] == {"userId": ObjectId(sample_application.userId)}
+
+    @pytest.mark.asyncio
+    async def test_batch_operation_skips_seekers_of_failed_jobs(self, sample_application, mock_db):
+        """Test a seeker is not updated when the update of its job failed"""
+        second = ApplicationSchema(userId=sample_application.userId, jobId=str(ObjectId()),
+                                   newStatus="accept", oldStatus="apply")
+        mock_db.findExistingIds.side_effect = [{sample_application.jobId, second.jobId},
+                                               {sample_application.userId}]
+        jobError = {"index": 0, "errmsg": "job update failed"}
+        mock_db.bulkUpdateDocuments.side_effect = [{0: jobError}, {}]
+
+        results = await ApplicationService.batchOperation([sample_application, second])
+
+        assert [result.code for result in results] == [500, 200]
+        assert results[0].message == "job update failed"
+        seekerCall = mock_db.bulkUpdateDocuments.call_args_list[1]
+        assert [operation["$addToSet"] for _, operation in seekerCall.args[1]] == [
+            {"status.accepted": ObjectId(second.jobId)}]
+
+    @pytest.mark.asyncio
+    async def test_application_operation_updates_both_documents_together(self, sample_application, mock_db):
+        """Test the job and seeker updates are sent as one all-or-nothing operation"""
+        mock_db.documentOperations.return_value = [1, 1]
+
+        assert await ApplicationService.applicationOperation(sample_application) is True
+
+        (jobUpdate, seekerUpdate), = mock_db.documentOperations.call_args.args
+        assert jobUpdate[:2] == ("jobs", {"_id": ObjectId(sample_application.jobId)})
+        assert seekerUpdate[:2] == ("seekers", {"userId": ObjectId(sample_application.userId)})
+        assert seekerUpdate[2]["$addToSet"] == {"status.applied": ObjectId(sample_application.jobId)}
+
+        mock_db.documentOperations.return_value = [0, 0]
+        assert await ApplicationService.applicationOperation(sample_application) is False
@@ -0,0 +1,14 @@
+# test_batchRankingSchema.py
+
+from unittest.mock import AsyncMock, patch
+
+
+def test_batch_ranking_refuses_malformed_user_ids(client):
+    """Test a malformed userId is reported with a 422 instead of querying the batch"""
+    with patch('routers.aiRouter.SeekerService.getRankingSeekers', AsyncMock()) as getRankingSeekers:
+        response = client.post("/api/ai/jobs/batch",
+                               json={"userIds": ["6733aec175eb0fba49f14363", "not-an-id"]})
+
+    assert response.status_code == 422
+    assert "not-an-id" in response.text
+    getRankingSeekers.assert_not_awaited()
@@ -0,0 +1,50 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+from models import JobUpdate
+from services.jobService import JobService
+
+pytestmark = pytest.mark.asyncio
+
+JOB_ID = "6735a696d6cff11d57b1d95c"
+SECONDARY = {"technicalSkills": [{"skillName": "SQL"}], "transferableSkills": []}
+
+
+@pytest.fixture
+def mock_db():
+    """Mock database connection to capture operations"""
+    with patch('services.jobService.getAsyncNoSqlConn') as mock:
+        db = AsyncMock()
+        mock.return_value = db
+        yield db
+
+
+async def test_patch_job_writes_skills_and_skills_extracted_together(mock_db):
+    """Test a skills patch and the text of the merged skills are written with one guarded update"""
+    mock_db.findDocumentByFilters.return_value = {"id": JOB_ID, "secondarySkills": SECONDARY}
+    mock_db.setDocument.side_effect = lambda collection, filters, document, **kwargs: {
+        "id": JOB_ID, "userId": "6733aec175eb0fba49f14363", "secondarySkills": SECONDARY, **document}
+    patchBody = JobUpdate.model_validate(
+        {"userId": "6733aec175eb0fba49f14363", "primarySkills": {"technicalSkills": [{"skillName": "Python"}]}})
+
+    await JobService.patchJob("jobs_archive", {"id": JOB_ID}, patchBody)
+
+    assert mock_db.setDocument.await_count == 1
+    mock_db.documentOperation.assert_not_awaited()
+    collection, filters, document = mock_db.setDocument.call_args.args
+    assert filters == {"id": JOB_ID, "secondarySkills": SECONDARY}
+    assert document["skills_extracted"].split() == ["python"] * 6 + ["sql"] * 2
+
+
+async def test_patch_job_retries_when_the_kept_skills_change(mock_db):
+    """Test the merge is read again when the other skill field changed before the write"""
+    mock_db.findDocumentByFilters.side_effect = [{"id": JOB_ID}, {"id": JOB_ID, "secondarySkills": SECONDARY}]
+    mock_db.setDocument.side_effect = [None, {"id": JOB_ID, "userId": "6733aec175eb0fba49f14363"}]
+    patchBody = JobUpdate.model_validate(
+        {"userId": "6733aec175eb0fba49f14363", "primarySkills": {"technicalSkills": [{"skillName": "Python"}]}})
+
+    await JobService.patchJob("jobs_archive", {"id": JOB_ID}, patchBody)
+
+    first, second = mock_db.setDocument.call_args_list
+    assert first.args[1] == {"id": JOB_ID, "secondarySkills": None}
+    assert second.args[1] == {"id": JOB_ID, "secondarySkills": SECONDARY}
+    assert "sql" in second.args[2]["skills_extracted"]
@@ -0,0 +1,60 @@
+# test_lruCache.py
+
+from utils import LruCache
+
+
+def test_lru_cache_evicts_least_recently_used():
+    """Test the cache keeps the most recently used entries within maxSize"""
+    cache = LruCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.getMany(["a", "b", "c"]) == {"a": 1, "c": 3}
+    assert cache.pop("a") == 1 and cache.get("a") is None
+
+
+def test_lru_cache_stats_count_hits_and_misses():
+    """Test the cache reports its size and hit rate"""
+    cache = LruCache(4)
+    cache.put("a", 1)
+    cache.get("a")
+    cache.get("b")
+    stats = cache.stats()
+    assert stats["size"] == 1 and stats["maxSize"] == 4
+    assert stats["hits"] == 1 and stats["misses"] == 1 and stats["hitRate"] == 0.5
+
+
+def test_lru_cache_expires_entries_after_ttl(monkeypatch):
+    """Test entries older than ttl are dropped and popWhere removes matching keys"""
+    now = [100.0]
+    monkeypatch.setattr("utils.lruCache.monotonic", lambda: now[0])
+    cache = LruCache(4, ttl=10)
+    cache.put(("a", 1), 1)
+    cache.put(("b", 1), 2)
+    now[0] = 105.0
+    assert cache.get(("a", 1)) == 1
+    now[0] = 111.0
+    assert cache.get(("a", 1)) is None
+    assert cache.popWhere(lambda key: key[0] == "b") == 1
+    assert cache.stats()["size"] == 0
+
+
+def test_lru_cache_refuses_values_read_before_a_pop():
+    """Test a put with an older version is dropped when its key was popped meanwhile"""
+    cache = LruCache(2)
+    version = cache.version()
+    cache.pop("a")
+    cache.put("a", "stale", version)
+    cache.put("b", "fresh", version)
+    assert cache.get("a") is None and cache.get("b") == "fresh"
+    cache.put("a", "current", cache.version())
+    assert cache.get("a") == "current"
+    # Once the pop of a key is forgotten every older version is refused
+    version = cache.version()
+    cache.pop("b")
+    cache.pop("c")
+    cache.pop("d")
+    cache.put("a", "stale", version)
+    assert cache.get("a") == "current"
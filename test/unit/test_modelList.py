@@ -0,0 +1,37 @@
+# test_modelList.py
+
+import pytest
+from pydantic import ValidationError
+from models import Job, Seeker
+from utils import validateList
+from utils.modelList import listAdapter
+
+
+def test_validate_list_matches_model_validate():
+    """Test one list validation builds the same models as validating each document"""
+    documents = [{
+        "userId": "6733aec175eb0fba49f14363",
+        "jobTitle": "Engineer",
+        "primarySkills": {"technicalSkills": [{"skillName": "Python", "proficiencyLevel": "Expert"}]},
+        "createdDate": "2024-11-12T00:00:00",
+        "updatedDate": "2026-10-17 10:00:00.123456"
+    }] * 3
+
+    jobs = validateList(Job, iter(documents))
+
+    assert [job.model_dump() for job in jobs] == [Job.model_validate(document).model_dump()
+                                                  for document in documents]
+    assert listAdapter(Job) is listAdapter(Job)
+    assert listAdapter(Seeker) is not listAdapter(Job)
+
+
+def test_validate_list_validates_stored_documents():
+    """Test stored documents are fully validated, a bad nested skill is not trusted"""
+    document = {
+        "userId": "6733aec175eb0fba49f14363",
+        "jobTitle": "Engineer",
+        "primarySkills": {"technicalSkills": [{"skillName": "Python", "proficiencyLevel": "Guru"}]}
+    }
+
+    with pytest.raises(ValidationError):
+        validateList(Job, [document])
@@ -0,0 +1,29 @@
+# test_ndjson.py
+
+import json
+from unittest.mock import AsyncMock, patch
+from models import Job
+
+job = Job.model_validate({
+    "_id": "6735a696d6cff11d57b1d95c",
+    "userId": "6733aec175eb0fba49f14363",
+    "jobTitle": "Engineer",
+    "primarySkills": {"technicalSkills": [{"skillName": "Python", "proficiencyLevel": "Expert"}]},
+    "createdDate": "2024-11-12T00:00:00"
+})
+
+
+async def streamOneJob(collectionName):
+    yield job
+
+
+def test_streamed_job_matches_listed_job(client):
+    """Test a streamed NDJSON line has the same shape as the job in the list response"""
+    with patch('routers.jobRouter.JobService.getJobs', AsyncMock(return_value=[job])), \
+         patch('routers.jobRouter.JobService.streamJobs', streamOneJob):
+        listed = client.get("/api/job/jobs").json()["message"][0]
+        streamed = client.get("/api/job/jobs", params={"stream": True}).text.splitlines()
+
+    assert len(streamed) == 1
+    assert json.loads(streamed[0]) == listed
+    assert listed["_id"] == "6735a696d6cff11d57b1d95c"
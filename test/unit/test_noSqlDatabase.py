@@ -0,0 +1,225 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from bson import ObjectId
+from pymongo import WriteConcern
+from core.database import AsyncNoSqlConnection
+from enums import WriteModeEnum
+
+USER_ID = "6733aec175eb0fba49f14363"
+JOB_ID = "6735a696d6cff11d57b1d95c"
+
+@pytest.fixture
+def asyncConn():
+    """AsyncNoSqlConnection bound to a mocked database instead of a live cluster"""
+    connection = AsyncNoSqlConnection.__new__(AsyncNoSqlConnection)
+    connection.database = MagicMock()
+    return connection
+
+class TestAsyncNoSqlConnection:
+    """Test suite for AsyncNoSqlConnection class."""
+
+    async def test_find_list_documents_awaits_the_cursor(self, asyncConn):
+        """Test queries are converted, awaited and returned like the blocking class does"""
+        collection = asyncConn.database.__getitem__.return_value
+        # The database decodes ObjectIds to strings
+        collection.find.return_value.to_list = AsyncMock(return_value=[{
+            "_id": JOB_ID,
+            "userId": USER_ID
+        }])
+
+        documents = await asyncConn.findListDocumentsByQuery("jobs", {"id": {"$in": [JOB_ID]}})
+
+        assert collection.find.call_args.args == ({"_id": {"$in": [ObjectId(JOB_ID)]}},)
+        assert documents == [{"id": JOB_ID, "userId": USER_ID}]
+
+    async def test_find_ranking_documents_projects_skills_only(self, asyncConn):
+        """Test the ranking loader projects ids and skills and returns compact records"""
+        collection = asyncConn.database.__getitem__.return_value
+        cursor = MagicMock()
+        cursor.__aiter__.return_value = [{
+            "_id": JOB_ID,
+            "userId": USER_ID,
+            "primarySkills": {"technicalSkills": [{"skillName": "python"}]}
+        }]
+        collection.find.return_value = cursor
+
+        records = await asyncConn.findRankingDocuments("jobs", {"userId": {"$in": [USER_ID]}})
+
+        query, projection = collection.find.call_args.args
+        assert query == {"userId": {"$in": [ObjectId(USER_ID)]}}
+        assert projection == AsyncNoSqlConnection.RANKING_PROJECTION
+        assert records == [{
+            "id": JOB_ID,
+            "userId": USER_ID,
+            "primarySkills": {"technicalSkills": [{"skillName": "python"}]}
+        }]
+
+    async def test_insert_document_returns_the_stored_document(self, asyncConn):
+        """Test an insert reads the stored document back with string ids"""
+        collection = asyncConn.database.__getitem__.return_value
+        collection.insert_one = AsyncMock(return_value=MagicMock(inserted_id=ObjectId(JOB_ID)))
+        collection.find_one = AsyncMock(return_value={"_id": JOB_ID, "userId": USER_ID})
+
+        document = await asyncConn.insertDocument("jobs", {"userId": USER_ID})
+
+        assert collection.insert_one.call_args.args == ({"userId": ObjectId(USER_ID)},)
+        assert document == {"id": JOB_ID, "userId": USER_ID}
+
+    async def test_acknowledged_insert_skips_the_read_back(self, asyncConn):
+        """Test an acknowledged insert returns the sent document without a find_one"""
+        async def insertOne(document):
+            document["_id"] = ObjectId(JOB_ID)
+            return MagicMock(inserted_id=document["_id"])
+
+        collection = asyncConn.database.__getitem__.return_value
+        collection.insert_one = AsyncMock(side_effect=insertOne)
+        collection.find_one = AsyncMock()
+
+        document = await asyncConn.insertDocument("jobs", {"userId": USER_ID},
+                                                  WriteModeEnum.ACKNOWLEDGED)
+
+        assert document == {"id": JOB_ID, "userId": USER_ID}
+        collection.find_one.assert_not_awaited()
+
+    async def test_unacknowledged_update_writes_with_w0(self, asyncConn):
+        """Test a fire-and-forget update uses update_one with an unacknowledged write concern"""
+        collection = asyncConn.database.__getitem__.return_value
+        unacknowledged = collection.with_options.return_value
+        unacknowledged.update_one = AsyncMock()
+
+        result = await asyncConn.documentOperation("jobs", {"_id": ObjectId(JOB_ID)},
+                                                   {"$inc": {"views": 1}},
+                                                   WriteModeEnum.UNACKNOWLEDGED)
+
+        assert result is None
+        assert collection.with_options.call_args.kwargs == {"write_concern": WriteConcern(w=0)}
+        unacknowledged.update_one.assert_awaited_once()
+        collection.find_one_and_update.assert_not_called()
+
+    async def test_stream_documents_yields_converted_documents(self, asyncConn):
+        """Test streaming iterates the cursor in batches and closes it"""
+        documents = [{"_id": JOB_ID, "userId": USER_ID}]
+
+        class Cursor:
+            def __init__(self):
+                self.close = AsyncMock()
+
+            async def __aiter__(self):
+                for document in documents:
+                    yield document
+
+        cursor = Cursor()
+        collection = asyncConn.database.__getitem__.return_value
+        collection.find.return_value = cursor
+
+        streamed = [document async for document in asyncConn.streamDocuments("jobs", batchSize=2)]
+
+        assert collection.find.call_args.kwargs == {"batch_size": 2}
+        assert streamed == [{"id": JOB_ID, "userId": USER_ID}]
+        cursor.close.assert_awaited_once()
+
+    async def test_find_page_documents_uses_an_id_range(self, asyncConn):
+        """Test a page is a range query on _id and returns the cursor of the next page"""
+        ids = [str(ObjectId()), str(ObjectId()), str(ObjectId())]
+        collection = asyncConn.database.__getitem__.return_value
+        find = collection.find.return_value.sort.return_value.limit.return_value
+        find.to_list = AsyncMock(return_value=[{"_id": oid} for oid in ids])
+
+        page, nextCursor = await asyncConn.findPageDocuments("jobs", 2)
+
+        assert page == [{"id": ids[0]}, {"id": ids[1]}]
+        assert AsyncNoSqlConnection.decodeCursor(nextCursor) == ObjectId(ids[1])
+        collection.find.return_value.sort.return_value.limit.assert_called_with(3)
+
+        find.to_list = AsyncMock(return_value=[{"_id": ids[2]}])
+        page, nextCursor = await asyncConn.findPageDocuments("jobs", 2, nextCursor)
+
+        assert collection.find.call_args.args == ({"_id": {"$gt": ObjectId(ids[1])}},)
+        assert page == [{"id": ids[2]}] and nextCursor is None
+        with pytest.raises(ValueError):
+            await asyncConn.findPageDocuments("jobs", 2, "not-a-cursor")
+
+    async def test_insert_many_documents_reports_failed_items(self, asyncConn):
+        """Test an unordered bulk insert keeps the inserted documents and the error of the others"""
+        from pymongo.errors import BulkWriteError
+
+        async def insertMany(documents, ordered):
+            documents[0]["_id"] = ObjectId(JOB_ID)
+            raise BulkWriteError({"writeErrors": [{"index": 1, "code": 11000, "errmsg": "duplicate"}]})
+
+        collection = asyncConn.database.__getitem__.return_value
+        collection.insert_many = AsyncMock(side_effect=insertMany)
+
+        inserted, errors = await asyncConn.insertManyDocuments("jobs", [{"userId": USER_ID}, {"userId": USER_ID}])
+
+        assert collection.insert_many.call_args.kwargs == {"ordered": False}
+        assert inserted == [{"id": JOB_ID, "userId": USER_ID}, None]
+        assert errors[1]["code"] == 11000
+
+    async def test_find_existing_ids_uses_one_query(self, asyncConn):
+        """Test existence of several ids is checked with a single $in query"""
+        collection = asyncConn.database.__getitem__.return_value
+        collection.distinct = AsyncMock(return_value=[USER_ID])
+
+        existing = await asyncConn.findExistingIds("users", [USER_ID, USER_ID, "not-an-id"])
+
+        assert existing == {USER_ID}
+        assert collection.distinct.call_args.args == ("_id", {"_id": {"$in": [ObjectId(USER_ID)]}})
+
+    async def test_bulk_update_documents_reports_the_unapplied_tail(self, asyncConn):
+        """Test an ordered bulk update reports the failing update and the ones after it"""
+        from pymongo.errors import BulkWriteError
+
+        collection = asyncConn.database.__getitem__.return_value
+        collection.bulk_write = AsyncMock(side_effect=BulkWriteError(
+            {"writeErrors": [{"index": 1, "code": 2, "errmsg": "bad update"}]}))
+        updates = [({"id": JOB_ID}, {"$addToSet": {"status.applied": ObjectId(USER_ID)}})] * 3
+
+        errors = await asyncConn.bulkUpdateDocuments("jobs", updates)
+
+        operations = collection.bulk_write.call_args.args[0]
+        assert collection.bulk_write.call_args.kwargs == {"ordered": True}
+        assert operations[0]._filter == {"_id": ObjectId(JOB_ID)}
+        assert "updatedDate" in operations[0]._doc["$set"]
+        assert sorted(errors) == [1, 2]
+
+    async def test_document_operations_fall_back_without_transactions(self, asyncConn):
+        """Test updates are sent concurrently once the server refuses transactions"""
+        from pymongo.errors import OperationFailure
+
+        session = MagicMock()
+        session.with_transaction = AsyncMock(side_effect=OperationFailure("no replica set", code=20))
+        asyncConn.NoSqlClient = MagicMock()
+        asyncConn.NoSqlClient.start_session.return_value.__aenter__ = AsyncMock(return_value=session)
+        asyncConn.NoSqlClient.start_session.return_value.__aexit__ = AsyncMock(return_value=False)
+        collection = asyncConn.database.__getitem__.return_value
+        collection.update_one = AsyncMock(return_value=MagicMock(matched_count=1))
+
+        matched = await asyncConn.documentOperations([
+            ("jobs", {"id": JOB_ID}, {"$addToSet": {"status.applied": ObjectId(USER_ID)}}),
+            ("seekers", {"userId": USER_ID}, {"$addToSet": {"status.applied": ObjectId(JOB_ID)}})
+        ])
+
+        assert matched == [1, 1]
+        assert asyncConn.transactions is False
+        assert collection.update_one.await_count == 2
+        assert collection.update_one.call_args_list[0].args[0] == {"_id": ObjectId(JOB_ID)}
+
+    def test_codec_decodes_object_ids_to_strings(self):
+        """Test the read codec gives ids, userIds and status arrays as strings in one decode"""
+        import bson
+        from core.database.asyncNoSqlDatabase import API_CODEC_OPTIONS
+
+        raw = bson.encode({
+            "_id": ObjectId(JOB_ID),
+            "userId": ObjectId(USER_ID),
+            "status": {"applied": [ObjectId(USER_ID)], "rejected": []}
+        })
+
+        document = AsyncNoSqlConnection.renameId(bson.decode(raw, codec_options=API_CODEC_OPTIONS))
+
+        assert document == {
+            "id": JOB_ID,
+            "userId": USER_ID,
+            "status": {"applied": [USER_ID], "rejected": []}
+        }
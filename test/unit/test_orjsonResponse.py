@@ -0,0 +1,25 @@
+# test_orjsonResponse.py
+
+import json
+import numpy as np
+from fastapi.encoders import jsonable_encoder
+from models import Job
+from schemas import ResponseSchema
+from utils import OrjsonResponse
+
+
+def test_orjson_response_matches_jsonable_encoder():
+    """Test models nested anywhere in the content encode like jsonable_encoder does"""
+    job = Job.model_validate({
+        "_id": "6735a696d6cff11d57b1d95c",
+        "userId": "6733aec175eb0fba49f14363",
+        "jobTitle": "Engineer",
+        "primarySkills": {"technicalSkills": [{"skillName": "Python", "proficiencyLevel": "Expert"}]},
+        "createdDate": "2024-11-12T00:00:00"
+    })
+    response = ResponseSchema(message=[job, job], code=200)
+
+    assert json.loads(OrjsonResponse(response).body) == jsonable_encoder(response)
+    page = {"message": [job], "code": 200, "nextCursor": None}
+    assert json.loads(OrjsonResponse(page).body) == jsonable_encoder(page)
+    assert json.loads(OrjsonResponse({"ids": np.array([1, 2])}).body) == {"ids": [1, 2]}
@@ -0,0 +1,32 @@
+# test_rankingExecutor.py
+
+import asyncio
+import threading
+
+import pytest
+
+from utils import RankingExecutor, RankingQueueFullError
+
+
+async def test_ranking_executor_runs_off_the_event_loop():
+    """Test calls run on a worker thread and return their result"""
+    executor = RankingExecutor(maxWorkers=2)
+    loopThread = threading.get_ident()
+    result = await executor.run(lambda x, y=0: (x + y, threading.get_ident()), 1, y=2)
+    assert result[0] == 3 and result[1] != loopThread
+    assert executor.pending == 0
+    executor.shutdown()
+
+
+async def test_ranking_executor_refuses_calls_when_queue_is_full():
+    """Test calls beyond maxQueue pending ones are refused"""
+    executor = RankingExecutor(maxWorkers=1, maxQueue=1)
+    release = threading.Event()
+    blocked = asyncio.ensure_future(executor.run(release.wait))
+    await asyncio.sleep(0.05)
+    with pytest.raises(RankingQueueFullError):
+        await executor.run(lambda: None)
+    release.set()
+    assert await blocked is True
+    await executor.run(lambda: None)
+    executor.shutdown()
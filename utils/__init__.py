@@ -11,10 +11,19 @@ Contact Information: mathteixeira55
 
 from .docDetails import seekerCollectionPath, fieldPath, valuePath, sessionPath,\
  userIdFilterPath, jobCollectionPath, jobFiltersPath, userCollectionPath, userFiltersPath,\
-userIdPath, jobIdPath, jobQueryPath, jobQueryPath, seekerQueryPath
+userIdPath, jobIdPath, jobQueryPath, jobQueryPath, seekerQueryPath, streamQuery,\
+limitQuery, afterQuery
+from .lruCache import LruCache
+from .rankingExecutor import RankingExecutor, RankingQueueFullError
+from .ndjson import NDJSON_MEDIA_TYPE, ndjsonLines
+from .modelList import validateList
+from .orjsonResponse import OrjsonResponse
 
 __all__ = [
     "seekerCollectionPath", "fieldPath", "valuePath", "sessionPath", "userIdFilterPath",
     "jobCollectionPath", "jobFiltersPath", "userCollectionPath", "userFiltersPath",
-    "userIdPath", "jobIdPath", "jobQueryPath", "jobQueryPath", "seekerQueryPath"
+    "userIdPath", "jobIdPath", "jobQueryPath", "jobQueryPath", "seekerQueryPath", "streamQuery",
+    "limitQuery", "afterQuery",
+    "LruCache", "RankingExecutor", "RankingQueueFullError", "NDJSON_MEDIA_TYPE", "ndjsonLines",
+    "validateList", "OrjsonResponse"
 ]
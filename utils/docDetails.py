@@ -21,6 +21,30 @@ from fastapi import Query, Path
 #         "summary": "Small car",
 #         "value": "s"
 #     }})
+streamQuery: bool = Query(
+    False,
+    description="Stream the documents as NDJSON, one JSON document per line",
+    openapi_examples={"stream": {
+        "summary": "Stream the collection",
+        "value": True
+    }})
+
+limitQuery: int | None = Query(
+    None,
+    ge=1,
+    le=1000,
+    description="Page size. Set it, or after, to page through the collection",
+    openapi_examples={"limit": {
+        "summary": "Pages of 50 documents",
+        "value": 50
+    }})
+afterQuery: str | None = Query(
+    None,
+    description="Opaque cursor returned as nextCursor by the previous page",
+    openapi_examples={"after": {
+        "summary": "Cursor of the next page",
+        "value": "ZzWmltbP8RHVfRW8"
+    }})
 
 ### Path Parameters ###
 # Path is used to define path parameters for the API endpoints.
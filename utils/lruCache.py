@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+"""
+File Name: lruCache.py
+Description: This module provides a small thread-safe, bounded LRU cache with
+ an optional time to live and hit and miss counters.
+Author: MathTeixeira
+Date: October 17, 2026
+Version: 3.0.0
+License: MIT License
+Contact Information: mathteixeira55
+"""
+
+### Imports ###
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Hashable, Iterable
+
+
+class LruCache:
+  """
+  A bounded least-recently-used cache.
+
+  Reads refresh the recency of an entry and, once maxSize entries are held,
+  every insert evicts the least recently used one. With a ttl, entries older
+  than ttl seconds are dropped on lookup. All operations are guarded by a lock
+  so the cache can be shared with executor threads.
+
+  A value read from a slower store can be put with the version taken before
+  the read; it is dropped if its key was popped meanwhile, so an invalidation
+  racing with the read is never undone by the stale value.
+
+  Attributes:
+    maxSize (int): The maximum number of entries kept.
+    ttl (float): The lifetime of an entry in seconds, 0 to keep entries until evicted.
+    hits (int): The number of lookups that found an entry.
+    misses (int): The number of lookups that did not.
+  """
+
+  def __init__(self, maxSize: int, ttl: float = 0) -> None:
+    """
+    Initialize the LruCache instance.
+
+    Args:
+      maxSize (int): The maximum number of entries kept.
+      ttl (float): The lifetime of an entry in seconds, 0 to keep entries until evicted.
+    """
+    self.maxSize: int = maxSize
+    self.ttl: float = ttl
+    self.hits: int = 0
+    self.misses: int = 0
+    self._entries: OrderedDict = OrderedDict()
+    self._lock: Lock = Lock()
+    # Version of the last pop of the maxSize most recently popped keys; a put
+    # taken before _floor is refused since its key may have been forgotten
+    self._version: int = 0
+    self._popped: OrderedDict = OrderedDict()
+    self._floor: int = 0
+
+  def get(self, key: Hashable) -> Any:
+    """
+    Get an entry and mark it as recently used.
+
+    Args:
+      key (Hashable): The key of the entry.
+
+    Returns:
+      Any: The cached value, or None if the key is not cached or has expired.
+    """
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry is None or (self.ttl and entry[1] <= monotonic()):
+        if entry is not None:
+          del self._entries[key]
+        self.misses += 1
+        return None
+      self._entries.move_to_end(key)
+      self.hits += 1
+      return entry[0]
+
+  def getMany(self, keys: Iterable[Hashable]) -> dict:
+    """
+    Get every cached entry among several keys.
+
+    Args:
+      keys (Iterable[Hashable]): The keys to look up.
+
+    Returns:
+      dict: The cached values keyed by key. Missing keys are left out.
+    """
+    found = {}
+    for key in keys:
+      value = self.get(key)
+      if value is not None:
+        found[key] = value
+    return found
+
+  def version(self) -> int:
+    """
+    Get the current invalidation version, to put a value read after it.
+
+    Returns:
+      int: A number bumped by every pop and clear.
+    """
+    with self._lock:
+      return self._version
+
+  def put(self, key: Hashable, value: Any, since: int | None = None) -> None:
+    """
+    Insert or replace an entry, evicting the least recently used one if full.
+
+    Args:
+      key (Hashable): The key of the entry.
+      value (Any): The value to cache.
+      since (int | None): The version taken before value was read. The value
+        is dropped if key was popped after it.
+    """
+    if self.maxSize <= 0:
+      return
+    with self._lock:
+      if since is not None and (since < self._floor or self._popped.get(key, -1) > since):
+        return
+      self._entries[key] = (value, monotonic() + self.ttl)
+      self._entries.move_to_end(key)
+      while len(self._entries) > self.maxSize:
+        self._entries.popitem(last=False)
+
+  def pop(self, key: Hashable) -> Any:
+    """
+    Remove an entry.
+
+    Args:
+      key (Hashable): The key of the entry.
+
+    Returns:
+      Any: The removed value, or None if the key was not cached.
+    """
+    with self._lock:
+      entry = self._entries.pop(key, None)
+      self._version += 1
+      self._popped[key] = self._version
+      self._popped.move_to_end(key)
+      while len(self._popped) > max(self.maxSize, 1):
+        _, self._floor = self._popped.popitem(last=False)
+      return None if entry is None else entry[0]
+
+  def popWhere(self, predicate: Callable[[Hashable], bool]) -> int:
+    """
+    Remove every entry whose key matches a predicate. This scans the cache, so
+    it is meant for rare invalidations rather than the request path.
+
+    Args:
+      predicate (Callable[[Hashable], bool]): Returns True for the keys to remove.
+
+    Returns:
+      int: The number of entries removed.
+    """
+    with self._lock:
+      keys = [key for key in self._entries if predicate(key)]
+      for key in keys:
+        del self._entries[key]
+      if keys:
+        self._version += 1
+        self._floor = self._version
+      return len(keys)
+
+  def clear(self) -> None:
+    """
+    Remove every entry. The counters are kept.
+    """
+    with self._lock:
+      self._entries.clear()
+      self._version += 1
+      self._floor = self._version
+
+  def stats(self) -> dict:
+    """
+    Get the size and the hit counters of the cache.
+
+    Returns:
+      dict: The size, maximum size, ttl, hits, misses and hit rate of the cache.
+    """
+    with self._lock:
+      lookups = self.hits + self.misses
+      return {
+          "size": len(self._entries),
+          "maxSize": self.maxSize,
+          "ttl": self.ttl,
+          "hits": self.hits,
+          "misses": self.misses,
+          "hitRate": self.hits / lookups if lookups else 0.0
+      }
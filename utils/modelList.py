@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+File Name: modelList.py
+Description: This module builds lists of models from stored documents with a
+ single validator call per list.
+Author: MathTeixeira
+Date: October 17, 2026
+Version: 3.0.0
+License: MIT License
+Contact Information: mathteixeira55
+"""
+
+### Imports ###
+from functools import lru_cache
+from typing import Iterable, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+
+Model = TypeVar("Model", bound=BaseModel)
+
+
+@lru_cache(maxsize=None)
+def listAdapter(model: type[Model]) -> TypeAdapter:
+  """
+  Get the adapter validating a list of a model, built once per model.
+
+  Args:
+    model (type[Model]): The model of the list items.
+
+  Returns:
+    TypeAdapter: The adapter of list[model].
+  """
+  return TypeAdapter(list[model])
+
+
+def validateList(model: type[Model], documents: Iterable[dict]) -> list[Model]:
+  """
+  Build the models of documents read from the database.
+
+  The whole list is validated by pydantic-core in one call instead of one
+  model_validate call per document. Only that per-document overhead is
+  removed: documents read back from our own collections are validated too.
+  There is no trusted mode, because building the SQLModel models with
+  model_construct in Python is slower than validating them in pydantic-core.
+
+  Args:
+    model (type[Model]): The model of the documents.
+    documents (Iterable[dict]): The documents.
+
+  Returns:
+    list[Model]: The models, in the order of documents.
+  """
+  if not isinstance(documents, list):
+    documents = list(documents)
+  return listAdapter(model).validate_python(documents)
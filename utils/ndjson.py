@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""
+File Name: ndjson.py
+Description: This module encodes streams of models as newline-delimited JSON
+ for streaming responses.
+Author: MathTeixeira
+Date: October 17, 2026
+Version: 3.0.0
+License: MIT License
+Contact Information: mathteixeira55
+"""
+
+### Imports ###
+from typing import AsyncIterator
+
+from pydantic import BaseModel
+
+import logging
+
+logger = logging.getLogger("uvicorn")
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+async def ndjsonLines(items: AsyncIterator[BaseModel]) -> AsyncIterator[bytes]:
+  """
+  Encode each model of a stream as one JSON line.
+
+  The status code is sent before the first line, so an error in the middle of
+  the stream can only end it early; it is logged and the stream is closed.
+
+  Args:
+    items (AsyncIterator[BaseModel]): The models to encode.
+
+  Yields:
+    bytes: One JSON document followed by a newline per model.
+  """
+  try:
+    async for item in items:
+      yield item.model_dump_json(by_alias=True).encode() + b"\n"
+  except Exception as e:
+    logger.error(f"Error streaming documents: {e}")
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+File Name: orjsonResponse.py
+Description: This module provides the JSON response class of the API, encoded
+ with orjson.
+Author: MathTeixeira
+Date: October 17, 2026
+Version: 3.0.0
+License: MIT License
+Contact Information: mathteixeira55
+"""
+
+### Imports ###
+from typing import Any
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def encodeDefault(value: Any) -> Any:
+  """
+  Encode the values orjson does not know natively.
+
+  Pydantic models are dumped by pydantic-core in JSON mode with their aliases,
+  which gives the same output as jsonable_encoder much faster.
+
+  Args:
+    value (Any): The value to encode.
+
+  Returns:
+    Any: A value orjson can serialize.
+  """
+  if isinstance(value, BaseModel):
+    return value.model_dump(mode="json", by_alias=True)
+  return jsonable_encoder(value)
+
+
+class OrjsonResponse(JSONResponse):
+  """
+  JSON response rendered with orjson.
+
+  The content can hold pydantic models at any depth, such as a ResponseSchema
+  or a dict with a list of jobs, so routes do not need jsonable_encoder first.
+  """
+
+  def render(self, content: Any) -> bytes:
+    return orjson.dumps(content, default=encodeDefault, option=ORJSON_OPTIONS)
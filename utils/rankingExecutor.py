@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+File Name: rankingExecutor.py
+Description: This module provides the executor that runs CPU-bound ranking off
+ the asyncio event loop, with a bounded number of pending calls.
+Author: MathTeixeira
+Date: October 17, 2026
+Version: 3.0.0
+License: MIT License
+Contact Information: mathteixeira55
+"""
+
+### Imports ###
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from threading import Lock
+from typing import Any, Callable
+
+
+class RankingQueueFullError(RuntimeError):
+  """
+  Raised when a call is submitted while the executor queue is full.
+  """
+
+
+class RankingExecutor:
+  """
+  Runs blocking calls on a thread or process pool and awaits their result.
+
+  At most maxQueue calls are pending (running or waiting for a worker) at a
+  time; further calls are refused with RankingQueueFullError instead of
+  piling up behind a slow ranking. Only calls submitted with isolated=True
+  go to the process pool, the others always run on threads since they read
+  state that lives in this process. For those calls the executor bounds the
+  queue and keeps the event loop free, but their Python work still shares
+  the GIL with the other threads.
+
+  Attributes:
+    kind (str): "thread" or "process".
+    maxWorkers (int): The number of workers of each pool.
+    maxQueue (int): The maximum number of pending calls.
+    pending (int): The number of pending calls.
+  """
+
+  def __init__(self, kind: str = "thread", maxWorkers: int | None = None,
+               maxQueue: int = 64) -> None:
+    """
+    Initialize the RankingExecutor instance. The pools start on first use.
+
+    Args:
+      kind (str): "thread" or "process".
+      maxWorkers (int | None): The number of workers of each pool, None for the CPU count.
+      maxQueue (int): The maximum number of pending calls.
+
+    Raises:
+      ValueError: If kind is not "thread" or "process".
+    """
+    if kind not in ("thread", "process"):
+      raise ValueError(f"Unknown executor kind: {kind}")
+    self.kind: str = kind
+    self.maxWorkers: int | None = maxWorkers
+    self.maxQueue: int = maxQueue
+    self.pending: int = 0
+    self._threads: ThreadPoolExecutor | None = None
+    self._processes: ProcessPoolExecutor | None = None
+    self._lock: Lock = Lock()
+
+  async def run(self, fn: Callable, *args: Any, isolated: bool = False,
+                **kwargs: Any) -> Any:
+    """
+    Run a call on the pool and wait for its result without blocking the loop.
+
+    Args:
+      fn (Callable): The function to call. Picklable when isolated.
+      *args (Any): The positional arguments of the call.
+      isolated (bool): The call only uses its arguments and may run in another process.
+      **kwargs (Any): The keyword arguments of the call.
+
+    Returns:
+      Any: The result of the call.
+
+    Raises:
+      RankingQueueFullError: If maxQueue calls are already pending.
+    """
+    with self._lock:
+      if self.pending >= self.maxQueue:
+        raise RankingQueueFullError(
+            f"Ranking queue is full ({self.maxQueue} pending calls)")
+      self.pending += 1
+    try:
+      loop = asyncio.get_running_loop()
+      return await loop.run_in_executor(self._pool(isolated),
+                                        partial(fn, *args, **kwargs))
+    finally:
+      with self._lock:
+        self.pending -= 1
+
+  def shutdown(self) -> None:
+    """
+    Stop the pools, waiting for the running calls.
+    """
+    with self._lock:
+      pools, self._threads, self._processes = (self._threads,
+                                               self._processes), None, None
+    for pool in pools:
+      if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+  def _pool(self, isolated: bool) -> Executor:
+    with self._lock:
+      if isolated and self.kind == "process":
+        if self._processes is None:
+          self._processes = ProcessPoolExecutor(self.maxWorkers)
+        return self._processes
+      if self._threads is None:
+        self._threads = ThreadPoolExecutor(self.maxWorkers,
+                                           thread_name_prefix="ranking")
+      return self._threads